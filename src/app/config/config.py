@@ -8,7 +8,22 @@ DB_PORT = os.environ.get('DB_PORT')
 DB_USER = os.environ.get('DB_USER')
 DB_PASSWORD = os.environ.get('DB_PASSWORD')
 DB_DATABASE = os.environ.get('DB_DATABASE')
-DB_TYPE = os.environ.get('DB_TYPE')
+DB_TYPE = os.environ.get('DB_TYPE', 'mysql')
+DB_SQLITE_PATH = os.environ.get('DB_SQLITE_PATH', ':memory:')
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', 30))
+DB_PING_INTERVAL = float(os.environ.get('DB_PING_INTERVAL', 30))
+DB_RETRY_ATTEMPTS = int(os.environ.get('DB_RETRY_ATTEMPTS', 3))
+DB_RETRY_BACKOFF = float(os.environ.get('DB_RETRY_BACKOFF', 0.2))
+DB_SLOW_QUERY_MS = float(os.environ.get('DB_SLOW_QUERY_MS', 200))
+DB_N1_THRESHOLD = int(os.environ.get('DB_N1_THRESHOLD', 10))
+DB_PREPARED_CACHE_SIZE = int(os.environ.get('DB_PREPARED_CACHE_SIZE', 64))
+DB_CACHE_SIZE = int(os.environ.get('DB_CACHE_SIZE', 256))
+DB_CACHE_TTL = float(os.environ.get('DB_CACHE_TTL', 300))
+IMPORT_WORKERS = int(os.environ.get('IMPORT_WORKERS', 0))
+IMPORT_LOAD_DATA_MIN_FILAS = int(os.environ.get('IMPORT_LOAD_DATA_MIN_FILAS', 20000))
+IMPORT_EMPLEADOS_ACTUALIZAR = os.environ.get('IMPORT_EMPLEADOS_ACTUALIZAR', '1').strip().lower() not in ('0', 'false', 'no')
+REFERENCE_PRELOAD = os.environ.get('REFERENCE_PRELOAD', '1').strip().lower() not in ('0', 'false', 'no')
 
 
 
@@ -1,8 +1,111 @@
+import csv
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import flet as ft
-import pandas as pd
-from datetime import datetime
+from app.helpers.lazy_import import lazy_import
+from datetime import date, datetime
+from app.config.config import IMPORT_LOAD_DATA_MIN_FILAS, IMPORT_WORKERS
+from app.core.import_job import ImportJob, ImportJobRunner, ImportacionCancelada
+from app.core.import_manifest import ImportManifest
 from app.core.invokers.file_open_invoker import FileOpenInvoker
-from app.core.interfaces.database_mysql import DatabaseMysql
+from app.core.interfaces.database import get_database
+from app.helpers.excel_reader import estimar_filas, leer_archivo_por_bloques
+from app.helpers.horas_asistencia import calcular_asistencias
+from app.views.containers.import_progress import ImportProgress
+
+pd = lazy_import("pandas")
+
+
+def _valores_unicos(serie: "pd.Series") -> tuple:
+    """
+    Un reporte de checador repite pocas fechas, horas e IDs: las conversiones de texto
+    se hacen sobre los valores distintos. Devuelve `(codigos, unicos)`; los nulos
+    tienen código -1, que apunta al `None` agregado al final de `unicos`.
+    """
+    codigos, unicos = pd.factorize(serie)
+    return codigos, pd.Series([*unicos, None], dtype=object)
+
+
+def _expandir(resultado: "pd.Series", codigos, index) -> "pd.Series":
+    """Lleva el resultado calculado sobre los valores únicos a todas las filas."""
+    return pd.Series(resultado.to_numpy()[codigos], index=index)
+
+
+def _parsear_archivo(path: str) -> dict:
+    """
+    Lee y procesa un archivo completo sin tocar la base de datos.
+    Se ejecuta en los procesos del pool cuando se importan varios archivos.
+    """
+    inicio = time.perf_counter()
+    resultado = {"archivo": path, "filas": 0, "validas": None, "rechazadas": None, "segundos": 0.0, "error": None}
+    try:
+        validas, rechazadas = [], []
+        for bloque in leer_archivo_por_bloques(path, encabezado="ID Checador", tipos=AsistenciasImportController.TIPOS_CSV):
+            AsistenciasImportController._validar_columnas(bloque)
+            v, r = AsistenciasImportController._procesar_asistencias(bloque)
+            resultado["filas"] += len(bloque)
+            validas.append(v)
+            rechazadas.append(r.assign(archivo=os.path.basename(path)))
+        if validas:
+            resultado["validas"] = pd.concat(validas, ignore_index=True)
+            resultado["rechazadas"] = pd.concat(rechazadas, ignore_index=True)
+    except Exception as e:
+        resultado["error"] = str(e)
+    resultado["segundos"] = time.perf_counter() - inicio
+    return resultado
+
+
+class _ConsultasImportacion:
+    """
+    Lecturas que comparten los bloques de una importación: los empleados registrados se leen
+    una sola vez y las asistencias existentes solo en la parte del rango de fechas de cada
+    bloque que todavía no se consultó. Lo que la importación inserta se agrega al conjunto,
+    así que las claves repetidas entre bloques se siguen detectando sin volver a leer.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._empleados = None
+        self._existentes = set()
+        self._rango = None
+
+    def empleados(self) -> set:
+        if self._empleados is None:
+            self._empleados = {
+                int(r["numero_nomina"])
+                for r in self.db.get_data_list("SELECT numero_nomina FROM empleados", dictionary=True)
+            }
+        return self._empleados
+
+    def existentes(self, desde: str, hasta: str) -> set:
+        """Claves (numero_nomina, fecha) registradas; consulta solo lo que falta de [desde, hasta]."""
+        if self._rango is None:
+            self._leer("fecha >= %s AND fecha <= %s", (desde, hasta))
+            self._rango = (desde, hasta)
+            return self._existentes
+
+        inicio, fin = self._rango
+        if desde < inicio:
+            self._leer("fecha >= %s AND fecha < %s", (desde, inicio))
+        if hasta > fin:
+            # Incluye el hueco entre el rango consultado y el bloque: el rango sigue siendo continuo
+            self._leer("fecha > %s AND fecha <= %s", (fin, hasta))
+        self._rango = (min(desde, inicio), max(hasta, fin))
+        return self._existentes
+
+    def agregar(self, claves) -> None:
+        self._existentes.update(claves)
+
+    def _leer(self, condicion: str, params: tuple) -> None:
+        self._existentes.update(
+            (int(r["numero_nomina"]), str(r["fecha"])[:10])
+            for r in self.db.get_data_list(
+                f"SELECT numero_nomina, fecha FROM asistencias WHERE {condicion}", params, dictionary=True
+            )
+        )
+
 
 class AsistenciasImportController:
     COLUMN_MAP = {
@@ -11,187 +114,723 @@ class AsistenciasImportController:
         "Entrada": "hora_entrada",
         "Salida": "hora_salida"
     }
+    # En CSV se leen como texto: el mismo parseo por columnas que las celdas de Excel
+    TIPOS_CSV = dict.fromkeys(COLUMN_MAP, "string")
+    COLUMNAS_INSERCION = ["numero_nomina", "fecha", "hora_entrada", "hora_salida", "retardo", "tiempo_trabajo", "estado"]
+
+    # Carga masiva: LOAD DATA en una tabla temporal y un solo INSERT ... SELECT hacia asistencias
+    STAGING = "asistencias_staging"
+    COLUMNAS_STAGING = ["fila", *COLUMNAS_INSERCION, "hash_fila", "id_importacion"]
+    CREAR_STAGING = f"""
+        CREATE TEMPORARY TABLE {STAGING} (
+            fila INT NOT NULL,
+            numero_nomina INT NOT NULL,
+            fecha DATE NOT NULL,
+            hora_entrada TIME,
+            hora_salida TIME,
+            retardo TIME,
+            tiempo_trabajo TIME,
+            estado VARCHAR(20),
+            hash_fila BIGINT,
+            id_importacion INT
+        )
+    """
+    FUSIONAR_STAGING = f"""
+        INSERT IGNORE INTO asistencias (
+            numero_nomina, fecha, hora_entrada, hora_salida, retardo, tiempo_trabajo, estado
+        )
+        SELECT s.numero_nomina, s.fecha, s.hora_entrada, s.hora_salida, s.retardo, s.tiempo_trabajo, s.estado
+        FROM {STAGING} s
+        JOIN empleados e ON e.numero_nomina = s.numero_nomina
+        WHERE COALESCE(s.id_importacion, 0) = %s
+        AND NOT EXISTS (
+            SELECT 1 FROM asistencias a
+            WHERE a.numero_nomina = s.numero_nomina AND a.fecha = s.fecha
+        )
+        ORDER BY s.fila
+    """
+    # Importaciones presentes en la tabla temporal, en el orden de los archivos
+    IMPORTACIONES_STAGING = f"""
+        SELECT COALESCE(id_importacion, 0) AS id_importacion, MIN(fila) AS primera
+        FROM {STAGING}
+        GROUP BY COALESCE(id_importacion, 0)
+        ORDER BY primera
+    """
+    # Huellas para el manifiesto: solo filas de empleados registrados
+    REGISTRAR_HUELLAS_STAGING = f"""
+        INSERT IGNORE INTO importaciones_filas (hash_fila, id_importacion, numero_nomina, fecha)
+        SELECT s.hash_fila, s.id_importacion, s.numero_nomina, s.fecha
+        FROM {STAGING} s
+        JOIN empleados e ON e.numero_nomina = s.numero_nomina
+        WHERE s.id_importacion IS NOT NULL
+    """
 
 
     def __init__(self, page: ft.Page, on_success: callable = None):
         self.page = page
-        self.db = DatabaseMysql()
+        self.db = get_database()
+        self.manifiesto = ImportManifest(self.db)
         self.on_success = on_success
 
         self.file_invoker = FileOpenInvoker(
             page=self.page,
             on_select=self._on_file_selected,
-            dialog_title="Selecciona archivo de asistencias",
-            allowed_extensions=["xlsx", "xls", "xlsb"]
+            dialog_title="Selecciona archivos de asistencias",
+            allowed_extensions=["xlsx", "xls", "xlsb", "csv", "parquet"],
+            allow_multiple=True
         )
+        self.progreso = ImportProgress(self.page, "Importando asistencias")
 
     def get_import_button(self, text="Importar Asistencias", icon_path="assets/buttons/import_asistencias-button.png"):
         return self.file_invoker.get_open_button(text, icon_path)
 
-    def _on_file_selected(self, path: str):
-        if not path:
+    def _on_file_selected(self, paths):
+        """
+        Recibe una ruta o una lista de rutas (selección múltiple o carpeta) y lanza
+        la importación en segundo plano con su panel de progreso.
+        """
+        if isinstance(paths, str):
+            paths = [paths]
+        if not paths:
             print("⚠️ No se seleccionó ningún archivo.")
             return
 
-        df = self._cargar_excel(path)
-        if df is not None:
-            print(f"🧪 Columnas detectadas: {list(df.columns)}")
-
-            faltantes = [col for col in self.COLUMN_MAP if col not in df.columns]
-            if faltantes:
-                print(f"❌ Columnas faltantes: {faltantes}")
-                self.page.snack_bar = ft.SnackBar(
-                    ft.Text(f"⚠️ Columnas faltantes en el archivo: {', '.join(faltantes)}"),
-                    bgcolor=ft.colors.RED
-                )
-                self.page.snack_bar.open = True
-                self.page.update()
-                return
-
-            asistencias = self._procesar_asistencias(df)
-            if asistencias:
-                print(f"\n🔎 Total de asistencias a procesar: {len(asistencias)}")
-                self._insertar_asistencias(asistencias)
-
-                if self.on_success:
-                    self.on_success()  # ✅ Sin argumento para evitar error
-
-                self.page.snack_bar = ft.SnackBar(
-                    ft.Text("✅ Asistencias importadas correctamente."),
-                    bgcolor=ft.colors.GREEN
-                )
-                self.page.snack_bar.open = True
-                self.page.update()
-
-    def _cargar_excel(self, path: str) -> pd.DataFrame | None:
-        motores = ["openpyxl", "xlrd", "pyxlsb"]
-        for motor in motores:
-            try:
-                # Prueba con fila 6 como encabezado
-                df = pd.read_excel(path, engine=motor, header=5)
-                columnas = list(df.columns)
-
-                # Validar si se detectó realmente la columna "ID Checador"
-                if "ID Checador" not in columnas:
-                    print(f"❌ Encabezados inválidos detectados: {columnas}")
+        try:
+            job = ImportJobRunner().ejecutar(
+                "asistencias",
+                lambda job: self.importar(paths, job),
+                on_progress=self.progreso.actualizar,
+                on_done=lambda job, resultado, error: self._al_terminar(paths, job, resultado, error),
+            )
+        except RuntimeError as e:
+            self._mostrar_snackbar(f"⚠️ {e}", ft.colors.ORANGE)
+            return
+        self.progreso.mostrar(job)
+
+    def importar(self, paths: list, job: ImportJob = None) -> dict:
+        """Importa uno o varios archivos (sin interfaz); `job` recibe el avance y permite cancelar."""
+        job = job or ImportJob("asistencias")
+        if len(paths) == 1:
+            return self._importar_archivo(paths[0], job)
+        return self._importar_archivos(paths, job)
+
+    def _al_terminar(self, paths: list, job: ImportJob, resultado: dict, error: Exception) -> None:
+        self.progreso.ocultar()
+
+        if isinstance(error, ImportacionCancelada):
+            self._mostrar_snackbar(
+                f"⚠️ Importación cancelada. Se conservaron {job.confirmadas} asistencias "
+                f"ya confirmadas; el bloque en curso se revirtió.",
+                ft.colors.ORANGE
+            )
+        elif error is not None:
+            self._mostrar_snackbar(f"⚠️ {error}", ft.colors.RED)
+        elif len(paths) == 1 and resultado.get("omitidos"):
+            self._mostrar_snackbar("ℹ️ Este archivo ya se había importado; no hay asistencias nuevas.", ft.colors.BLUE)
+        else:
+            mensaje = f"✅ Asistencias importadas: {resultado['insertadas']}."
+            if len(paths) > 1:
+                mensaje = f"✅ {len(paths)} archivos. Asistencias importadas: {resultado['insertadas']}."
+            if resultado.get("omitidos"):
+                mensaje += f" {resultado['omitidos']} archivos ya importados antes."
+            if resultado.get("ya_importadas"):
+                mensaje += f" {resultado['ya_importadas']} filas ya importadas en otro archivo."
+            if resultado.get("archivos_con_error"):
+                mensaje += f" {resultado['archivos_con_error']} archivos con error."
+            if resultado["duplicadas"]:
+                mensaje += f" {resultado['duplicadas']} ya registradas."
+            if resultado["sin_empleado"]:
+                mensaje += f" {resultado['sin_empleado']} de empleados no registrados."
+            if resultado["rechazadas"]:
+                mensaje += f" {resultado['rechazadas']} filas rechazadas."
+            mensaje += f" ({job.segundos():.1f} s, {job.filas_por_segundo():,.0f} filas/s)"
+            self._mostrar_snackbar(mensaje, ft.colors.GREEN)
+
+        if job.confirmadas and self.on_success:
+            self.on_success()  # ✅ Sin argumento para evitar error
+
+    def _mostrar_snackbar(self, mensaje: str, color) -> None:
+        self.page.snack_bar = ft.SnackBar(ft.Text(mensaje), bgcolor=color)
+        self.page.snack_bar.open = True
+        self.page.update()
+
+    def _importar_archivo(self, path: str, job: ImportJob) -> dict:
+        """
+        Lee el archivo por bloques y procesa e inserta cada uno antes de leer el siguiente,
+        de modo que la memoria no depende del tamaño del reporte. Cada bloque se escribe en
+        su propia transacción: al cancelar se revierte solo el bloque en curso.
+        Cuando el archivo tiene (según su tamaño declarado o las filas ya leídas) al menos
+        `IMPORT_LOAD_DATA_MIN_FILAS` filas, los bloques siguientes se escriben en un CSV
+        temporal que se carga al final con `_cargar_por_staging`, en una sola transacción.
+        Un archivo ya importado por completo se omite sin leerlo, y de cada bloque se
+        descartan las filas que el manifiesto ya conoce.
+        Lanza ValueError si el archivo no es un libro válido o le faltan columnas.
+        """
+        nombre = os.path.basename(path)
+        totales = {"insertadas": 0, "duplicadas": 0, "sin_empleado": 0, "rechazadas": 0, "ya_importadas": 0,
+                   "omitidos": 0, "errores": []}
+        hash_archivo = self.manifiesto.hash_archivo(path)
+        previa = self.manifiesto.buscar_archivo(hash_archivo)
+        if previa:
+            print(f"⏭️ '{nombre}' ya se importó ({previa['archivo']}, {previa['fecha_importacion']}); se omite.")
+            job.avanzar(etapa=f"{nombre} ya importado", forzar=True)
+            totales["omitidos"] = 1
+            return totales
+
+        rechazadas = []
+        estimadas = estimar_filas(path)
+        job.avanzar(etapa=f"Leyendo {nombre}", total_estimado=estimadas, forzar=True)
+
+        id_importacion = self.manifiesto.iniciar(nombre, hash_archivo)
+        consultas = _ConsultasImportacion(self.db)
+        estado = "error"
+        fechas = []
+        carga = None
+        leidas = filas_csv = 0
+        try:
+            for bloque in leer_archivo_por_bloques(path, encabezado="ID Checador", tipos=self.TIPOS_CSV):
+                job.verificar()
+                leidas += len(bloque)
+                self._validar_columnas(bloque)
+                validas, rechazadas_bloque = self._procesar_asistencias(bloque)
+                job.avanzar(leidas=len(bloque), etapa=f"Importando {nombre}")
+                if not rechazadas_bloque.empty:
+                    rechazadas.append(rechazadas_bloque)
+                    totales["rechazadas"] += len(rechazadas_bloque)
+                if not validas.empty:
+                    fechas += [validas["fecha"].min(), validas["fecha"].max()]
+
+                validas, ya_importadas = self._descartar_importadas(validas, id_importacion)
+                totales["ya_importadas"] += ya_importadas
+
+                if carga is None and self._usar_load_data(max(estimadas or 0, leidas)):
+                    carga = self._crear_csv_carga()
+                if carga is not None:
+                    self._escribir_csv_carga(validas, carga, filas_csv)
+                    filas_csv += len(validas)
                     continue
 
-                print(f"📥 Archivo cargado con motor '{motor}'")
-                print(f"🧪 Columnas detectadas: {columnas}")
-                return df
-
-            except Exception as e:
-                print(f"❌ Error con motor {motor}: {e}")
-        return None
-
-    def _procesar_asistencias(self, df: pd.DataFrame) -> list:
-        asistencias = []
+                with self.db.transaction():
+                    resultado = self._insertar_asistencias(validas, job, consultas)
+                job.avanzar(confirmadas=resultado["insertadas"])
+                self._sumar_resultado(totales, resultado)
+
+            if carga is not None:
+                carga.close()
+                with self.db.transaction():
+                    resultado = self._cargar_por_staging(carga.name, filas_csv, job)
+                job.avanzar(confirmadas=resultado["insertadas"])
+                self._sumar_resultado(totales, resultado)
+
+            estado = "parcial" if totales["sin_empleado"] or totales["errores"] else "completa"
+        except ImportacionCancelada:
+            estado = "cancelada"
+            raise
+        finally:
+            if carga is not None:
+                carga.close()
+                os.remove(carga.name)
+            self.manifiesto.terminar(
+                id_importacion, estado, leidas, totales["insertadas"],
+                min(fechas) if fechas else None, max(fechas) if fechas else None
+            )
 
-        for index, row in df.iterrows():
+        if rechazadas:
+            self._reportar_rechazadas(pd.concat(rechazadas))
+        if totales["ya_importadas"]:
+            print(f"⏭️ {totales['ya_importadas']} filas ya importadas en otro archivo")
+        print(f"\n🔎 Importación terminada: {totales['insertadas']} asistencias nuevas")
+        return totales
+
+    def _descartar_importadas(self, validas: "pd.DataFrame", id_importacion: int) -> "tuple[pd.DataFrame, int]":
+        """
+        Agrega a las filas válidas su huella (`hash_fila`) y la importación a la que pertenecen,
+        y quita las que el manifiesto ya registró. Devuelve `(nuevas, descartadas)`.
+        """
+        huellas = self.manifiesto.hash_filas(validas)
+        conocidas = self.manifiesto.filas_conocidas(validas, huellas)
+        validas = validas.assign(hash_fila=huellas, id_importacion=id_importacion)
+        return validas[~conocidas], int(conocidas.sum())
+
+    @staticmethod
+    def _sumar_resultado(totales: dict, resultado: dict) -> None:
+        for clave in ("insertadas", "duplicadas", "sin_empleado"):
+            totales[clave] += resultado[clave]
+        totales["errores"].extend(resultado["errores"])
+
+    def _importar_archivos(self, paths: list, job: ImportJob) -> dict:
+        """
+        Importación de varios archivos (uno por sucursal): cada archivo se lee y procesa en
+        un proceso del pool, los resultados se unen y se deduplican entre archivos, y se
+        escribe una sola vez, en una transacción (cancelar la revierte completa).
+        Un archivo con error no detiene a los demás. Los archivos ya importados se omiten
+        antes de leerlos y las filas que el manifiesto ya conoce se descartan.
+        """
+        inicio = time.perf_counter()
+        huellas, omitidos = {}, []
+        for path in paths:
             try:
-                numero_nomina_str = str(row.get("ID Checador", "")).strip()
-                fecha_str = str(row.get("Fecha", "")).strip()
-                entrada_raw = row.get("Entrada")
-                salida_raw = row.get("Salida")
-
-                if not numero_nomina_str.isdigit():
-                    raise ValueError("ID Checador inválido")
-
-                numero_nomina = int(numero_nomina_str)
-                fecha = pd.to_datetime(fecha_str, dayfirst=True, errors='coerce')
-                if pd.isna(fecha):
-                    raise ValueError("Fecha inválida")
-
-                # Validación robusta de hora
-                def limpiar_hora(hora, campo):
-                    if pd.isna(hora) or str(hora).strip().lower() in ["", "nan", "none"]:
-                        print(f"⚠️ Hora vacía detectada en fila {index + 1} ({campo}). Se asigna '00:00:00'")
-                        return "00:00:00"
-                    return str(hora).strip()
-
-                hora_entrada = limpiar_hora(entrada_raw, "Entrada")
-                hora_salida = limpiar_hora(salida_raw, "Salida")
-
-                estado = "incompleto" if hora_entrada == "00:00:00" or hora_salida == "00:00:00" else "completo"
-
-                asistencia = {
-                    "numero_nomina": numero_nomina,
-                    "fecha": fecha.strftime("%Y-%m-%d"),
-                    "hora_entrada": hora_entrada,
-                    "hora_salida": hora_salida,
-                    "retardo": "00:00:00",
-                    "estado": estado,
-                    "tiempo_trabajo": "00:00:00",
-                    "total_horas_trabajadas": "00:00:00"
-                }
-
-                asistencias.append(asistencia)
+                huella = self.manifiesto.hash_archivo(path)
+            except OSError:
+                huella = None  # el proceso que lo lea reporta el error
+            if huella and self.manifiesto.buscar_archivo(huella):
+                omitidos.append(path)
+            else:
+                huellas[path] = huella
+        if omitidos:
+            print(f"⏭️ {len(omitidos)} archivos ya importados se omiten: {[os.path.basename(p) for p in omitidos]}")
+        paths = list(huellas)
+        if not paths:
+            return {"status": "success", "insertadas": 0, "duplicadas": 0, "sin_empleado": 0, "rechazadas": 0,
+                    "ya_importadas": 0, "omitidos": len(omitidos), "archivos": [], "archivos_con_error": 0,
+                    "errores": []}
+
+        workers = min(len(paths), IMPORT_WORKERS or os.cpu_count() or 1)
+        print(f"📂 Importando {len(paths)} archivos con {workers} procesos...")
+        estimadas = [estimar_filas(p) for p in paths]
+        job.avanzar(etapa=f"Leyendo {len(paths)} archivos", total_estimado=sum(e or 0 for e in estimadas) or None,
+                    forzar=True)
+
+        archivos = [None] * len(paths)
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futuros = {pool.submit(_parsear_archivo, p): i for i, p in enumerate(paths)}
+            for futuro in as_completed(futuros):
+                archivo = archivos[futuros[futuro]] = futuro.result()
+                job.avanzar(leidas=archivo["filas"], etapa=f"Leído {os.path.basename(archivo['archivo'])}")
+                job.verificar()
+        finally:
+            # Al cancelar no se espera a los archivos que faltan
+            pool.shutdown(wait=not job.cancelado, cancel_futures=True)
+
+        print(f"\n{'Archivo':<40} {'Filas':>8} {'Válidas':>8} {'Rechaz.':>8} {'Segundos':>9}")
+        for a in archivos:
+            nombre = os.path.basename(a["archivo"])[:40]
+            if a["error"]:
+                print(f"{nombre:<40} ❌ {a['error']}")
+                continue
+            validas = len(a["validas"]) if a["validas"] is not None else 0
+            rechazadas = len(a["rechazadas"]) if a["rechazadas"] is not None else 0
+            print(f"{nombre:<40} {a['filas']:>8} {validas:>8} {rechazadas:>8} {a['segundos']:>9.2f}")
+
+        correctos = [a for a in archivos if not a["error"] and a["validas"] is not None]
+        ya_importadas = 0
+        for a in correctos:
+            a["id_importacion"] = self.manifiesto.iniciar(os.path.basename(a["archivo"]), huellas[a["archivo"]])
+            fechas = a["validas"]["fecha"]
+            a["fechas"] = (fechas.min(), fechas.max()) if not fechas.empty else (None, None)
+            a["validas"], descartadas = self._descartar_importadas(a["validas"], a["id_importacion"])
+            ya_importadas += descartadas
+
+        validas = pd.concat([a["validas"] for a in correctos], ignore_index=True) if correctos else pd.DataFrame()
+        rechazadas = [a["rechazadas"] for a in correctos if not a["rechazadas"].empty]
+        if rechazadas:
+            self._reportar_rechazadas(pd.concat(rechazadas, ignore_index=True))
+
+        # Las claves repetidas entre archivos se descartan aquí (se conserva la primera)
+        job.avanzar(etapa="Guardando asistencias", forzar=True)
+        estado = "error"
+        resultado = {}
+        try:
+            if self._usar_load_data(len(validas)):
+                resultado = self._cargar_dataframe_por_staging(validas, job)
+            else:
+                with self.db.transaction():
+                    resultado = self._insertar_asistencias(validas, job)
+            estado = "completa"
+        except ImportacionCancelada:
+            estado = "cancelada"
+            raise
+        finally:
+            # Cada archivo queda con su propio estado y conteos: uno limpio se omite la próxima
+            # vez aunque otro del mismo lote tenga empleados no registrados
+            por_importacion = resultado.get("por_importacion", {})
+            for a in correctos:
+                conteos = por_importacion.get(a["id_importacion"], {})
+                estado_archivo = estado
+                if estado == "completa" and (conteos.get("sin_empleado") or conteos.get("errores")):
+                    estado_archivo = "parcial"
+                self.manifiesto.terminar(
+                    a["id_importacion"], estado_archivo, a["filas"], conteos.get("insertadas", 0), *a["fechas"]
+                )
 
-            except Exception as e:
-                print(f"⚠️ Error procesando fila {index + 1}: {e}")
+        job.avanzar(confirmadas=resultado["insertadas"])
+        resultado["rechazadas"] = sum(len(r) for r in rechazadas)
+        resultado["ya_importadas"] = ya_importadas
+        resultado["omitidos"] = len(omitidos)
+        resultado["archivos"] = [
+            {k: a[k] for k in ("archivo", "filas", "segundos", "error")} for a in archivos
+        ]
+        resultado["archivos_con_error"] = len(archivos) - len(correctos)
+        print(f"⏱️ Importación de {len(paths)} archivos en {time.perf_counter() - inicio:.2f} s")
+        return resultado
+
+    @classmethod
+    def _validar_columnas(cls, bloque: "pd.DataFrame") -> None:
+        faltantes = [col for col in cls.COLUMN_MAP if col not in bloque.columns]
+        if faltantes:
+            raise ValueError(f"Columnas faltantes en el archivo: {', '.join(faltantes)}")
+
+    @classmethod
+    def _procesar_asistencias(cls, df: "pd.DataFrame") -> "tuple[pd.DataFrame, pd.DataFrame]":
+        """
+        Convierte el reporte del checador en asistencias operando por columnas.
+        Devuelve `(validas, rechazadas)`:
+        - validas: numero_nomina, fecha ('YYYY-MM-DD'), hora_entrada, hora_salida ('HH:MM:SS'),
+          y retardo, tiempo_trabajo y estado calculados como lo hacen los triggers.
+        - rechazadas: las columnas originales más `fila` y `motivo`.
+        Las horas vacías se registran como '00:00:00' y dejan la asistencia 'incompleto'.
+        """
+        # Filas totalmente vacías (pie del reporte) no son errores
+        df = df.dropna(how="all", subset=list(cls.COLUMN_MAP))
+
+        ids = cls._parsear_ids(df["ID Checador"])
+        id_valido = ids.notna() & (ids >= 0) & (ids % 1 == 0)
+
+        fechas = cls._parsear_fechas(df["Fecha"])
+        entrada, entrada_valida = cls._normalizar_horas(df["Entrada"])
+        salida, salida_valida = cls._normalizar_horas(df["Salida"])
+
+        # El primer motivo que aplique es el que se reporta
+        motivo = pd.Series(pd.NA, index=df.index, dtype="object")
+        for mascara, texto in reversed([
+            (~id_valido, "ID Checador inválido"),
+            (fechas.isna(), "Fecha inválida"),
+            (~entrada_valida, "Hora de entrada inválida"),
+            (~salida_valida, "Hora de salida inválida"),
+        ]):
+            motivo = motivo.mask(mascara, texto)
+        ok = motivo.isna()
+
+        validas = pd.DataFrame({
+            "numero_nomina": ids[ok].astype("int64"),
+            "fecha": fechas[ok].dt.strftime("%Y-%m-%d"),
+            "hora_entrada": entrada[ok],
+            "hora_salida": salida[ok],
+        })
+        validas = validas.join(calcular_asistencias(validas["hora_entrada"], validas["hora_salida"]))
+
+        rechazadas = df[~ok].copy()
+        rechazadas.insert(0, "fila", rechazadas.index + 1)
+        rechazadas["motivo"] = motivo[~ok]
+
+        return validas.reset_index(drop=True), rechazadas.reset_index(drop=True)
+
+    @staticmethod
+    def _parsear_ids(serie: "pd.Series") -> "pd.Series":
+        """ID Checador como número (NaN si no es numérico)."""
+        codigos, unicos = _valores_unicos(serie)
+        ids = pd.to_numeric(unicos.astype("string").str.strip(), errors="coerce").astype("float64")
+        return _expandir(ids, codigos, serie.index)
+
+    @staticmethod
+    def _parsear_fechas(serie: "pd.Series") -> "pd.Series":
+        """
+        Fechas del checador; NaT donde no se pueden interpretar. Acepta celdas de fecha,
+        números de serie de Excel (libros .xlsb) y texto con el día primero.
+        """
+        if pd.api.types.is_datetime64_any_dtype(serie):
+            return serie
+        codigos, unicos = _valores_unicos(serie)
+        fechas = pd.Series(pd.NaT, index=unicos.index, dtype="datetime64[ns]")
+
+        es_fecha = unicos.map(lambda v: isinstance(v, (datetime, date)))
+        fechas[es_fecha] = pd.to_datetime(unicos[es_fecha])
+
+        serial = pd.to_numeric(unicos.where(~es_fecha), errors="coerce")
+        es_serial = serial.between(1, 2958465)  # hasta 31/12/9999
+        fechas[es_serial] = pd.to_datetime(serial[es_serial], unit="D", origin="1899-12-30")
+
+        texto = unicos.where(~es_fecha & ~es_serial).astype("string").str.strip()
+        por_texto = texto.notna() & (texto != "")
+        fechas[por_texto] = pd.to_datetime(texto[por_texto], dayfirst=True, errors="coerce")
+
+        # Un formato distinto al de la primera fila: segunda pasada solo sobre esas filas
+        pendientes = por_texto & fechas.isna()
+        if pendientes.any():
+            fechas[pendientes] = pd.to_datetime(texto[pendientes], dayfirst=True, errors="coerce", format="mixed")
+        return _expandir(fechas, codigos, serie.index)
+
+    @staticmethod
+    def _normalizar_horas(serie: "pd.Series") -> "tuple[pd.Series, pd.Series]":
+        """
+        Normaliza horas a 'HH:MM:SS'. Acepta texto ('8:05', '08:05:30', '1900-01-01 08:05:00'),
+        objetos time y fracciones de día de Excel. Devuelve `(horas, validas)`;
+        las vacías valen '00:00:00' y cuentan como válidas.
+        """
+        codigos, unicos = _valores_unicos(serie)
+        texto = unicos.astype("string").str.strip()
+        vacias = texto.isna() | texto.str.lower().isin(["", "nan", "nat", "none"])
+
+        partes = texto.str.extract(r"(\d{1,2}):(\d{2})(?::(\d{2}))?")
+        h = pd.to_numeric(partes[0], errors="coerce")
+        m = pd.to_numeric(partes[1], errors="coerce")
+        s = pd.to_numeric(partes[2], errors="coerce").fillna(0)
+        segundos = (h * 3600 + m * 60 + s).where((h < 24) & (m < 60) & (s < 60))
+
+        # Celdas numéricas: fracción del día (0.5 → 12:00:00)
+        fraccion = pd.to_numeric(texto, errors="coerce")
+        es_fraccion = segundos.isna() & (fraccion >= 0) & (fraccion < 1)
+        segundos = segundos.mask(es_fraccion, (fraccion * 86400).round())
+
+        segundos = segundos.mask(vacias, 0)
+        validas = segundos.notna()
+
+        total = segundos.fillna(0).astype("int64")
+        horas = (
+            (total // 3600).astype(str).str.zfill(2) + ":"
+            + (total % 3600 // 60).astype(str).str.zfill(2) + ":"
+            + (total % 60).astype(str).str.zfill(2)
+        )
+        return _expandir(horas.astype(object), codigos, serie.index), _expandir(validas, codigos, serie.index)
 
-        return asistencias
+    @staticmethod
+    def _reportar_rechazadas(rechazadas: "pd.DataFrame", limite: int = 10) -> None:
+        if rechazadas.empty:
+            return
+        print(f"⚠️ Filas rechazadas: {len(rechazadas)}")
+        for motivo, total in rechazadas["motivo"].value_counts().items():
+            print(f"   - {motivo}: {total}")
+        for registro in rechazadas.head(limite).to_dict("records"):
+            print(f"   fila {registro['fila']}: {registro['motivo']}")
+
+    def _insertar_asistencias(self, validas: "pd.DataFrame", job: ImportJob = None,
+                              consultas: _ConsultasImportacion = None) -> dict:
+        """
+        Inserta las asistencias nuevas. Empleados válidos y asistencias ya registradas
+        en el rango de fechas se leen con `consultas` (compartido entre los bloques de una
+        importación, para no repetir las lecturas en cada bloque) y se filtran en memoria;
+        `INSERT IGNORE` sobre la clave única (numero_nomina, fecha) cubre lo que se
+        registre mientras tanto. Retardo, tiempo trabajado y estado ya vienen calculados,
+        así que se insertan con los triggers de `asistencias` desactivados. Con `job`, informa
+        cada fila enviada y se detiene al cancelar (la excepción revierte la transacción que
+        envuelve la llamada).
+        Si las filas traen `hash_fila`, sus huellas quedan en el manifiesto en la misma transacción.
+        Devuelve los conteos `insertadas`, `duplicadas`, `sin_empleado` y los `errores`; con
+        `id_importacion` en las filas, `por_importacion` los desglosa por archivo.
+        """
+        resultado = {"status": "success", "insertadas": 0, "duplicadas": 0, "sin_empleado": 0, "errores": [],
+                     "por_importacion": {}}
+        if validas.empty:
+            return resultado
+
+        consultas = consultas or _ConsultasImportacion(self.db)
+        empleados = consultas.empleados()
+        existentes = consultas.existentes(validas["fecha"].min(), validas["fecha"].max())
+
+        con_empleado = validas["numero_nomina"].isin(empleados)
+        resultado["sin_empleado"] = int((~con_empleado).sum())
+        if resultado["sin_empleado"]:
+            desconocidos = sorted(validas.loc[~con_empleado, "numero_nomina"].unique().tolist())
+            print(f"⚠️ Empleados no registrados ({len(desconocidos)}): {desconocidos[:20]}")
+
+        candidatas = validas[con_empleado]
+        claves = pd.MultiIndex.from_frame(candidatas[["numero_nomina", "fecha"]])
+        # Repetidas en la base de datos o dentro del mismo archivo (se conserva la primera)
+        nuevas = candidatas[~claves.isin(existentes) & ~claves.duplicated()]
+        resultado["duplicadas"] = len(candidatas) - len(nuevas)
+
+        if nuevas.empty:
+            resultado["por_importacion"] = self._conteos_por_importacion(validas, con_empleado, nuevas)
+            self._registrar_huellas(candidatas)
+            print(f"⛔ Sin asistencias nuevas: {resultado['duplicadas']} duplicadas, {resultado['sin_empleado']} sin empleado")
+            return resultado
+
+        query = """
+            INSERT IGNORE INTO asistencias (
+                numero_nomina,
+                fecha,
+                hora_entrada,
+                hora_salida,
+                retardo,
+                tiempo_trabajo,
+                estado
+            ) VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """
+        valores = nuevas[self.COLUMNAS_INSERCION].itertuples(index=False, name=None)
+
+        def filas():
+            for n, *resto in valores:
+                if job:
+                    job.verificar()
+                    job.avanzar(escritas=1)
+                yield int(n), *resto
+
+        with self.db.omitir_triggers_asistencias():
+            insercion = self.db.run_many(query, filas())
+        for error in insercion["errores"]:
+            print(f"❌ Error insertando asistencia {error['params']}: {error['error']}")
+
+        resultado["insertadas"] = insercion["afectadas"]
+        resultado["errores"] = insercion["errores"]
+        # Ignoradas por la clave única: registradas por otro proceso después de la lectura
+        resultado["duplicadas"] += len(nuevas) - insercion["afectadas"] - len(insercion["errores"])
+        resultado["status"] = insercion["status"]
+        resultado["por_importacion"] = self._conteos_por_importacion(validas, con_empleado, nuevas, insercion["errores"])
+        fallidas = {(int(e["params"][0]), e["params"][1]) for e in insercion["errores"]}
+        consultas.agregar(
+            clave for clave in zip(nuevas["numero_nomina"].astype(int).tolist(), nuevas["fecha"].tolist())
+            if clave not in fallidas
+        )
+        self._registrar_huellas(candidatas, insercion["errores"])
 
+        print(
+            f"✅ Asistencias registradas: {resultado['insertadas']} de {len(validas)} "
+            f"({resultado['duplicadas']} duplicadas, {resultado['sin_empleado']} sin empleado)"
+        )
+        return resultado
+
+    @staticmethod
+    def _conteos_por_importacion(validas: "pd.DataFrame", con_empleado: "pd.Series", nuevas: "pd.DataFrame",
+                                 errores: list = ()) -> dict:
+        """
+        `{id_importacion: {"insertadas", "sin_empleado", "errores"}}` para las filas que traen
+        `id_importacion`. Las filas ignoradas por la clave única entre la lectura y la inserción
+        (otro proceso) se cuentan como insertadas del archivo que las traía.
+        """
+        if "id_importacion" not in validas:
+            return {}
+        conteos = {int(i): {"insertadas": 0, "sin_empleado": 0, "errores": 0} for i in validas["id_importacion"].unique()}
+        fallidas = pd.Series(False, index=nuevas.index)
+        if errores:
+            claves = pd.MultiIndex.from_frame(nuevas[["numero_nomina", "fecha"]])
+            fallidas[:] = claves.isin({(int(e["params"][0]), e["params"][1]) for e in errores})
+        for clave, filas in (
+            ("sin_empleado", validas.loc[~con_empleado, "id_importacion"]),
+            ("errores", nuevas.loc[fallidas, "id_importacion"]),
+            ("insertadas", nuevas.loc[~fallidas, "id_importacion"]),
+        ):
+            for i, total in filas.value_counts().items():
+                conteos[int(i)][clave] = int(total)
+        return conteos
+
+    def _registrar_huellas(self, candidatas: "pd.DataFrame", errores: list = ()) -> None:
+        """Huellas de las filas que ya están en `asistencias` (insertadas o registradas antes)."""
+        if "hash_fila" not in candidatas:
+            return
+        if errores:
+            fallidas = {(int(e["params"][0]), e["params"][1]) for e in errores}
+            claves = pd.MultiIndex.from_frame(candidatas[["numero_nomina", "fecha"]])
+            candidatas = candidatas[~claves.isin(fallidas)]
+        self.manifiesto.registrar_filas(candidatas)
+
+    @staticmethod
+    def _usar_load_data(filas: int | None) -> bool:
+        """La carga por tabla temporal conviene a partir de `IMPORT_LOAD_DATA_MIN_FILAS` (0 la desactiva)."""
+        return bool(IMPORT_LOAD_DATA_MIN_FILAS) and filas is not None and filas >= IMPORT_LOAD_DATA_MIN_FILAS
+
+    @staticmethod
+    def _crear_csv_carga():
+        return tempfile.NamedTemporaryFile(
+            "w", suffix=".csv", prefix="asistencias_", newline="", encoding="utf-8", delete=False
+        )
 
-    def _insertar_asistencias(self, asistencias: list):
-        for asistencia in asistencias:
+    @classmethod
+    def _escribir_csv_carga(cls, validas: "pd.DataFrame", archivo, inicio: int) -> None:
+        """
+        Agrega filas válidas al CSV en el formato que espera `load_data`: sin encabezado,
+        separado por comas y NULL como \\N. `fila` conserva el orden del archivo para que,
+        entre claves repetidas, se inserte la primera.
+        """
+        datos = validas.reindex(columns=cls.COLUMNAS_STAGING[1:])
+        datos.insert(0, "fila", range(inicio, inicio + len(datos)))
+        datos.to_csv(archivo, header=False, index=False, na_rep="\\N", lineterminator="\n")
+
+    def _cargar_dataframe_por_staging(self, validas: "pd.DataFrame", job: ImportJob = None) -> dict:
+        carga = self._crear_csv_carga()
+        try:
+            with carga:
+                self._escribir_csv_carga(validas, carga, 0)
+            with self.db.transaction():
+                return self._cargar_por_staging(carga.name, len(validas), job)
+        finally:
+            os.remove(carga.name)
+
+    def _cargar_por_staging(self, archivo: str, filas: int, job: ImportJob = None) -> dict:
+        """
+        Carga masiva: el CSV de `_escribir_csv_carga` entra con LOAD DATA LOCAL INFILE a una
+        tabla temporal y de ahí a `asistencias` con un solo INSERT ... SELECT que descarta
+        empleados no registrados y claves (numero_nomina, fecha) existentes, con los triggers
+        desactivados; otro INSERT ... SELECT guarda las huellas para el manifiesto. Si el servidor no permite LOAD DATA LOCAL, la tabla temporal se llena
+        por lotes. Debe llamarse dentro de `db.transaction()` (la tabla temporal vive en su
+        conexión). Devuelve los mismos conteos que `_insertar_asistencias`.
+        """
+        resultado = {"status": "success", "insertadas": 0, "duplicadas": 0, "sin_empleado": 0, "errores": [],
+                     "por_importacion": {}}
+        if not filas:
+            return resultado
+
+        inicio = time.perf_counter()
+        if job:
+            job.avanzar(etapa="Cargando asistencias (LOAD DATA)", forzar=True)
+        self.db.run_query(f"DROP TEMPORARY TABLE IF EXISTS {self.STAGING}")
+        self.db.run_query(self.CREAR_STAGING)
+        try:
             try:
-                if not self._existe_empleado(asistencia["numero_nomina"]):
-                    print(f"⚠️ Empleado {asistencia['numero_nomina']} no existe. Saltando...")
-                    continue
-
-                if self._asistencia_existente(asistencia["numero_nomina"], asistencia["fecha"]):
-                    print(f"⛔ Ya existe asistencia para {asistencia['numero_nomina']} el {asistencia['fecha']}. Saltando...")
-                    continue
-
-                query = """
-                    INSERT INTO asistencias (
-                        numero_nomina,
-                        fecha,
-                        hora_entrada,
-                        hora_salida
-                    ) VALUES (%s, %s, %s, %s)
-                """
-                valores = (
-                    asistencia["numero_nomina"],
-                    asistencia["fecha"],
-                    asistencia["hora_entrada"],
-                    asistencia["hora_salida"]
-                )
-
-                self.db.run_query(query, valores)
-                print(f"✅ Asistencia registrada: {valores}")
+                cargadas = self.db.load_data(archivo, self.STAGING, self.COLUMNAS_STAGING)
             except Exception as e:
-                print(f"❌ Error insertando asistencia para {asistencia.get('numero_nomina')} el {asistencia.get('fecha')}: {e}")
-
-
-    def _existe_empleado(self, numero_nomina: int) -> bool:
-        try:
-            result = self.db.get_data(
-                "SELECT COUNT(*) AS c FROM empleados WHERE numero_nomina = %s",
-                (numero_nomina,),
+                print(f"⚠️ LOAD DATA no disponible ({e}). La tabla temporal se llenará por lotes.")
+                cargadas = self._llenar_staging(archivo, job)
+            if job:
+                job.verificar()
+                job.avanzar(escritas=cargadas, etapa="Guardando asistencias", forzar=True)
+
+            desconocidos = self.db.get_data_list(
+                f"""
+                SELECT COALESCE(s.id_importacion, 0) AS id_importacion, s.numero_nomina, COUNT(*) AS filas
+                FROM {self.STAGING} s
+                LEFT JOIN empleados e ON e.numero_nomina = s.numero_nomina
+                WHERE e.numero_nomina IS NULL
+                GROUP BY COALESCE(s.id_importacion, 0), s.numero_nomina
+                """,
                 dictionary=True
             )
-            return result.get("c", 0) > 0
-        except Exception as e:
-            print(f"❌ Error al verificar existencia de empleado {numero_nomina}: {e}")
-            return False
-
-    def _asistencia_existente(self, numero_nomina: int, fecha: str) -> bool:
-        try:
-            query = """
-                SELECT COUNT(*) AS c FROM asistencias
-                WHERE numero_nomina = %s AND fecha = %s
-            """
-            result = self.db.get_data(query, (numero_nomina, fecha), dictionary=True)
-            existe = result.get("c", 0) > 0
-
-            if existe:
-                print(f"⛔ Duplicado detectado: asistencia ya existe para empleado {numero_nomina} en fecha {fecha}")
-
-            return existe
-
-        except Exception as e:
-            print(f"❌ Error al verificar existencia de asistencia: {e}")
-            return True  # Asumir duplicado si ocurre error
-
+            resultado["sin_empleado"] = sum(int(d["filas"]) for d in desconocidos)
+            if desconocidos:
+                numeros = sorted({int(d["numero_nomina"]) for d in desconocidos})
+                print(f"⚠️ Empleados no registrados ({len(numeros)}): {numeros[:20]}")
+
+            # Una fusión por importación, en el orden de los archivos: las claves repetidas
+            # entre archivos quedan con la primera y cada archivo obtiene su propio conteo
+            importaciones = [
+                int(r["id_importacion"])
+                for r in self.db.get_data_list(self.IMPORTACIONES_STAGING, dictionary=True)
+            ]
+            por_importacion = {i: {"insertadas": 0, "sin_empleado": 0, "errores": 0} for i in importaciones}
+            for d in desconocidos:
+                por_importacion[int(d["id_importacion"])]["sin_empleado"] += int(d["filas"])
+            with self.db.omitir_triggers_asistencias():
+                for id_importacion in importaciones:
+                    insertadas = max(self.db.run_query(self.FUSIONAR_STAGING, (id_importacion,))["rowcount"], 0)
+                    por_importacion[id_importacion]["insertadas"] = insertadas
+                    resultado["insertadas"] += insertadas
+            resultado["por_importacion"] = {i: c for i, c in por_importacion.items() if i}
+            self.db.run_query(self.REGISTRAR_HUELLAS_STAGING)
+        finally:
+            self.db.run_query(f"DROP TEMPORARY TABLE IF EXISTS {self.STAGING}")
+
+        resultado["duplicadas"] = cargadas - resultado["sin_empleado"] - resultado["insertadas"]
+        print(
+            f"✅ Asistencias registradas: {resultado['insertadas']} de {cargadas} con carga masiva "
+            f"en {time.perf_counter() - inicio:.2f} s "
+            f"({resultado['duplicadas']} duplicadas, {resultado['sin_empleado']} sin empleado)"
+        )
+        return resultado
+
+    def _llenar_staging(self, archivo: str, job: ImportJob = None) -> int:
+        """Alternativa a LOAD DATA: inserta el CSV en la tabla temporal con inserciones multi-fila."""
+        columnas = ", ".join(self.COLUMNAS_STAGING)
+        marcadores = ", ".join(["%s"] * len(self.COLUMNAS_STAGING))
+        query = f"INSERT INTO {self.STAGING} ({columnas}) VALUES ({marcadores})"
+
+        def filas(lector):
+            for fila in lector:
+                if job:
+                    job.verificar()
+                yield [None if v == "\\N" else v for v in fila]
+
+        with open(archivo, newline="", encoding="utf-8") as f:
+            insercion = self.db.run_many(query, filas(csv.reader(f)), chunk_size=2000)
+        if insercion["errores"]:
+            raise ValueError(f"{len(insercion['errores'])} filas no se pudieron cargar en la tabla temporal")
+        return insercion["afectadas"]
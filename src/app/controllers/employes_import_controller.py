@@ -1,21 +1,47 @@
+from decimal import Decimal
 import flet as ft
-import pandas as pd
+from app.helpers.lazy_import import lazy_import
+from app.config.config import IMPORT_EMPLEADOS_ACTUALIZAR
+from app.core.import_job import ImportJob, ImportJobRunner, ImportacionCancelada
 from app.core.invokers.file_open_invoker import FileOpenInvoker
-from app.core.interfaces.database_mysql import DatabaseMysql
+from app.core.interfaces.database import get_database
+from app.helpers.excel_reader import leer_archivo
+from app.views.containers.import_progress import ImportProgress
+
+pd = lazy_import("pandas")
 
 
 class EmpleadosImportController:
+    COLUMNAS = ["numero_nomina", "nombre_completo", "estado", "tipo_trabajador", "sueldo_por_hora"]
+    TAMANO_BLOQUE = 1000
+
+    # Una sola sentencia por bloque: inserta los nuevos y actualiza los existentes
+    UPSERT = """
+        INSERT INTO empleados (numero_nomina, nombre_completo, estado, tipo_trabajador, sueldo_por_hora)
+        VALUES (%s, %s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            nombre_completo = VALUES(nombre_completo),
+            estado = VALUES(estado),
+            tipo_trabajador = VALUES(tipo_trabajador),
+            sueldo_por_hora = VALUES(sueldo_por_hora)
+    """
+    INSERTAR = """
+        INSERT INTO empleados (numero_nomina, nombre_completo, estado, tipo_trabajador, sueldo_por_hora)
+        VALUES (%s, %s, %s, %s, %s)
+    """
+
     def __init__(self, page: ft.Page, on_success: callable = None):
         self.page = page
-        self.db = DatabaseMysql()
+        self.db = get_database()
         self.on_success = on_success
 
         self.file_invoker = FileOpenInvoker(
             page=self.page,
             on_select=self._on_file_selected,
             dialog_title="Selecciona archivo de empleados",
-            allowed_extensions=["xlsx", "xls", "xlsb"]
+            allowed_extensions=["xlsx", "xls", "xlsb", "csv", "parquet"]
         )
+        self.progreso = ImportProgress(self.page, "Importando empleados")
 
     def get_import_button(self, text="Importar Empleados", icon_path="assets/buttons/import_empleados-button.png"):
         return self.file_invoker.get_open_button(text, icon_path)
@@ -25,36 +51,83 @@ class EmpleadosImportController:
             print("⚠️ No se seleccionó ningún archivo.")
             return
 
-        df = self._cargar_excel(path)
-        if df is not None:
-            print(f"🧪 Columnas detectadas: {list(df.columns)}")
-            empleados = self._procesar_empleados(df)
-            if empleados:
-                print(f"\n🔎 Total de empleados a procesar: {len(empleados)}")
-                self._insertar_empleados(empleados)
-
-                if self.on_success:
-                    self.on_success(path)
-
-                self.page.snack_bar = ft.SnackBar(
-                    ft.Text("✅ Empleados importados correctamente."),
-                    bgcolor=ft.colors.GREEN
-                )
-                self.page.snack_bar.open = True
-                self.page.update()
-
-    def _cargar_excel(self, path: str) -> pd.DataFrame | None:
-        motores = ["openpyxl", "xlrd", "pyxlsb"]
-        for motor in motores:
-            try:
-                df = pd.read_excel(path, engine=motor, header=0)
-                print(f"📥 Archivo cargado con motor '{motor}'")
-                return df
-            except Exception as e:
-                print(f"❌ Error con motor {motor}: {e}")
-        return None
+        try:
+            job = ImportJobRunner().ejecutar(
+                "empleados",
+                lambda job: self.importar(path, job),
+                on_progress=self.progreso.actualizar,
+                on_done=lambda job, resultado, error: self._al_terminar(path, job, resultado, error),
+            )
+        except RuntimeError as e:
+            self._mostrar_snackbar(f"⚠️ {e}", ft.colors.ORANGE)
+            return
+        self.progreso.mostrar(job)
+
+    def importar(self, path: str, job: ImportJob = None, actualizar: bool = None) -> dict | None:
+        """
+        Lee, procesa y sincroniza el archivo (sin interfaz). None si no hay empleados que importar.
+        Con `actualizar` (por defecto `IMPORT_EMPLEADOS_ACTUALIZAR`) los empleados existentes se
+        actualizan; si no, solo se agregan los nuevos.
+        """
+        if actualizar is None:
+            actualizar = IMPORT_EMPLEADOS_ACTUALIZAR
+        job = job or ImportJob("empleados")
+        job.avanzar(etapa="Leyendo archivo", forzar=True)
+        df = self._cargar_archivo(path)
+        if df is None:
+            return None
+
+        print(f"🧪 Columnas detectadas: {list(df.columns)}")
+        empleados = self._procesar_empleados(df)
+        job.avanzar(leidas=len(df), total_estimado=len(empleados) or None, etapa="Guardando empleados")
+        if not empleados:
+            return None
+
+        print(f"\n🔎 Total de empleados a procesar: {len(empleados)}")
+        # Una sola transacción: cancelar revierte la importación completa
+        with self.db.transaction():
+            resultado = self._sincronizar_empleados(empleados, job, actualizar)
+        job.avanzar(confirmadas=resultado["afectadas"])
+        return resultado
+
+    def _al_terminar(self, path: str, job: ImportJob, resultado: dict | None, error: Exception) -> None:
+        self.progreso.ocultar()
+
+        if isinstance(error, ImportacionCancelada):
+            self._mostrar_snackbar("⚠️ Importación de empleados cancelada; no se guardaron cambios.", ft.colors.ORANGE)
+            return
+        if error is not None:
+            self._mostrar_snackbar(f"⚠️ {error}", ft.colors.RED)
+            return
+        if resultado is None:
+            self._mostrar_snackbar("⚠️ El archivo no contiene empleados válidos.", ft.colors.ORANGE)
+            return
+
+        if self.on_success:
+            self.on_success(path)
+        mensaje = (
+            f"✅ Empleados: {len(resultado['agregados'])} nuevos, {len(resultado['actualizados'])} actualizados, "
+            f"{len(resultado['sin_cambios'])} sin cambios"
+        )
+        if resultado["omitidos"]:
+            mensaje += f", {len(resultado['omitidos'])} existentes sin actualizar"
+        if resultado["errores"]:
+            mensaje += f", {len(resultado['errores'])} con error"
+        self._mostrar_snackbar(f"{mensaje} ({job.segundos():.1f} s).", ft.colors.GREEN)
+
+    def _mostrar_snackbar(self, mensaje: str, color) -> None:
+        self.page.snack_bar = ft.SnackBar(ft.Text(mensaje), bgcolor=color)
+        self.page.snack_bar.open = True
+        self.page.update()
+
+    def _cargar_archivo(self, path: str) -> "pd.DataFrame | None":
+        try:
+            return leer_archivo(path)
+        except Exception as e:
+            print(f"❌ Error al leer el archivo de empleados: {e}")
+            return None
 
-    def _procesar_empleados(self, df: pd.DataFrame) -> list:
+    def _procesar_empleados(self, df: "pd.DataFrame") -> list:
         try:
             columnas = list(df.columns)
 
@@ -62,6 +135,9 @@ class EmpleadosImportController:
             if columnas == ["numero_nomina", "nombre_completo", "estado", "tipo_trabajador", "sueldo_diario"]:
                 print("📊 Detectado archivo con columna 'sueldo_diario'. Se convertirá a 'sueldo_por_hora'.")
                 df = df.rename(columns={"sueldo_diario": "sueldo_por_hora"})
+                # Un CSV trae texto donde el libro de Excel trae números
+                df["numero_nomina"] = pd.to_numeric(df["numero_nomina"], errors="coerce").fillna(0).astype(int)
+                df["sueldo_por_hora"] = pd.to_numeric(df["sueldo_por_hora"], errors="coerce").fillna(0)
                 empleados = df.to_dict(orient="records")
 
             else:
@@ -74,6 +150,7 @@ class EmpleadosImportController:
 
                 df.columns = columnas_esperadas
                 df['No'] = pd.to_numeric(df['No'], errors='coerce').fillna(0).astype(int)
+                df['SD 2024'] = pd.to_numeric(df['SD 2024'], errors='coerce').fillna(0)
                 df['Estado'] = df['Estado'].str.strip().replace({'Activo ': 'Activo', 'Inactivo ': 'Inactivo'})
                 df['nombre_completo'] = df['Nombre(s)'] + ' ' + df['Apellido Paterno'] + ' ' + df['Apellido Materno']
                 df['sueldo_por_hora'] = df.apply(lambda row: 0 if row['Estado'] == 'Inactivo' else row['SD 2024'], axis=1)
@@ -95,7 +172,78 @@ class EmpleadosImportController:
             print(f"❌ Error procesando empleados: {e}")
             return []
 
-    def _insertar_empleados(self, empleados: list):
+    def _sincronizar_empleados(self, empleados: list, job: ImportJob = None, actualizar: bool = True) -> dict:
+        """
+        Valida los empleados y los escribe en bloques de `TAMANO_BLOQUE` con una sola sentencia
+        por bloque (INSERT ... ON DUPLICATE KEY UPDATE, o INSERT simple si no se actualiza).
+        Los valores actuales se leen una vez al inicio para comparar, y solo se escriben los
+        empleados nuevos o con cambios.
+
+        Devuelve las claves de `run_many` (`afectadas`, `errores`) más el reporte de diferencias:
+        - agregados: números de nómina nuevos.
+        - actualizados: `{"numero_nomina", "cambios", "antes", "despues"}`; antes y después
+          incluyen `sueldo_por_hora` y `estado`.
+        - sin_cambios: números de nómina idénticos a lo registrado.
+        - omitidos: existentes con cambios que no se actualizaron (`actualizar=False`).
+        Con `job`, informa el avance y se detiene al cancelar.
+        """
+        nuevos = self._validar_empleados(empleados)
+        reporte = {
+            "status": "success", "procesadas": 0, "afectadas": 0, "errores": [],
+            "agregados": [], "actualizados": [], "sin_cambios": [], "omitidos": [],
+        }
+        if not nuevos:
+            return reporte
+
+        actuales = self._empleados_actuales(min(nuevos), max(nuevos))
+        valores = []
+        for numero, fila in nuevos.items():
+            anterior = actuales.get(numero)
+            if anterior is None:
+                reporte["agregados"].append(numero)
+                valores.append(fila)
+                continue
+
+            cambios = [c for c in self.COLUMNAS[1:] if fila[c] != anterior[c]]
+            if not cambios:
+                reporte["sin_cambios"].append(numero)
+            elif not actualizar:
+                reporte["omitidos"].append(numero)
+            else:
+                reporte["actualizados"].append({
+                    "numero_nomina": numero,
+                    "cambios": cambios,
+                    "antes": {c: anterior[c] for c in ("sueldo_por_hora", "estado")},
+                    "despues": {c: fila[c] for c in ("sueldo_por_hora", "estado")},
+                })
+                valores.append(fila)
+
+        if job and len(valores) < len(nuevos):
+            job.avanzar(escritas=len(nuevos) - len(valores))
+
+        def filas():
+            for fila in valores:
+                if job:
+                    job.verificar()
+                    job.avanzar(escritas=1)
+                yield tuple(fila[c] for c in self.COLUMNAS)
+
+        if valores:
+            resultado = self.db.run_many(self.UPSERT if actualizar else self.INSERTAR, filas(), chunk_size=self.TAMANO_BLOQUE)
+            reporte.update(status=resultado["status"], procesadas=resultado["procesadas"], errores=resultado["errores"])
+
+        # rowcount de MySQL cuenta 2 por fila actualizada: se reporta por empleado
+        fallidos = {error["params"][0] for error in reporte["errores"]}
+        reporte["agregados"] = [n for n in reporte["agregados"] if n not in fallidos]
+        reporte["actualizados"] = [a for a in reporte["actualizados"] if a["numero_nomina"] not in fallidos]
+        reporte["afectadas"] = len(reporte["agregados"]) + len(reporte["actualizados"])
+
+        self._imprimir_reporte(reporte)
+        return reporte
+
+    def _validar_empleados(self, empleados: list) -> dict:
+        """Normaliza los empleados del archivo: `{numero_nomina: fila}`; si un número se repite, vale el último."""
+        validos = {}
         for emp in empleados:
             try:
                 numero = emp.get("numero_nomina")
@@ -104,17 +252,14 @@ class EmpleadosImportController:
                 if not numero or not isinstance(numero, int):
                     print(f"⚠️ Número de nómina inválido (omitido): {numero}")
                     continue
-
-                # Verificar si ya existe
-                if self._existe_empleado(numero):
-                    print(f"⚠️ Empleado con número de nómina {numero} ya existe. No se reemplaza ni duplica.")
-                    continue
+                if numero in validos:
+                    print(f"⚠️ Número de nómina {numero} repetido en el archivo; se usa la última fila.")
 
                 # Validar campos o usar valores por defecto
                 nombre = emp.get("nombre_completo", f"Empleado {numero}").strip()
                 estado = emp.get("estado", "inactivo").strip().lower()
                 tipo = emp.get("tipo_trabajador", "no definido").strip().lower()
-                sueldo = emp.get("sueldo_por_hora", 0.00)
+                sueldo = Decimal(str(emp.get("sueldo_por_hora", 0.00))).quantize(Decimal("0.01"))
 
                 # Normalización de estado y tipo
                 if estado not in ("activo", "inactivo"):
@@ -122,25 +267,59 @@ class EmpleadosImportController:
                 if tipo not in ("taller", "externo", "no definido"):
                     tipo = "no definido"
 
-                # Inserción
-                query = """
-                    INSERT INTO empleados (numero_nomina, nombre_completo, estado, tipo_trabajador, sueldo_por_hora)
-                    VALUES (%s, %s, %s, %s, %s)
-                """
-                valores = (numero, nombre, estado, tipo, sueldo)
-                self.db.run_query(query, valores)
-                print(f"✅ Empleado registrado: {valores}")
+                validos[numero] = {
+                    "numero_nomina": numero,
+                    "nombre_completo": nombre,
+                    "estado": estado,
+                    "tipo_trabajador": tipo,
+                    "sueldo_por_hora": sueldo,
+                }
 
             except Exception as e:
-                print(f"❌ Error insertando empleado {emp.get('numero_nomina')}: {e}")
+                print(f"❌ Error validando empleado {emp.get('numero_nomina')}: {e}")
+        return validos
 
-
-        
-    def _existe_empleado(self, numero_nomina: int) -> bool:
-        query = "SELECT 1 FROM empleados WHERE numero_nomina = %s LIMIT 1"
+    def _empleados_actuales(self, desde: int, hasta: int) -> dict:
+        """
+        Empleados registrados en el rango de números de nómina del archivo, en una sola consulta.
+        Un error de lectura se propaga (`iter_data` no lo silencia como `get_data_list`): sin la
+        foto actual el upsert sobrescribiría empleados reportándolos como nuevos, así que la
+        transacción de la importación se revierte.
+        """
         try:
-            resultado = self.db.get_data(query, (numero_nomina,), dictionary=True)
-            return bool(resultado)
+            filas = list(self.db.iter_data(
+                """
+                SELECT numero_nomina, nombre_completo, estado, tipo_trabajador, sueldo_por_hora
+                FROM empleados
+                WHERE numero_nomina BETWEEN %s AND %s
+                FOR UPDATE
+                """,
+                (desde, hasta),
+                dictionary=True
+            ))
         except Exception as e:
-            print(f"⚠️ Error verificando existencia del empleado {numero_nomina}: {e}")
-            return False
+            raise RuntimeError(f"No se pudieron leer los empleados registrados; no se guardaron cambios: {e}") from e
+        return {
+            int(f["numero_nomina"]): {
+                **f,
+                "sueldo_por_hora": Decimal(str(f["sueldo_por_hora"])).quantize(Decimal("0.01")),
+            }
+            for f in filas
+        }
+
+    @staticmethod
+    def _imprimir_reporte(reporte: dict) -> None:
+        for error in reporte["errores"]:
+            print(f"❌ Error guardando empleado {error['params'][0]}: {error['error']}")
+        for cambio in reporte["actualizados"]:
+            antes, despues = cambio["antes"], cambio["despues"]
+            print(
+                f"   {cambio['numero_nomina']}: sueldo {antes['sueldo_por_hora']} → {despues['sueldo_por_hora']}, "
+                f"estado {antes['estado']} → {despues['estado']} ({', '.join(cambio['cambios'])})"
+            )
+        if reporte["omitidos"]:
+            print(f"⏭️ Existentes con cambios no actualizados: {reporte['omitidos']}")
+        print(
+            f"✅ Empleados: {len(reporte['agregados'])} nuevos, {len(reporte['actualizados'])} actualizados, "
+            f"{len(reporte['sin_cambios'])} sin cambios"
+        )
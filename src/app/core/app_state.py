@@ -1,4 +1,5 @@
 import flet as ft
+from datetime import datetime
 from app.helpers.class_singleton import class_singleton
 
 @class_singleton
@@ -37,6 +38,19 @@ class AppState:
         """
         return self.page
 
+    def set_db_state(self, estado: str, detalle: str = None):
+        """
+        Guarda el estado de la conexión a la base de datos:
+        "conectado", "reconectando" o "desconectado" (con el último error en `detalle`).
+        """
+        self.set("db_state", {"estado": estado, "detalle": detalle, "desde": datetime.now()})
+
+    def get_db_state(self) -> dict:
+        """
+        Obtiene el estado de la conexión a la base de datos.
+        """
+        return self.get("db_state", {"estado": "desconocido", "detalle": None, "desde": None})
+
     def set_theme(self, dark_mode: bool):
         """
         Establece el tema de la aplicación y lo guarda en el almacenamiento del cliente.
@@ -0,0 +1,149 @@
+import threading
+import time
+from app.helpers.class_singleton import class_singleton
+
+
+class ImportacionCancelada(Exception):
+    """Se lanza dentro del trabajo cuando el usuario cancela; revierte el bloque en curso."""
+
+
+class ImportJob:
+    """
+    Estado de una importación que corre fuera del hilo de la interfaz.
+    El trabajo informa su avance con `avanzar(...)`: filas leídas, enviadas a la base de datos
+    (`escritas`) y ya confirmadas con COMMIT (`confirmadas`). Consulta `verificar()` entre filas
+    o bloques; `cancelar()` hace que la siguiente verificación lance `ImportacionCancelada`.
+    `on_progress(snapshot)` se llama como máximo cada `intervalo` segundos.
+    """
+
+    def __init__(self, nombre: str, on_progress: callable = None, intervalo: float = 0.25):
+        self.nombre = nombre
+        self.on_progress = on_progress
+        self.intervalo = intervalo
+        self.etapa = "Iniciando"
+        self.total_estimado = None
+        self.leidas = 0
+        self.escritas = 0
+        self.confirmadas = 0
+        self.inicio = time.monotonic()
+        self.fin = None
+        self._cancelar = threading.Event()
+        self._ultimo_aviso = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def cancelado(self) -> bool:
+        return self._cancelar.is_set()
+
+    def cancelar(self) -> None:
+        self._cancelar.set()
+        self.avanzar(etapa="Cancelando...", forzar=True)
+
+    def verificar(self) -> None:
+        if self._cancelar.is_set():
+            raise ImportacionCancelada(f"Importación de {self.nombre} cancelada")
+
+    def avanzar(self, leidas: int = 0, escritas: int = 0, confirmadas: int = 0, etapa: str = None,
+                total_estimado: int = None, forzar: bool = False) -> None:
+        with self._lock:
+            self.leidas += leidas
+            self.escritas += escritas
+            self.confirmadas += confirmadas
+            if etapa is not None:
+                self.etapa = etapa
+            if total_estimado is not None:
+                self.total_estimado = total_estimado
+
+            ahora = time.monotonic()
+            if not forzar and ahora - self._ultimo_aviso < self.intervalo:
+                return
+            self._ultimo_aviso = ahora
+
+        if self.on_progress:
+            try:
+                self.on_progress(self.snapshot())
+            except Exception as e:
+                print(f"⚠️ Error al mostrar el progreso de {self.nombre}: {e}")
+
+    def segundos(self) -> float:
+        return (self.fin or time.monotonic()) - self.inicio
+
+    def filas_por_segundo(self) -> float:
+        segundos = self.segundos()
+        return (self.leidas + self.escritas) / segundos if segundos > 0 else 0.0
+
+    def fraccion(self) -> float | None:
+        """Avance entre 0 y 1 (lectura y escritura pesan igual); None si no se conoce el total."""
+        if not self.total_estimado:
+            return None
+        return min(1.0, (self.leidas + self.escritas) / (2 * self.total_estimado))
+
+    def eta(self) -> float | None:
+        """Segundos restantes estimados con el ritmo actual."""
+        fraccion = self.fraccion()
+        if not fraccion:
+            return None
+        return self.segundos() * (1 - fraccion) / fraccion
+
+    def snapshot(self) -> dict:
+        return {
+            "nombre": self.nombre,
+            "etapa": self.etapa,
+            "leidas": self.leidas,
+            "escritas": self.escritas,
+            "confirmadas": self.confirmadas,
+            "total_estimado": self.total_estimado,
+            "filas_por_segundo": round(self.filas_por_segundo(), 1),
+            "fraccion": self.fraccion(),
+            "eta": self.eta(),
+            "segundos": round(self.segundos(), 2),
+            "cancelado": self.cancelado,
+        }
+
+
+@class_singleton
+class ImportJobRunner:
+    """
+    Ejecuta importaciones en hilos de fondo para que la interfaz siga respondiendo.
+    `trabajo(job)` hace la importación y devuelve su resultado; al terminar se llama
+    `on_done(job, resultado, error)` (error es la excepción, o None).
+    """
+
+    def __init__(self):
+        self._activos = {}
+        self._lock = threading.Lock()
+
+    def ejecutar(self, nombre: str, trabajo: callable, on_progress: callable = None,
+                 on_done: callable = None) -> ImportJob:
+        with self._lock:
+            if nombre in self._activos:
+                raise RuntimeError(f"Ya hay una importación de {nombre} en curso.")
+            job = ImportJob(nombre, on_progress)
+            self._activos[nombre] = job
+
+        def correr():
+            resultado, error = None, None
+            try:
+                resultado = trabajo(job)
+            except Exception as e:
+                error = e
+                if not isinstance(e, ImportacionCancelada):
+                    print(f"❌ Error en la importación de {nombre}: {e}")
+            finally:
+                job.fin = time.monotonic()
+                with self._lock:
+                    self._activos.pop(nombre, None)
+            job.avanzar(etapa="Cancelada" if job.cancelado else "Terminada", forzar=True)
+            print(
+                f"⏱️ {nombre}: {job.leidas} filas leídas, {job.escritas} escritas "
+                f"en {job.segundos():.2f} s ({job.filas_por_segundo():.0f} filas/s)"
+            )
+            if on_done:
+                on_done(job, resultado, error)
+
+        threading.Thread(target=correr, name=f"importacion-{nombre}", daemon=True).start()
+        return job
+
+    def activos(self) -> list:
+        with self._lock:
+            return list(self._activos)
@@ -0,0 +1,130 @@
+import hashlib
+from app.helpers.lazy_import import lazy_import
+
+pd = lazy_import("pandas")
+
+# Columnas de la asistencia normalizada que definen la huella de una fila
+COLUMNAS_HUELLA = ["numero_nomina", "fecha", "hora_entrada", "hora_salida"]
+
+
+class ImportManifest:
+    """
+    Manifiesto de importaciones de asistencias (tablas `importaciones` e `importaciones_filas`).
+
+    - Cada archivo se identifica por el SHA-256 de su contenido: si ya tiene una importación
+      'completa', se omite sin leerlo.
+    - Cada asistencia procesada guarda una huella de 64 bits: de un archivo que se solapa con
+      otro ya importado solo se procesan las filas con huella nueva.
+
+    Las huellas se calculan por bloques (el archivo se lee en trozos de `TAMANO_LECTURA`
+    bytes y las filas bloque por bloque), así que el costo no depende del tamaño del archivo.
+    Solo se registran filas de empleados existentes: las demás se vuelven a revisar al reimportar.
+    """
+
+    TAMANO_LECTURA = 1 << 20
+
+    def __init__(self, db=None):
+        if db is None:
+            from app.core.interfaces.database import get_database
+            db = get_database()
+        self.db = db
+
+    @classmethod
+    def hash_archivo(cls, path: str) -> str:
+        huella = hashlib.sha256()
+        with open(path, "rb") as f:
+            for parte in iter(lambda: f.read(cls.TAMANO_LECTURA), b""):
+                huella.update(parte)
+        return huella.hexdigest()
+
+    @staticmethod
+    def hash_filas(validas: "pd.DataFrame") -> "pd.Series":
+        """Huella de cada asistencia normalizada, como entero con signo (columna BIGINT)."""
+        # Como texto, para que la huella no dependa del dtype con que se leyó la columna
+        huellas = pd.util.hash_pandas_object(validas[COLUMNAS_HUELLA].astype(str), index=False)
+        return pd.Series(huellas.to_numpy().view("int64"), index=validas.index)
+
+    def buscar_archivo(self, hash_archivo: str) -> dict | None:
+        """Importación completa anterior de un archivo con el mismo contenido, o None."""
+        fila = self.db.get_data(
+            """
+            SELECT id_importacion, archivo, fecha_importacion
+            FROM importaciones
+            WHERE hash_archivo = %s AND estado = 'completa'
+            ORDER BY id_importacion DESC
+            LIMIT 1
+            """,
+            (hash_archivo,),
+            dictionary=True
+        )
+        return fila or None
+
+    def iniciar(self, archivo: str, hash_archivo: str) -> int:
+        resultado = self.db.run_query(
+            "INSERT INTO importaciones (archivo, hash_archivo) VALUES (%s, %s)",
+            (archivo[:255], hash_archivo)
+        )
+        return resultado["lastrowid"]
+
+    def filas_conocidas(self, validas: "pd.DataFrame", huellas: "pd.Series") -> "pd.Series":
+        """Máscara de las filas cuya huella ya está registrada (una consulta por rango de fechas)."""
+        if validas.empty:
+            return pd.Series(False, index=validas.index)
+        conocidas = {
+            int(r["hash_fila"])
+            for r in self.db.get_data_list(
+                "SELECT hash_fila FROM importaciones_filas WHERE fecha BETWEEN %s AND %s",
+                (validas["fecha"].min(), validas["fecha"].max()),
+                dictionary=True
+            )
+        }
+        return huellas.isin(conocidas)
+
+    def registrar_filas(self, filas: "pd.DataFrame") -> None:
+        """Guarda las huellas de `filas` (columnas hash_fila, id_importacion, numero_nomina y fecha)."""
+        if filas.empty:
+            return
+        valores = filas[["hash_fila", "id_importacion", "numero_nomina", "fecha"]].itertuples(index=False, name=None)
+        self.db.run_many(
+            """
+            INSERT IGNORE INTO importaciones_filas (hash_fila, id_importacion, numero_nomina, fecha)
+            VALUES (%s, %s, %s, %s)
+            """,
+            ((int(h), int(i), int(n), f) for h, i, n, f in valores),
+            chunk_size=2000
+        )
+
+    def terminar(self, id_importacion: int, estado: str, filas: int = 0, insertadas: int = 0,
+                 fecha_inicio: str = None, fecha_fin: str = None) -> None:
+        """
+        Cierra la importación. 'completa' hace que el archivo se omita la próxima vez;
+        'parcial' (empleados no registrados o errores), 'cancelada' y 'error' no.
+        """
+        try:
+            self.db.run_query(
+                """
+                UPDATE importaciones
+                SET estado = %s, filas = %s, insertadas = %s, fecha_inicio = %s, fecha_fin = %s
+                WHERE id_importacion = %s
+                """,
+                (estado, filas, insertadas, fecha_inicio, fecha_fin, id_importacion)
+            )
+        except Exception as e:
+            print(f"⚠️ No se pudo actualizar el manifiesto de la importación {id_importacion}: {e}")
+
+    def olvidar(self, numero_nomina: int, fecha: str) -> None:
+        """
+        Al borrar una asistencia: se descarta su huella y las importaciones que cubren esa fecha
+        dejan de contar como completas, de modo que reimportar el archivo la vuelve a registrar.
+        """
+        self.db.run_query(
+            "DELETE FROM importaciones_filas WHERE numero_nomina = %s AND fecha = %s",
+            (numero_nomina, fecha)
+        )
+        self.db.run_query(
+            """
+            UPDATE importaciones SET estado = 'parcial'
+            WHERE estado = 'completa' AND %s BETWEEN fecha_inicio AND fecha_fin
+            """,
+            (fecha,)
+        )
@@ -0,0 +1,182 @@
+import queue
+import threading
+import time
+from contextlib import contextmanager
+import mysql.connector as mysql
+from mysql.connector.errors import PoolError
+
+
+class ConnectionPool:
+    """
+    Pool de conexiones MySQL con préstamo y devolución por operación.
+    - `size`: número máximo de conexiones abiertas al mismo tiempo.
+    - `timeout`: segundos que espera un hilo cuando todas las conexiones están ocupadas.
+    - `ping_interval`: una conexión que pasó más de estos segundos sin usarse se verifica
+      con un ping antes de prestarla; si el servidor la cerró (p. ej. `wait_timeout`)
+      se descarta y se abre otra en su lugar.
+    Es seguro usarlo desde hilos de trabajo (importaciones, generación de nómina).
+    """
+
+    def __init__(self, size: int = 5, timeout: float = 30.0, ping_interval: float = 30.0, **connect_args):
+        if size < 1:
+            raise ValueError("El tamaño del pool debe ser al menos 1")
+
+        self.size = size
+        self.timeout = timeout
+        self.ping_interval = ping_interval
+        self._connect_args = connect_args
+
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=size)
+        self._lock = threading.Lock()
+        self._created = 0
+        self._closed = False
+
+        self._stats = {
+            "checkouts": 0,
+            "waits": 0,
+            "wait_time": 0.0,
+            "timeouts": 0,
+            "discarded": 0,
+            "active": 0,
+            "peak_active": 0,
+            "pings": 0,
+            "stale": 0,
+        }
+
+    def _crear_conexion(self):
+        return mysql.connect(**self._connect_args)
+
+    def acquire(self):
+        """
+        Toma una conexión del pool. Si no hay libres y aún no se alcanza `size`,
+        abre una nueva; de lo contrario espera hasta `timeout` segundos.
+        Las conexiones inactivas por más de `ping_interval` se verifican antes de entregarse.
+        """
+        while True:
+            if self._closed:
+                raise PoolError(msg="El pool de conexiones está cerrado")
+
+            try:
+                conn, devuelta = self._idle.get_nowait()
+            except queue.Empty:
+                crear = False
+                with self._lock:
+                    if self._created < self.size:
+                        self._created += 1
+                        crear = True
+
+                if crear:
+                    try:
+                        conn = self._crear_conexion()
+                    except Exception:
+                        with self._lock:
+                            self._created -= 1
+                        raise
+                    return self._entregar(conn)
+
+                inicio = time.perf_counter()
+                with self._lock:
+                    self._stats["waits"] += 1
+                try:
+                    conn, devuelta = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    with self._lock:
+                        self._stats["timeouts"] += 1
+                    raise PoolError(msg=f"Tiempo de espera agotado: {self.size} conexiones ocupadas")
+                finally:
+                    with self._lock:
+                        self._stats["wait_time"] += time.perf_counter() - inicio
+
+            if self._sigue_viva(conn, devuelta):
+                return self._entregar(conn)
+            # El servidor cerró la conexión: se descarta y se toma (o abre) otra
+            self._descartar(conn)
+
+    def _entregar(self, conn):
+        with self._lock:
+            self._stats["checkouts"] += 1
+            self._stats["active"] += 1
+            self._stats["peak_active"] = max(self._stats["peak_active"], self._stats["active"])
+        return conn
+
+    def _sigue_viva(self, conn, devuelta: float) -> bool:
+        """Ping solo si la conexión estuvo inactiva más de `ping_interval` segundos."""
+        if time.monotonic() - devuelta < self.ping_interval:
+            return True
+        with self._lock:
+            self._stats["pings"] += 1
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception:
+            with self._lock:
+                self._stats["stale"] += 1
+            return False
+
+    def release(self, conn, discard: bool = False) -> None:
+        """
+        Devuelve la conexión al pool. Las conexiones rotas (o marcadas con `discard`)
+        se cierran y liberan su lugar para que se abra una nueva.
+        """
+        with self._lock:
+            self._stats["active"] -= 1
+
+        if not discard:
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except Exception:
+                discard = True
+
+        if discard or self._closed:
+            self._descartar(conn)
+            return
+
+        try:
+            self._idle.put_nowait((conn, time.monotonic()))
+        except queue.Full:
+            self._descartar(conn)
+
+    def _descartar(self, conn) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+        with self._lock:
+            self._created -= 1
+            self._stats["discarded"] += 1
+
+    @contextmanager
+    def connection(self):
+        """Presta una conexión durante el bloque `with` y la devuelve al salir."""
+        conn = self.acquire()
+        discard = False
+        try:
+            yield conn
+        except (mysql.InterfaceError, mysql.OperationalError, GeneratorExit):
+            # GeneratorExit: un lector en streaming se abandonó a medias y dejó
+            # filas sin leer en el socket; la conexión ya no es reutilizable.
+            discard = True
+            raise
+        finally:
+            self.release(conn, discard=discard)
+
+    def stats(self) -> dict:
+        """Estadísticas del pool: préstamos, esperas, conexiones activas y abiertas."""
+        with self._lock:
+            data = dict(self._stats)
+            data["size"] = self.size
+            data["created"] = self._created
+        data["idle"] = self._idle.qsize()
+        data["wait_time"] = round(data["wait_time"], 4)
+        return data
+
+    def close_all(self) -> None:
+        """Cierra todas las conexiones libres; las prestadas se cierran al devolverse."""
+        self._closed = True
+        while True:
+            try:
+                conn, _ = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._descartar(conn)
@@ -0,0 +1,15 @@
+from app.config.config import DB_TYPE
+
+
+def get_database():
+    """
+    Devuelve la instancia (única) del backend elegido con `DB_TYPE`:
+    'sqlite' → DatabaseSqlite; cualquier otro valor → DatabaseMysql.
+    Los imports son locales para que el backend SQLite no requiera mysql-connector.
+    """
+    if (DB_TYPE or "mysql").strip().lower() == "sqlite":
+        from app.core.interfaces.database_sqlite import DatabaseSqlite
+        return DatabaseSqlite()
+
+    from app.core.interfaces.database_mysql import DatabaseMysql
+    return DatabaseMysql()
@@ -1,8 +1,21 @@
 import flet as ft
+import threading
+import time
+from itertools import islice
+from contextlib import contextmanager
 from app.helpers.class_singleton import class_singleton
-from app.config.config import DB_HOST, DB_USER, DB_PASSWORD, DB_DATABASE, DB_PORT
+from app.config.config import (
+    DB_HOST, DB_USER, DB_PASSWORD, DB_DATABASE, DB_PORT,
+    DB_POOL_SIZE, DB_POOL_TIMEOUT, DB_PREPARED_CACHE_SIZE,
+    DB_PING_INTERVAL, DB_RETRY_ATTEMPTS, DB_RETRY_BACKOFF
+)
+from app.core.app_state import AppState
+from app.core.interfaces.connection_pool import ConnectionPool
+from app.core.interfaces.prepared_cache import PreparedStatementCache
+from app.core.interfaces.query_cache import QueryCache
+from app.core.interfaces.query_stats import QueryStats
 import mysql.connector as mysql
-from mysql.connector import Error
+from mysql.connector import Error, InterfaceError, OperationalError
 import subprocess
 from pathlib import Path
 from app.views.containers.messages import mostrar_mensaje
@@ -16,6 +29,13 @@ class DatabaseMysql:
         self.password = DB_PASSWORD
         self.database = DB_DATABASE
 
+        # Estado por hilo (último ID insertado)
+        self._local = threading.local()
+        self.pool: ConnectionPool | None = None
+        self.stats = QueryStats()
+        self.cache = QueryCache()
+        self.estado = "desconectado"
+
         self.verificar_y_crear_base_datos()
         self.connect()
 
@@ -47,86 +67,463 @@ class DatabaseMysql:
         return created
 
     def connect(self) -> None:
+        self.pool = ConnectionPool(
+            size=DB_POOL_SIZE,
+            timeout=DB_POOL_TIMEOUT,
+            ping_interval=DB_PING_INTERVAL,
+            host=self.host,
+            port=self.port,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            autocommit=True,
+            allow_local_infile=True
+        )
         try:
-            self.connection = mysql.connect(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                database=self.database
-            )
-            print("✅ Conexión exitosa a la base de datos")
+            # Abrir la primera conexión para validar credenciales desde el arranque
+            with self.pool.connection():
+                pass
+            self._set_estado("conectado")
+            print(f"✅ Conexión exitosa a la base de datos (pool de {self.pool.size} conexiones)")
         except Error as e:
+            # El pool queda creado: las siguientes operaciones vuelven a intentar conectar
+            self._set_estado("desconectado", str(e))
             print(f"❌ Error al conectar: {e}")
 
+    def _set_estado(self, estado: str, detalle: str = None) -> None:
+        """Actualiza el estado de la conexión y lo publica en `AppState` si cambió."""
+        if estado == self.estado and detalle is None:
+            return
+        self.estado = estado
+        AppState().set_db_state(estado, detalle)
+
+    def ping(self) -> bool:
+        """
+        Verificación de salud: toma una conexión del pool (que descarta las cerradas
+        por el servidor) y le hace ping. Actualiza `estado`.
+        """
+        try:
+            with self._checkout() as conn:
+                conn.ping(reconnect=False)
+            self._set_estado("conectado")
+            return True
+        except Exception as e:
+            self._set_estado("desconectado", str(e))
+            print(f"❌ La base de datos no responde: {e}")
+            return False
+
+    def _reintentar(self, operacion):
+        """
+        Ejecuta una lectura idempotente reintentando con espera exponencial
+        (`DB_RETRY_BACKOFF`, luego el doble...) si se pierde la conexión.
+        Dentro de una transacción no se reintenta: la conexión perdida arrastra
+        las escrituras previas del bloque y debe fallar completo.
+        """
+        intentos = 1 if self.in_transaction() else max(DB_RETRY_ATTEMPTS, 1)
+        espera = DB_RETRY_BACKOFF
+        for intento in range(1, intentos + 1):
+            try:
+                resultado = operacion()
+            except (InterfaceError, OperationalError) as e:
+                if intento == intentos:
+                    self._set_estado("desconectado", str(e))
+                    raise
+                self._set_estado("reconectando", str(e))
+                print(f"⚠️ Conexión perdida ({e}). Reintento {intento}/{intentos - 1} en {espera:.1f} s...")
+                time.sleep(espera)
+                espera *= 2
+                continue
+            self._set_estado("conectado")
+            return resultado
+
     def disconnect(self) -> None:
-        if hasattr(self, "connection") and self.connection:
-            self.connection.close()
-            print("ℹ️ Conexión cerrada a la base de datos")
+        if hasattr(self, "pool") and self.pool:
+            self.pool.close_all()
+            print("ℹ️ Conexiones cerradas a la base de datos")
+
+    @contextmanager
+    def _checkout(self):
+        """
+        Presta una conexión del pool para una sola operación y la devuelve al terminar.
+        Dentro de `transaction()` reutiliza la conexión de la transacción del hilo.
+        """
+        conn = getattr(self._local, "tx_conn", None)
+        if conn is not None:
+            yield conn
+            return
+
+        with self.pool.connection() as conn:
+            yield conn
+
+    def in_transaction(self) -> bool:
+        """Indica si el hilo actual está dentro de un bloque `transaction()`."""
+        return getattr(self._local, "tx_conn", None) is not None
+
+    @contextmanager
+    def transaction(self):
+        """
+        Unidad de trabajo: todas las operaciones del bloque usan la misma conexión
+        y se confirman con un solo COMMIT al salir; cualquier excepción revierte todo.
+        Los bloques anidados se convierten en SAVEPOINT, de modo que un fallo interno
+        solo deshace su parte si el bloque externo captura la excepción.
+
+            with db.transaction():
+                db.run_query(...)
+                db.run_query(...)
+        """
+        depth = getattr(self._local, "tx_depth", 0)
+
+        if depth == 0:
+            with self.pool.connection() as conn:
+                conn.start_transaction()
+                self._local.tx_conn = conn
+                self._local.tx_depth = 1
+                self._local.tx_escrituras = []
+                try:
+                    yield conn
+                    inicio = time.perf_counter()
+                    conn.commit()
+                    self._registrar("COMMIT", inicio)
+                except BaseException:
+                    inicio = time.perf_counter()
+                    conn.rollback()
+                    self._registrar("ROLLBACK", inicio, error=True)
+                    raise
+                finally:
+                    self._local.tx_conn = None
+                    self._local.tx_depth = 0
+                    # Otro hilo pudo cachear datos previos mientras la transacción seguía abierta
+                    for query in self._local.tx_escrituras:
+                        self.cache.invalidate(query)
+                    self._local.tx_escrituras = []
+            return
+
+        conn = self._local.tx_conn
+        savepoint = f"sp_nivel_{depth}"
+        with conn.cursor() as cursor:
+            cursor.execute(f"SAVEPOINT {savepoint}")
+        self._local.tx_depth = depth + 1
+        try:
+            yield conn
+            with conn.cursor() as cursor:
+                cursor.execute(f"RELEASE SAVEPOINT {savepoint}")
+        except BaseException:
+            with conn.cursor() as cursor:
+                cursor.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+            raise
+        finally:
+            self._local.tx_depth = depth
+
+    @contextmanager
+    def omitir_triggers_asistencias(self):
+        """
+        Transacción (o SAVEPOINT) en la que los triggers de `asistencias` no calculan nada:
+        las inserciones deben traer `retardo`, `tiempo_trabajo` y `estado` ya calculados
+        (`calcular_asistencias`). Los triggers consultan la variable de sesión
+        @omitir_triggers_asistencias (migración 6); se limpia al salir para que la conexión
+        vuelva al pool en su estado normal.
+        """
+        with self.transaction() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SET @omitir_triggers_asistencias = 1")
+            try:
+                yield conn
+            finally:
+                with conn.cursor() as cursor:
+                    cursor.execute("SET @omitir_triggers_asistencias = NULL")
+
+    def _invalidar_cache(self, query: str) -> None:
+        """Descarta los resultados en caché de las tablas que modifica `query`."""
+        self.cache.invalidate(query)
+        if self.in_transaction():
+            self._local.tx_escrituras.append(query)
+
+    def get_pool_stats(self) -> dict:
+        """
+        Estadísticas del pool: préstamos, esperas, conexiones activas y abiertas.
+        """
+        return self.pool.stats()
+
+    def _registrar(self, query: str, inicio: float, filas: int = 0, error: bool = False, params=None) -> None:
+        """Registra latencia y filas de una ejecución en las estadísticas de queries."""
+        self.stats.record(query, time.perf_counter() - inicio, filas, error, params)
+
+    def action(self, name: str):
+        """
+        Contexto que cuenta las consultas de una acción de la interfaz:
+        `with db.action("PagosContainer._cargar_pagos"): ...`
+        """
+        return self.stats.action(name)
+
+    def get_query_stats(self) -> dict:
+        """
+        Latencia y filas por huella de SQL, consultas lentas, acciones y estado del pool.
+        """
+        data = self.stats.snapshot()
+        data["pool"] = self.get_pool_stats()
+        data["cache"] = self.cache.stats()
+        return data
+
+    def dump_query_stats(self, path: str) -> bool:
+        """Exporta `get_query_stats()` a un archivo JSON."""
+        return self.stats.dump_json(path, extra={"pool": self.get_pool_stats(), "cache": self.cache.stats()})
+
+    def load_data(self, path: str, tabla: str, columnas: list) -> int:
+        """
+        Carga un CSV (separado por comas, sin encabezado, NULL como \\N) en `tabla` con
+        LOAD DATA LOCAL INFILE. Usa la conexión de la transacción en curso, si la hay, para que
+        funcione con tablas TEMPORARY. Requiere `local_infile=ON` en el servidor; si está
+        desactivado lanza `mysql.Error`. Devuelve las filas cargadas.
+        """
+        archivo = str(path).replace("\\", "/").replace("'", "\\'")
+        query = (
+            f"LOAD DATA LOCAL INFILE '{archivo}' INTO TABLE {tabla} CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY ',' LINES TERMINATED BY '\\n' "
+            f"({', '.join(columnas)})"
+        )
+        return self.run_query(query)["rowcount"]
+
+    def explain(self, query: str, params: tuple = ()) -> list:
+        """
+        Plan de ejecución de `query` (EXPLAIN), una fila por tabla:
+        `tabla`, `acceso`, `indice`, `filas` (estimadas), `detalle` y `full_scan`
+        (recorrido completo de la tabla, `type = ALL`).
+        """
+        with self._checkout() as conn:
+            cursor = conn.cursor(dictionary=True)
+            cursor.execute(f"EXPLAIN {query}", params)
+            filas = cursor.fetchall()
+            cursor.close()
+        return [
+            {
+                "tabla": f.get("table"),
+                "acceso": f.get("type"),
+                "indice": f.get("key"),
+                "filas": f.get("rows"),
+                "detalle": f.get("Extra") or "",
+                # <derivedN>/<subqueryN>: tablas temporales, no se pueden indexar
+                "full_scan": f.get("type") == "ALL" and not str(f.get("table") or "").startswith("<"),
+            }
+            for f in filas
+        ]
 
-    def run_query(self, query: str, params: tuple = ()) -> None:
+    def run_query(self, query: str, params: tuple = ()) -> dict:
+        """
+        Ejecuta una sentencia de escritura y devuelve lo que reporta el cursor:
+        `{"lastrowid": ..., "rowcount": ...}`. `lastrowid` es el AUTO_INCREMENT
+        generado por el INSERT, sin necesidad de otra consulta.
+        """
+        inicio = time.perf_counter()
+        filas = 0
         try:
-            with self.connection.cursor() as cursor:
-                cursor.execute(query, params)
-                # 👇 Consumir todos los resultados si existen (por SP o triggers)
-                while cursor.nextset():
-                    pass
-            self.connection.commit()
+            with self._checkout() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(query, params)
+                    last_id = self._local.last_insert_id = cursor.lastrowid
+                    filas = cursor.rowcount
+                    # 👇 Consumir todos los resultados si existen (por SP o triggers)
+                    while cursor.nextset():
+                        pass
+                # Las conexiones del pool usan autocommit: fuera de `transaction()`
+                # cada sentencia ya queda confirmada sin un COMMIT adicional.
+            self._registrar(query, inicio, filas, params=params)
+            self._invalidar_cache(query)
+            return {"lastrowid": last_id, "rowcount": filas}
         except mysql.Error as e:
+            self._registrar(query, inicio, error=True)
+            if isinstance(e, (InterfaceError, OperationalError)):
+                # Las escrituras no se reintentan: pudieron aplicarse antes del corte
+                self._set_estado("desconectado", str(e))
             print(f"❌ Error ejecutando query: {e}")
             raise
 
-    def get_data(self, query: str, params: tuple = (), dictionary: bool = False):
-        try:
-            cursor = self.connection.cursor(dictionary=dictionary)
-            cursor.execute(query, params)
+    def run_many(self, query: str, params_list, chunk_size: int = 500) -> dict:
+        """
+        Ejecuta la misma sentencia para muchas filas en bloques de `chunk_size`.
+        Los INSERT ... VALUES se envían como una inserción multi-fila por bloque
+        y se hace un solo commit por bloque. Si un bloque falla, se reintenta fila
+        por fila para reportar exactamente cuáles no se pudieron escribir.
+        """
+        resultado = {"status": "success", "procesadas": 0, "afectadas": 0, "errores": []}
+        filas = iter(params_list)
+        offset = 0
 
-            # Detectar si el resultado es único o múltiple
+        while True:
+            bloque = [tuple(p) for p in islice(filas, chunk_size)]
+            if not bloque:
+                break
+
+            # Cada bloque es su propia transacción (o SAVEPOINT si ya hay una abierta)
+            inicio = time.perf_counter()
+            try:
+                with self.transaction() as conn:
+                    with conn.cursor() as cursor:
+                        cursor.executemany(query, bloque)
+                        afectadas = cursor.rowcount
+                resultado["afectadas"] += max(afectadas, 0)
+                self._registrar(query, inicio, afectadas)
+            except mysql.Error as e:
+                self._registrar(query, inicio, error=True)
+                print(f"⚠️ Bloque de {len(bloque)} filas falló ({e}). Reintentando fila por fila...")
+                with self.transaction() as conn:
+                    with conn.cursor() as cursor:
+                        for i, params in enumerate(bloque):
+                            inicio = time.perf_counter()
+                            try:
+                                cursor.execute(query, params)
+                                resultado["afectadas"] += max(cursor.rowcount, 0)
+                                self._registrar(query, inicio, cursor.rowcount)
+                            except mysql.Error as fila_error:
+                                self._registrar(query, inicio, error=True)
+                                resultado["errores"].append({
+                                    "indice": offset + i,
+                                    "params": params,
+                                    "error": str(fila_error)
+                                })
+
+            resultado["procesadas"] += len(bloque)
+            offset += len(bloque)
+
+        if resultado["afectadas"]:
+            self._invalidar_cache(query)
+        if resultado["errores"]:
+            resultado["status"] = "partial" if len(resultado["errores"]) < resultado["procesadas"] else "error"
+            print(f"❌ {len(resultado['errores'])} de {resultado['procesadas']} filas fallaron en run_many")
+        return resultado
+
+    def _fetch_prepared(self, conn, query: str, params: tuple, dictionary: bool) -> list:
+        """
+        Ejecuta `query` con una sentencia preparada en el servidor, reutilizando
+        la que ya exista en la caché LRU de la conexión.
+        """
+        cache = PreparedStatementCache.for_connection(conn, DB_PREPARED_CACHE_SIZE)
+        cursor, hit = cache.get(query)
+        self.stats.record_counter(query, "prepared_hits" if hit else "prepared_misses")
+        try:
+            cursor.execute(query, tuple(params))
             rows = cursor.fetchall()
-            while cursor.nextset():
-                pass
-            cursor.close()
+        except Exception:
+            cache.discard(query)
+            raise
 
-            if not rows:
-                return None if not dictionary else {}
+        if dictionary:
+            columnas = cursor.column_names
+            return [dict(zip(columnas, row)) for row in rows]
+        return [tuple(row) for row in rows]
 
-            # Si se pide diccionario, devolvemos el primer dict
-            if dictionary:
-                return rows[0] if isinstance(rows[0], dict) else {}
-            else:
-                return rows[0] if isinstance(rows[0], tuple) else ()
+    def _consultar(self, query: str, params: tuple, dictionary: bool, prepared: bool, cache: bool) -> list:
+        """
+        Ejecuta una lectura y devuelve todas sus filas. Con `cache=True` el resultado
+        se sirve desde la caché de consultas mientras ninguna escritura toque sus tablas.
+        Dentro de una transacción no se usa la caché (podría guardar datos sin confirmar).
+        """
+        usar_cache = cache and not self.in_transaction()
+        if usar_cache:
+            clave = QueryCache.clave(query, params, dictionary)
+            hit, rows = self.cache.get(clave)
+            self.stats.record_counter(query, "cache_hits" if hit else "cache_misses")
+            if hit:
+                return rows
+            generacion = self.cache.generacion(query)
+
+        def leer():
+            inicio = time.perf_counter()
+            try:
+                with self._checkout() as conn:
+                    if prepared:
+                        rows = self._fetch_prepared(conn, query, params, dictionary)
+                    else:
+                        cursor = conn.cursor(dictionary=dictionary)
+                        cursor.execute(query, params)
+                        rows = cursor.fetchall()
+                        while cursor.nextset():  # 👈 IMPORTANTE: limpiar resultados extra
+                            pass
+                        cursor.close()
+            except Exception:
+                self._registrar(query, inicio, error=True)
+                raise
+            self._registrar(query, inicio, len(rows), params=params)
+            return rows
+
+        rows = self._reintentar(leer)
+
+        if usar_cache:
+            self.cache.put(clave, query, rows, generacion=generacion)
+        return rows
+
+    def get_data(self, query: str, params: tuple = (), dictionary: bool = False,
+                 prepared: bool = False, cache: bool = False):
+        """
+        Devuelve la primera fila del resultado.
+        Con `prepared=True` se usa una sentencia preparada en caché: conviene para
+        búsquedas puntuales que se repiten muchas veces con el mismo SQL.
+        Con `cache=True` el resultado se reutiliza hasta que se escriba en sus tablas.
+        """
+        try:
+            rows = self._consultar(query, params, dictionary, prepared, cache)
         except Exception as e:
             print(f"❌ Error ejecutando query: {e}")
             return {} if dictionary else ()
 
+        if not rows:
+            return None if not dictionary else {}
+
+        # Si se pide diccionario, devolvemos el primer dict
+        if dictionary:
+            return rows[0] if isinstance(rows[0], dict) else {}
+        else:
+            return rows[0] if isinstance(rows[0], tuple) else ()
 
-    def get_data_list(self, query: str, params: tuple = (), dictionary: bool = False):
+    def get_data_list(self, query: str, params: tuple = (), dictionary: bool = False,
+                      prepared: bool = False, cache: bool = False):
         try:
-            cursor = self.connection.cursor(dictionary=dictionary)
-            cursor.execute(query, params)
-            result = cursor.fetchall()
-            while cursor.nextset():  # 👈 IMPORTANTE: limpiar resultados extra
-                pass
-            cursor.close()
-            return result
+            return self._consultar(query, params, dictionary, prepared, cache)
         except Exception as e:
             print(f"❌ Error ejecutando query: {e}")
             return []
 
+    def iter_data_chunks(self, query: str, params: tuple = (), dictionary: bool = False, batch_size: int = 500):
+        """
+        Lee un resultado grande en bloques de `batch_size` filas con un cursor sin buffer,
+        de modo que la memoria usada no depende del tamaño total del resultado.
+        La conexión queda prestada mientras se consume el generador.
+        """
+        inicio = time.perf_counter()
+        filas = 0
+        with self._checkout() as conn:
+            cursor = conn.cursor(dictionary=dictionary, buffered=False)
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                filas += len(rows)
+                yield rows
+            cursor.close()
+        # Incluye el tiempo que el consumidor tarda en procesar cada bloque
+        self._registrar(query, inicio, filas)
+
+    def iter_data(self, query: str, params: tuple = (), dictionary: bool = False, batch_size: int = 500):
+        """
+        Igual que `get_data_list`, pero entrega las filas una a una en memoria constante.
+        """
+        for rows in self.iter_data_chunks(query, params, dictionary=dictionary, batch_size=batch_size):
+            yield from rows
 
     def is_empty(self) -> bool:
         tablas = [
             "empleados", "asistencias", "pagos",
             "prestamos", "desempeno", "reportes_semanales", "usuarios_app"
         ]
-        for tbl in tablas:
-            try:
-                with self.connection.cursor(dictionary=True) as cur:
-                    cur.execute(f"SELECT COUNT(*) AS c FROM `{tbl}`")
-                    if cur.fetchone().get("c", 0) > 0:
-                        return False
-            except Exception:
-                continue
+        with self._checkout() as conn:
+            for tbl in tablas:
+                try:
+                    with conn.cursor(dictionary=True) as cur:
+                        cur.execute(f"SELECT COUNT(*) AS c FROM `{tbl}`")
+                        if cur.fetchone().get("c", 0) > 0:
+                            return False
+                except Exception:
+                    continue
         return True
 
     def exportar_base_datos(self, ruta_destino: str) -> bool:
@@ -201,6 +598,7 @@ class DatabaseMysql:
                     mostrar_mensaje(page, "Error de Importación", "Hubo un problema al importar la base de datos.")
                 return False
             else:
+                self.cache.clear()
                 print("✅ Base de datos importada correctamente.")
                 if page:
                     mostrar_mensaje(page, "Importación Exitosa", "La base de datos fue importada correctamente.")
@@ -212,37 +610,45 @@ class DatabaseMysql:
             return False
 
     def execute_procedure(self, procedure_name: str, params: tuple = ()) -> list:
+        inicio = time.perf_counter()
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.callproc(procedure_name, params)
-            results = []
+            with self._checkout() as conn:
+                cursor = conn.cursor(dictionary=True)
+                cursor.callproc(procedure_name, params)
+                results = []
 
-            for result in cursor.stored_results():
-                results = result.fetchall()
+                for result in cursor.stored_results():
+                    results = result.fetchall()
 
-            cursor.close()
+                cursor.close()
+            self._registrar(f"CALL {procedure_name}", inicio, len(results), params=params)
             return results
         except Exception as ex:
+            self._registrar(f"CALL {procedure_name}", inicio, error=True)
             print(f"❌ Error ejecutando SP '{procedure_name}': {ex}")
             return []
 
     def get_last_insert_id(self):
-        try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT LAST_INSERT_ID()")
-            result = cursor.fetchone()
-            cursor.close()
-            return result[0] if result else None
-        except Exception as e:
-            print(f"❌ Error al obtener el último ID insertado: {e}")
-            return None
+        """
+        Último ID insertado por `run_query` en el hilo actual.
+        Con el pool, `SELECT LAST_INSERT_ID()` podría caer en otra conexión.
+        """
+        return getattr(self._local, "last_insert_id", None)
 
     def call_procedure(self, procedure_name: str, params: tuple = ()):
+        inicio = time.perf_counter()
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            cursor.callproc(procedure_name, params)
-            for result in cursor.stored_results():
-                return result.fetchall()
+            with self._checkout() as conn:
+                cursor = conn.cursor(dictionary=True)
+                cursor.callproc(procedure_name, params)
+                results = []
+                for result in cursor.stored_results():
+                    results = result.fetchall()
+                    break
+                cursor.close()
+            self._registrar(f"CALL {procedure_name}", inicio, len(results), params=params)
+            return results
         except Exception as e:
+            self._registrar(f"CALL {procedure_name}", inicio, error=True)
             print(f"❌ Error al llamar al SP {procedure_name}: {e}")
             return []
@@ -0,0 +1,804 @@
+import csv
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from app.helpers.class_singleton import class_singleton
+from app.config.config import DB_DATABASE, DB_SQLITE_PATH, DB_PREPARED_CACHE_SIZE
+from app.core.interfaces.query_stats import QueryStats
+from app.core.interfaces.query_cache import QueryCache
+
+
+# --------------------------------------------------------
+# Conversión de horas (columnas TIME de MySQL)
+# --------------------------------------------------------
+
+def _a_segundos(valor) -> int | None:
+    """'HH:MM[:SS]' (o timedelta) → segundos. None si no se puede interpretar."""
+    if valor is None:
+        return None
+    if isinstance(valor, timedelta):
+        return int(valor.total_seconds())
+    texto = str(valor).strip()
+    negativo = texto.startswith("-")
+    partes = texto.lstrip("-").split(":")
+    try:
+        horas = int(partes[0])
+        minutos = int(partes[1]) if len(partes) > 1 else 0
+        segundos = int(float(partes[2])) if len(partes) > 2 else 0
+    except ValueError:
+        return None
+    total = horas * 3600 + minutos * 60 + segundos
+    return -total if negativo else total
+
+
+def _a_hora(segundos) -> str | None:
+    """Segundos → 'HH:MM:SS' (las horas pueden pasar de 24, como en MySQL)."""
+    if segundos is None:
+        return None
+    signo = "-" if segundos < 0 else ""
+    segundos = abs(int(segundos))
+    return f"{signo}{segundos // 3600:02d}:{segundos % 3600 // 60:02d}:{segundos % 60:02d}"
+
+
+def _hora_registrada(valor) -> bool:
+    """Una hora NULL o '00:00:00' cuenta como no registrada."""
+    return bool(_a_segundos(valor))
+
+
+# --------------------------------------------------------
+# Equivalentes en Python de los triggers de `asistencias`
+# --------------------------------------------------------
+
+def estado_asistencia(hora_entrada, hora_salida) -> str:
+    """Equivalente de `trg_verificar_estado_asistencia`."""
+    if _hora_registrada(hora_entrada) and _hora_registrada(hora_salida):
+        return "completo"
+    return "incompleto"
+
+
+def calcular_horas_trabajadas(hora_entrada, hora_salida) -> tuple:
+    """
+    Equivalente de `trg_calcular_horas_trabajadas`.
+    La entrada se redondea hacia arriba al siguiente bloque de 30 minutos y la salida
+    hacia abajo; si la salida queda antes de la entrada se asume cruce de día.
+    Devuelve `(retardo, tiempo_trabajo)` o `(None, None)` si falta alguna hora.
+    """
+    if not (_hora_registrada(hora_entrada) and _hora_registrada(hora_salida)):
+        return None, None
+
+    entrada = _a_segundos(hora_entrada)
+    salida = _a_segundos(hora_salida)
+
+    minuto_entrada = entrada % 3600 // 60
+    entrada_ajustada = entrada // 3600 * 3600 + (1800 if minuto_entrada <= 30 else 0)
+    if minuto_entrada > 30:
+        entrada_ajustada += 3600
+
+    minuto_salida = salida % 3600 // 60
+    salida_ajustada = salida // 3600 * 3600 + (1800 if minuto_salida >= 30 else 0)
+
+    if salida_ajustada <= entrada_ajustada:
+        salida_ajustada += 24 * 3600
+
+    return _a_hora(entrada_ajustada), _a_hora(salida_ajustada - entrada_ajustada)
+
+
+# --------------------------------------------------------
+# Traducción de SQL de MySQL a SQLite
+# --------------------------------------------------------
+
+_RE_LITERALES = re.compile(r"('(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\")")
+_RE_SOLO_MYSQL = re.compile(
+    r"^\s*(CREATE\s+(DEFINER\s*=\s*\S+\s+)?(TRIGGER|PROCEDURE|FUNCTION)\b"
+    r"|DROP\s+(TRIGGER|PROCEDURE|FUNCTION)\b"
+    r"|SET\s+(FOREIGN_KEY_CHECKS|NAMES)\b)",
+    re.I
+)
+_REEMPLAZOS = [
+    (re.compile(r"\b\w*INT\b(\s+UNSIGNED)?(\s+NOT\s+NULL)?\s+AUTO_INCREMENT\s+PRIMARY\s+KEY", re.I),
+     "INTEGER PRIMARY KEY AUTOINCREMENT"),
+    (re.compile(r"\bAUTO_INCREMENT\s*=\s*\d+", re.I), ""),
+    (re.compile(r"\s+UNSIGNED\b", re.I), ""),
+    (re.compile(r"\s+ON\s+UPDATE\s+CURRENT_TIMESTAMP\b", re.I), ""),
+    (re.compile(r"\s*\bENGINE\s*=\s*\w+", re.I), ""),
+    (re.compile(r"\s*\b(DEFAULT\s+)?(CHARSET|CHARACTER\s+SET)\s*=?\s*\w+", re.I), ""),
+    (re.compile(r"\s*\bCOLLATE\s*=?\s*\w+", re.I), ""),
+    (re.compile(r"\bUNIQUE\s+(KEY|INDEX)\s+\w+\s*\(", re.I), "UNIQUE ("),
+    (re.compile(r",\s*(KEY|INDEX)\s+\w+\s*\([^)]*\)", re.I), ""),
+    (re.compile(r"\s+FOR\s+UPDATE\b", re.I), ""),
+    (re.compile(r"\bINSERT\s+IGNORE\b", re.I), "INSERT OR IGNORE"),
+    (re.compile(r"\bDROP\s+TEMPORARY\s+TABLE\b", re.I), "DROP TABLE"),
+    (re.compile(r"\bIF\s*\(", re.I), "IIF("),
+    (re.compile(r"\binformation_schema\.(\w+)", re.I), lambda m: f"_is_{m.group(1).lower()}"),
+]
+_RE_ENUM = re.compile(r"\bENUM\s*\([^)]*\)", re.I)
+_RE_DUPLICADOS = re.compile(r"\bON\s+DUPLICATE\s+KEY\s+UPDATE\b", re.I)
+_RE_VALUES_COL = re.compile(r"\bVALUES\s*\(\s*`?(\w+)`?\s*\)", re.I)
+_RE_PARAMS = re.compile(r"%\((\w+)\)s|%s|%%")
+# EXPLAIN QUERY PLAN: "SCAN t", "SEARCH t USING INDEX idx (...)", "SCAN t USING COVERING INDEX idx"
+_RE_PLAN = re.compile(r"(SCAN|SEARCH) (?:TABLE )?(\w+)(?: AS \w+)?(?: USING (?:COVERING )?INDEX (\w+))?")
+
+
+@lru_cache(maxsize=1024)
+def traducir_sql(query: str) -> str | None:
+    """
+    Adapta una sentencia escrita para MySQL al dialecto de SQLite.
+    Devuelve None para sentencias que solo existen en MySQL (triggers y
+    procedimientos): este backend los implementa en Python.
+    """
+    if _RE_SOLO_MYSQL.match(query):
+        return None
+
+    # ENUM('a','b') contiene literales: se resuelve antes de separarlos
+    partes = _RE_LITERALES.split(_RE_ENUM.sub("TEXT", query))
+    for i in range(0, len(partes), 2):
+        sql = partes[i]
+        for patron, reemplazo in _REEMPLAZOS:
+            sql = patron.sub(reemplazo, sql)
+        sql = _RE_PARAMS.sub(
+            lambda m: f":{m.group(1)}" if m.group(1) else ("?" if m.group(0) == "%s" else "%"),
+            sql
+        )
+        partes[i] = sql
+    sql = "".join(partes).strip().rstrip(";")
+
+    if _RE_DUPLICADOS.search(sql):
+        cabeza, cola = _RE_DUPLICADOS.split(sql, maxsplit=1)
+        cola = _RE_VALUES_COL.sub(r"excluded.\1", cola)
+        sql = f"{cabeza} ON CONFLICT DO UPDATE SET {cola}"
+    return sql
+
+
+# --------------------------------------------------------
+# Tipos: adaptadores (Python → SQLite) y conversores (SQLite → Python)
+# --------------------------------------------------------
+
+def _conversor(funcion):
+    def convertir(valor: bytes):
+        texto = valor.decode()
+        try:
+            return funcion(texto)
+        except (ValueError, TypeError, ArithmeticError):
+            return texto
+    return convertir
+
+
+sqlite3.register_adapter(Decimal, str)
+sqlite3.register_adapter(date, lambda d: d.isoformat())
+sqlite3.register_adapter(datetime, lambda d: d.isoformat(" ", "seconds"))
+sqlite3.register_adapter(timedelta, lambda t: _a_hora(t.total_seconds()))
+sqlite3.register_converter("DATE", _conversor(lambda t: date.fromisoformat(t[:10])))
+sqlite3.register_converter("DATETIME", _conversor(datetime.fromisoformat))
+sqlite3.register_converter("TIMESTAMP", _conversor(datetime.fromisoformat))
+sqlite3.register_converter("TIME", _conversor(lambda t: timedelta(seconds=_a_segundos(t))))
+sqlite3.register_converter("DECIMAL", _conversor(Decimal))
+
+
+@class_singleton
+class DatabaseSqlite:
+    """
+    Backend SQLite en proceso con la misma interfaz que `DatabaseMysql`.
+    Sirve para pruebas y mediciones sin servidor MySQL: `DB_SQLITE_PATH` puede ser
+    un archivo o `:memory:`. Las sentencias de los modelos se traducen al vuelo,
+    los triggers de `asistencias` y el procedimiento `horas_trabajadas_para_pagos`
+    se implementan en Python.
+    """
+
+    TRIGGERS = {
+        "trg_verificar_estado_asistencia": """
+            CREATE TRIGGER trg_verificar_estado_asistencia
+            AFTER INSERT ON asistencias
+            WHEN py_triggers_activos()
+            BEGIN
+                UPDATE asistencias
+                SET estado = py_estado_asistencia(NEW.hora_entrada, NEW.hora_salida)
+                WHERE rowid = NEW.rowid;
+            END
+        """,
+        "trg_calcular_horas_trabajadas": """
+            CREATE TRIGGER trg_calcular_horas_trabajadas
+            AFTER INSERT ON asistencias
+            WHEN py_triggers_activos() AND py_retardo(NEW.hora_entrada, NEW.hora_salida) IS NOT NULL
+            BEGIN
+                UPDATE asistencias
+                SET retardo = py_retardo(NEW.hora_entrada, NEW.hora_salida),
+                    tiempo_trabajo = py_tiempo_trabajo(NEW.hora_entrada, NEW.hora_salida)
+                WHERE rowid = NEW.rowid;
+            END
+        """,
+    }
+
+    def __init__(self, path: str = DB_SQLITE_PATH):
+        self.path = path or ":memory:"
+        self.database = DB_DATABASE or "main"
+        self.host = self.port = self.user = self.password = None
+
+        self._local = threading.local()
+        self._lock = threading.RLock()
+        self._conn: sqlite3.Connection | None = None
+        self._checkouts = 0
+        self._activas = 0
+        self._waits = 0
+        self._wait_time = 0.0
+        self.stats = QueryStats()
+        self.cache = QueryCache()
+        self.estado = "desconectado"
+
+        self.procedimientos = {
+            "horas_trabajadas_para_pagos": self._sp_horas_trabajadas_para_pagos,
+        }
+
+        self.verificar_y_crear_base_datos()
+        self.connect()
+
+    def verificar_y_crear_base_datos(self) -> bool:
+        if self.path == ":memory:":
+            return True
+        archivo = Path(self.path)
+        if archivo.exists():
+            return False
+        archivo.parent.mkdir(parents=True, exist_ok=True)
+        return True
+
+    def connect(self) -> None:
+        self._conn = sqlite3.connect(
+            self.path,
+            isolation_level=None,
+            check_same_thread=False,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            cached_statements=DB_PREPARED_CACHE_SIZE
+        )
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode = WAL")
+        self._registrar_funciones()
+        self._crear_catalogo()
+        self._instalar_triggers()
+        self.estado = "conectado"
+        print(f"✅ Conexión exitosa a la base de datos SQLite ({self.path})")
+
+    def disconnect(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self.estado = "desconectado"
+            print("ℹ️ Conexión cerrada a la base de datos SQLite")
+
+    def ping(self) -> bool:
+        """Verificación de salud; la base en proceso no se desconecta sola."""
+        try:
+            with self._checkout() as conn:
+                conn.execute("SELECT 1").fetchone()
+            return True
+        except Exception as e:
+            print(f"❌ La base de datos no responde: {e}")
+            return False
+
+    # --------------------------------------------------------
+    # Funciones SQL de MySQL, catálogo y triggers
+    # --------------------------------------------------------
+
+    def _registrar_funciones(self) -> None:
+        def last_insert_id(*valor):
+            if not valor:
+                return getattr(self._local, "last_insert_id", None)
+            # INSERT ... SELECT LAST_INSERT_ID(expr): el valor llega como lastrowid
+            self._local.last_insert_id_expr = valor[0]
+            return valor[0]
+
+        def concat(*valores):
+            return None if any(v is None for v in valores) else "".join(str(v) for v in valores)
+
+        def parte_fecha(indice):
+            def extraer(valor):
+                if valor is None:
+                    return None
+                try:
+                    return int(str(valor)[:10].split("-")[indice])
+                except (ValueError, IndexError):
+                    return None
+            return extraer
+
+        c = self._conn
+        c.create_function("CURDATE", 0, lambda: date.today().isoformat())
+        c.create_function("NOW", 0, lambda: datetime.now().isoformat(" ", "seconds"))
+        c.create_function("CONCAT", -1, concat, deterministic=True)
+        c.create_function("TIME_TO_SEC", 1, _a_segundos, deterministic=True)
+        c.create_function("SEC_TO_TIME", 1, _a_hora, deterministic=True)
+        c.create_function("YEAR", 1, parte_fecha(0), deterministic=True)
+        c.create_function("MONTH", 1, parte_fecha(1), deterministic=True)
+        c.create_function("DAY", 1, parte_fecha(2), deterministic=True)
+        c.create_function("LAST_INSERT_ID", -1, last_insert_id)
+        c.create_function("py_estado_asistencia", 2, estado_asistencia, deterministic=True)
+        c.create_function(
+            "py_triggers_activos", 0, lambda: 0 if getattr(self._local, "omitir_triggers", False) else 1
+        )
+        c.create_function(
+            "py_retardo", 2, lambda e, s: calcular_horas_trabajadas(e, s)[0], deterministic=True
+        )
+        c.create_function(
+            "py_tiempo_trabajo", 2, lambda e, s: calcular_horas_trabajadas(e, s)[1], deterministic=True
+        )
+
+    def _crear_catalogo(self) -> None:
+        """
+        Vistas temporales con la forma de `information_schema` que consultan los modelos
+        (`information_schema.tables` se traduce a `_is_tables`, etc.).
+        """
+        schema = self.database.replace("'", "''")
+        rutinas = " UNION ALL ".join(
+            f"SELECT '{schema}' AS routine_schema, '{nombre}' AS routine_name, 'PROCEDURE' AS routine_type"
+            for nombre in self.procedimientos
+        )
+        self._conn.executescript(f"""
+            DROP VIEW IF EXISTS temp._is_tables;
+            DROP VIEW IF EXISTS temp._is_triggers;
+            DROP VIEW IF EXISTS temp._is_routines;
+            DROP VIEW IF EXISTS temp._is_statistics;
+            CREATE TEMP VIEW _is_tables AS
+                SELECT '{schema}' AS table_schema, name AS table_name
+                FROM main.sqlite_master WHERE type = 'table';
+            CREATE TEMP VIEW _is_triggers AS
+                SELECT '{schema}' AS trigger_schema, name AS trigger_name, tbl_name AS event_object_table
+                FROM main.sqlite_master WHERE type = 'trigger';
+            CREATE TEMP VIEW _is_routines AS {rutinas};
+            CREATE TEMP VIEW _is_statistics AS
+                SELECT '{schema}' AS table_schema, tbl_name AS table_name, name AS index_name
+                FROM main.sqlite_master WHERE type = 'index';
+        """)
+
+    def _instalar_triggers(self) -> None:
+        """
+        Crea los triggers en Python de `asistencias` en cuanto la tabla existe.
+        Se recrean siempre para que los archivos de versiones anteriores tomen la definición actual.
+        """
+        existe = self._conn.execute(
+            "SELECT 1 FROM main.sqlite_master WHERE type = 'table' AND name = 'asistencias'"
+        ).fetchone()
+        if existe:
+            for nombre, sql in self.TRIGGERS.items():
+                self._conn.execute(f"DROP TRIGGER IF EXISTS {nombre}")
+                self._conn.execute(sql)
+
+    # --------------------------------------------------------
+    # Conexión y transacciones
+    # --------------------------------------------------------
+
+    @contextmanager
+    def _checkout(self):
+        """
+        SQLite admite un solo escritor: todas las operaciones comparten la conexión
+        y se serializan con un candado reentrante.
+        """
+        inicio = time.perf_counter()
+        if not self._lock.acquire(blocking=False):
+            self._waits += 1
+            self._lock.acquire()
+            self._wait_time += time.perf_counter() - inicio
+        self._checkouts += 1
+        self._activas += 1
+        try:
+            yield self._conn
+        finally:
+            self._activas -= 1
+            self._lock.release()
+
+    def in_transaction(self) -> bool:
+        """Indica si el hilo actual está dentro de un bloque `transaction()`."""
+        return getattr(self._local, "tx_depth", 0) > 0
+
+    @contextmanager
+    def transaction(self):
+        """
+        Unidad de trabajo con la misma semántica que en `DatabaseMysql`:
+        un solo COMMIT al salir, ROLLBACK ante cualquier excepción y SAVEPOINT
+        para los bloques anidados.
+        """
+        with self._checkout() as conn:
+            depth = getattr(self._local, "tx_depth", 0)
+
+            if depth == 0:
+                conn.execute("BEGIN")
+                self._local.tx_depth = 1
+                self._local.tx_escrituras = []
+                try:
+                    yield conn
+                    inicio = time.perf_counter()
+                    conn.execute("COMMIT")
+                    self._registrar("COMMIT", inicio)
+                except BaseException:
+                    inicio = time.perf_counter()
+                    conn.execute("ROLLBACK")
+                    self._registrar("ROLLBACK", inicio, error=True)
+                    raise
+                finally:
+                    self._local.tx_depth = 0
+                    for query in self._local.tx_escrituras:
+                        self.cache.invalidate(query)
+                    self._local.tx_escrituras = []
+                return
+
+            savepoint = f"sp_nivel_{depth}"
+            conn.execute(f"SAVEPOINT {savepoint}")
+            self._local.tx_depth = depth + 1
+            try:
+                yield conn
+                conn.execute(f"RELEASE SAVEPOINT {savepoint}")
+            except BaseException:
+                conn.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+                conn.execute(f"RELEASE SAVEPOINT {savepoint}")
+                raise
+            finally:
+                self._local.tx_depth = depth
+
+    @contextmanager
+    def omitir_triggers_asistencias(self):
+        """
+        Igual que en `DatabaseMysql`: dentro del bloque los triggers de `asistencias`
+        no se disparan (`py_triggers_activos()` devuelve 0 en este hilo).
+        """
+        with self.transaction() as conn:
+            anterior = getattr(self._local, "omitir_triggers", False)
+            self._local.omitir_triggers = True
+            try:
+                yield conn
+            finally:
+                self._local.omitir_triggers = anterior
+
+    # --------------------------------------------------------
+    # Estadísticas
+    # --------------------------------------------------------
+
+    def _invalidar_cache(self, query: str) -> None:
+        self.cache.invalidate(query)
+        if self.in_transaction():
+            self._local.tx_escrituras.append(query)
+
+    def get_pool_stats(self) -> dict:
+        """Mismas claves que el pool de MySQL; aquí hay una sola conexión compartida."""
+        return {
+            "checkouts": self._checkouts,
+            "waits": self._waits,
+            "wait_time": round(self._wait_time, 4),
+            "timeouts": 0,
+            "discarded": 0,
+            "pings": 0,
+            "stale": 0,
+            "active": min(self._activas, 1),
+            "peak_active": 1,
+            "size": 1,
+            "created": 1 if self._conn is not None else 0,
+            "idle": 0 if self._activas else 1,
+        }
+
+    def _registrar(self, query: str, inicio: float, filas: int = 0, error: bool = False, params=None) -> None:
+        self.stats.record(query, time.perf_counter() - inicio, filas, error, params)
+
+    def action(self, name: str):
+        return self.stats.action(name)
+
+    def get_query_stats(self) -> dict:
+        data = self.stats.snapshot()
+        data["pool"] = self.get_pool_stats()
+        data["cache"] = self.cache.stats()
+        return data
+
+    def dump_query_stats(self, path: str) -> bool:
+        return self.stats.dump_json(path, extra={"pool": self.get_pool_stats(), "cache": self.cache.stats()})
+
+    # --------------------------------------------------------
+    # Lectura y escritura
+    # --------------------------------------------------------
+
+    @staticmethod
+    def _params(params):
+        if params is None:
+            return ()
+        return params if isinstance(params, dict) else tuple(params)
+
+    @staticmethod
+    def _filas(cursor, rows, dictionary: bool) -> list:
+        if not dictionary:
+            return rows
+        columnas = [d[0] for d in cursor.description or ()]
+        return [dict(zip(columnas, row)) for row in rows]
+
+    def run_query(self, query: str, params: tuple = ()) -> dict:
+        """Ejecuta una sentencia de escritura; devuelve `{"lastrowid", "rowcount"}`."""
+        sql = traducir_sql(query)
+        if sql is None:
+            return {"lastrowid": None, "rowcount": 0}
+
+        inicio = time.perf_counter()
+        try:
+            with self._checkout() as conn:
+                self._local.last_insert_id_expr = None
+                cursor = conn.execute(sql, self._params(params))
+                last_id = self._local.last_insert_id_expr or cursor.lastrowid
+                filas = cursor.rowcount
+                cursor.close()
+                if sql.lstrip()[:12].upper().startswith("CREATE TABLE"):
+                    self._instalar_triggers()
+            self._local.last_insert_id = last_id
+            self._registrar(query, inicio, filas, params=params)
+            self._invalidar_cache(query)
+            return {"lastrowid": last_id, "rowcount": filas}
+        except sqlite3.Error as e:
+            self._registrar(query, inicio, error=True)
+            print(f"❌ Error ejecutando query: {e}")
+            raise
+
+    def run_many(self, query: str, params_list, chunk_size: int = 500) -> dict:
+        """Misma semántica que `DatabaseMysql.run_many`: bloques con reintento fila por fila."""
+        resultado = {"status": "success", "procesadas": 0, "afectadas": 0, "errores": []}
+        sql = traducir_sql(query)
+        if sql is None:
+            return resultado
+
+        filas = iter(params_list)
+        offset = 0
+        while True:
+            bloque = [self._params(p) for p in islice(filas, chunk_size)]
+            if not bloque:
+                break
+
+            inicio = time.perf_counter()
+            try:
+                with self.transaction() as conn:
+                    cursor = conn.executemany(sql, bloque)
+                    afectadas = cursor.rowcount
+                resultado["afectadas"] += max(afectadas, 0)
+                self._registrar(query, inicio, afectadas)
+            except sqlite3.Error as e:
+                self._registrar(query, inicio, error=True)
+                print(f"⚠️ Bloque de {len(bloque)} filas falló ({e}). Reintentando fila por fila...")
+                with self.transaction() as conn:
+                    for i, params in enumerate(bloque):
+                        inicio = time.perf_counter()
+                        try:
+                            cursor = conn.execute(sql, params)
+                            resultado["afectadas"] += max(cursor.rowcount, 0)
+                            self._registrar(query, inicio, cursor.rowcount)
+                        except sqlite3.Error as fila_error:
+                            self._registrar(query, inicio, error=True)
+                            resultado["errores"].append({
+                                "indice": offset + i,
+                                "params": params,
+                                "error": str(fila_error)
+                            })
+
+            resultado["procesadas"] += len(bloque)
+            offset += len(bloque)
+
+        if resultado["afectadas"]:
+            self._invalidar_cache(query)
+        if resultado["errores"]:
+            resultado["status"] = "partial" if resultado["afectadas"] else "error"
+        return resultado
+
+    def load_data(self, path: str, tabla: str, columnas: list) -> int:
+        """Equivalente de LOAD DATA LOCAL INFILE de `DatabaseMysql`: inserta el CSV por lotes."""
+        marcadores = ", ".join(["%s"] * len(columnas))
+        query = f"INSERT INTO {tabla} ({', '.join(columnas)}) VALUES ({marcadores})"
+        with open(path, newline="", encoding="utf-8") as f:
+            filas = ([None if v == "\\N" else v for v in fila] for fila in csv.reader(f))
+            resultado = self.run_many(query, filas, chunk_size=5000)
+        if resultado["errores"]:
+            raise sqlite3.IntegrityError(f"{len(resultado['errores'])} filas de {path} no se pudieron cargar")
+        return resultado["afectadas"]
+
+    def explain(self, query: str, params: tuple = ()) -> list:
+        """Mismas claves que `DatabaseMysql.explain`, a partir de EXPLAIN QUERY PLAN."""
+        sql = traducir_sql(query)
+        if sql is None:
+            return []
+        with self._checkout() as conn:
+            filas = conn.execute(f"EXPLAIN QUERY PLAN {sql}", self._params(params)).fetchall()
+
+        plan = []
+        for fila in filas:
+            detalle = fila[-1]
+            m = _RE_PLAN.match(detalle)
+            if not m or m.group(2) == "CONSTANT":
+                continue  # B-TREE temporales, subconsultas, filas constantes
+            indice = m.group(3) or ("PRIMARY" if "PRIMARY KEY" in detalle else None)
+            plan.append({
+                "tabla": m.group(2),
+                "acceso": m.group(1),
+                "indice": indice,
+                "filas": None,
+                "detalle": detalle,
+                "full_scan": m.group(1) == "SCAN" and indice is None,
+            })
+        return plan
+
+    def _consultar(self, query: str, params: tuple, dictionary: bool, cache: bool) -> list:
+        """Ejecuta una lectura; con `cache=True` usa la caché de consultas (fuera de transacciones)."""
+        usar_cache = cache and not self.in_transaction()
+        if usar_cache:
+            clave = QueryCache.clave(query, params, dictionary)
+            hit, rows = self.cache.get(clave)
+            self.stats.record_counter(query, "cache_hits" if hit else "cache_misses")
+            if hit:
+                return rows
+            generacion = self.cache.generacion(query)
+
+        inicio = time.perf_counter()
+        try:
+            with self._checkout() as conn:
+                cursor = conn.execute(traducir_sql(query), self._params(params))
+                rows = self._filas(cursor, cursor.fetchall(), dictionary)
+                cursor.close()
+        except Exception:
+            self._registrar(query, inicio, error=True)
+            raise
+        self._registrar(query, inicio, len(rows), params=params)
+
+        if usar_cache:
+            self.cache.put(clave, query, rows, generacion=generacion)
+        return rows
+
+    def get_data(self, query: str, params: tuple = (), dictionary: bool = False,
+                 prepared: bool = False, cache: bool = False):
+        """
+        Devuelve la primera fila. `prepared` se acepta por compatibilidad:
+        sqlite3 ya reutiliza las sentencias compiladas de la conexión.
+        """
+        try:
+            rows = self._consultar(query, params, dictionary, cache)
+        except Exception as e:
+            print(f"❌ Error ejecutando query: {e}")
+            return {} if dictionary else ()
+        if not rows:
+            return None if not dictionary else {}
+        return rows[0]
+
+    def get_data_list(self, query: str, params: tuple = (), dictionary: bool = False,
+                      prepared: bool = False, cache: bool = False):
+        try:
+            return self._consultar(query, params, dictionary, cache)
+        except Exception as e:
+            print(f"❌ Error ejecutando query: {e}")
+            return []
+
+    def iter_data_chunks(self, query: str, params: tuple = (), dictionary: bool = False, batch_size: int = 500):
+        """Lee el resultado en bloques de `batch_size` filas."""
+        inicio = time.perf_counter()
+        filas = 0
+        with self._checkout() as conn:
+            cursor = conn.execute(traducir_sql(query), self._params(params))
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    filas += len(rows)
+                    yield self._filas(cursor, rows, dictionary)
+            finally:
+                cursor.close()
+        self._registrar(query, inicio, filas)
+
+    def iter_data(self, query: str, params: tuple = (), dictionary: bool = False, batch_size: int = 500):
+        for rows in self.iter_data_chunks(query, params, dictionary=dictionary, batch_size=batch_size):
+            yield from rows
+
+    def is_empty(self) -> bool:
+        tablas = [
+            "empleados", "asistencias", "pagos",
+            "prestamos", "desempeno", "reportes_semanales", "usuarios_app"
+        ]
+        with self._checkout() as conn:
+            for tbl in tablas:
+                try:
+                    if conn.execute(f'SELECT COUNT(*) FROM "{tbl}"').fetchone()[0] > 0:
+                        return False
+                except sqlite3.Error:
+                    continue
+        return True
+
+    def get_last_insert_id(self):
+        return getattr(self._local, "last_insert_id", None)
+
+    # --------------------------------------------------------
+    # Procedimientos almacenados (en Python)
+    # --------------------------------------------------------
+
+    def _sp_horas_trabajadas_para_pagos(self, numero_nomina=None, fecha_inicio=None, fecha_fin=None) -> list:
+        """Equivalente del procedimiento `horas_trabajadas_para_pagos`."""
+        filtro = ""
+        params = [fecha_inicio, fecha_fin]
+        if numero_nomina is not None:
+            if not self.get_data("SELECT 1 FROM empleados WHERE numero_nomina = %s", (numero_nomina,)):
+                return [{"mensaje": "Empleado no encontrado"}]
+            filtro = "AND a.numero_nomina = %s"
+            params.append(numero_nomina)
+
+        query = f"""
+            SELECT a.numero_nomina, e.nombre_completo,
+                   SUM(TIME_TO_SEC(a.tiempo_trabajo)) AS segundos
+            FROM asistencias a
+            JOIN empleados e ON a.numero_nomina = e.numero_nomina
+            WHERE a.fecha BETWEEN %s AND %s
+            AND a.estado = 'completo'
+            {filtro}
+            GROUP BY a.numero_nomina, e.nombre_completo
+        """
+        filas = self.get_data_list(query, tuple(params), dictionary=True)
+        for fila in filas:
+            fila["total_horas_trabajadas"] = _a_hora(fila.pop("segundos") or 0)
+        return filas
+
+    def execute_procedure(self, procedure_name: str, params: tuple = ()) -> list:
+        return self.call_procedure(procedure_name, params)
+
+    def call_procedure(self, procedure_name: str, params: tuple = ()):
+        inicio = time.perf_counter()
+        try:
+            procedimiento = self.procedimientos.get(procedure_name)
+            if procedimiento is None:
+                raise NotImplementedError(f"Procedimiento '{procedure_name}' no disponible en SQLite")
+            results = procedimiento(*params)
+            self._registrar(f"CALL {procedure_name}", inicio, len(results), params=params)
+            return results
+        except Exception as e:
+            self._registrar(f"CALL {procedure_name}", inicio, error=True)
+            print(f"❌ Error al llamar al SP {procedure_name}: {e}")
+            return []
+
+    # --------------------------------------------------------
+    # Respaldo
+    # --------------------------------------------------------
+
+    def exportar_base_datos(self, ruta_destino: str) -> bool:
+        """Genera un volcado SQL (dialecto SQLite) de la base de datos."""
+        try:
+            with self._checkout() as conn, open(ruta_destino, "w", encoding="utf-8") as salida:
+                for linea in conn.iterdump():
+                    salida.write(f"{linea}\n")
+            print(f"✅ Base de datos exportada a: {ruta_destino}")
+            return True
+        except Exception as e:
+            print(f"❌ Error al exportar la base de datos: {e}")
+            return False
+
+    def importar_base_datos(self, ruta_sql: str, page=None) -> bool:
+        """Reemplaza la base de datos con un volcado generado por `exportar_base_datos`."""
+        try:
+            ruta = Path(ruta_sql)
+            if not ruta.exists():
+                raise FileNotFoundError("Archivo SQL no encontrado")
+
+            with self._checkout() as conn:
+                conn.execute("PRAGMA foreign_keys = OFF")
+                objetos = conn.execute(
+                    "SELECT type, name FROM main.sqlite_master "
+                    "WHERE type IN ('table', 'view') AND name NOT LIKE 'sqlite_%'"
+                ).fetchall()
+                for tipo, nombre in objetos:
+                    conn.execute(f'DROP {tipo.upper()} IF EXISTS main."{nombre}"')
+                conn.executescript(ruta.read_text(encoding="utf-8"))
+                conn.execute("PRAGMA foreign_keys = ON")
+                self._instalar_triggers()
+
+            self.cache.clear()
+            print("✅ Base de datos importada correctamente.")
+            self._avisar(page, "Importación Exitosa", "La base de datos fue importada correctamente.")
+            return True
+        except Exception as e:
+            print(f"❌ Error al importar la base de datos: {e}")
+            self._avisar(page, "Error de Importación", str(e))
+            return False
+
+    @staticmethod
+    def _avisar(page, titulo: str, mensaje: str) -> None:
+        # Import local: sin interfaz (pruebas, benchmarks) no se necesita flet
+        if page:
+            from app.views.containers.messages import mostrar_mensaje
+            mostrar_mensaje(page, titulo, mensaje)
@@ -0,0 +1,110 @@
+import re
+from app.core.interfaces.database import get_database
+from app.core.interfaces.query_stats import fingerprint
+
+_RE_EXPLICABLE = re.compile(r"^\s*(SELECT|UPDATE|DELETE)\b", re.I)
+_RE_CALL = re.compile(r"^CALL\s+(\w+)$", re.I)
+
+# EXPLAIN no entra en los procedimientos: se analizan sus consultas equivalentes,
+# con los parámetros reales de una llamada registrada.
+CONSULTAS_PROCEDIMIENTOS = {
+    "horas_trabajadas_para_pagos": [
+        (
+            """
+            SELECT a.numero_nomina, e.nombre_completo, SUM(TIME_TO_SEC(a.tiempo_trabajo))
+            FROM asistencias a
+            JOIN empleados e ON a.numero_nomina = e.numero_nomina
+            WHERE a.numero_nomina = %s
+            AND a.fecha BETWEEN %s AND %s
+            AND a.estado = 'completo'
+            GROUP BY a.numero_nomina, e.nombre_completo
+            """,
+            lambda p: (p[0], p[1], p[2]) if p[0] is not None else None,
+        ),
+        (
+            """
+            SELECT a.numero_nomina, e.nombre_completo, SUM(TIME_TO_SEC(a.tiempo_trabajo))
+            FROM asistencias a
+            JOIN empleados e ON a.numero_nomina = e.numero_nomina
+            WHERE a.fecha BETWEEN %s AND %s
+            AND a.estado = 'completo'
+            GROUP BY a.numero_nomina, e.nombre_completo
+            """,
+            lambda p: (p[1], p[2]),
+        ),
+    ],
+}
+
+
+class IndexAdvisor:
+    """
+    Ejecuta EXPLAIN sobre las consultas que la aplicación ya ejecutó (una muestra real
+    por huella, tomada de `QueryStats`) y señala las que recorren tablas completas.
+    """
+
+    def __init__(self, db=None):
+        self.db = db or get_database()
+
+    def consultas_registradas(self) -> list:
+        """
+        Muestras `(query, params)` explicables, incluidas las de procedimientos.
+        Se omiten las sentencias sin parámetros: listados completos y mantenimiento
+        (migraciones), donde recorrer la tabla es lo esperado.
+        """
+        consultas = []
+        for query, params in self.db.stats.muestras():
+            if not params:
+                continue
+            m = _RE_CALL.match(query.strip())
+            if m:
+                for sql, armar in CONSULTAS_PROCEDIMIENTOS.get(m.group(1), ()):
+                    argumentos = armar(params) if len(params) >= 3 else None
+                    if argumentos is not None:
+                        consultas.append((sql, argumentos))
+            elif _RE_EXPLICABLE.match(query):
+                consultas.append((query, params))
+        return consultas
+
+    def analizar(self, consultas: list = None) -> list:
+        """
+        Devuelve una entrada por consulta: `fingerprint`, `plan`, `full_scans`
+        (tablas recorridas completas) y `error` si EXPLAIN falló.
+        Las consultas con recorridos completos quedan primero.
+        """
+        if consultas is None:
+            consultas = self.consultas_registradas()
+
+        resultados = []
+        for query, params in consultas:
+            entrada = {"fingerprint": fingerprint(query), "plan": [], "full_scans": [], "error": None}
+            try:
+                entrada["plan"] = self.db.explain(query, params)
+                entrada["full_scans"] = [p["tabla"] for p in entrada["plan"] if p["full_scan"]]
+            except Exception as e:
+                entrada["error"] = str(e)
+            resultados.append(entrada)
+
+        resultados.sort(key=lambda r: (len(r["full_scans"]), r["error"] is not None), reverse=True)
+        return resultados
+
+    def reporte(self, resultados: list = None) -> str:
+        """Texto legible con las consultas que requieren atención."""
+        if resultados is None:
+            resultados = self.analizar()
+
+        lineas = []
+        for r in resultados:
+            if r["error"]:
+                lineas.append(f"⚠️ No se pudo analizar: {r['fingerprint'][:120]}\n    {r['error']}")
+            elif r["full_scans"]:
+                lineas.append(f"❌ Recorrido completo de {', '.join(r['full_scans'])}: {r['fingerprint'][:120]}")
+                for p in r["plan"]:
+                    lineas.append(
+                        f"    {p['tabla']}: acceso={p['acceso']} índice={p['indice'] or '-'} "
+                        f"filas={p['filas'] if p['filas'] is not None else '?'} {p['detalle']}"
+                    )
+
+        revisadas = sum(1 for r in resultados if not r["error"])
+        con_escaneo = sum(1 for r in resultados if r["full_scans"])
+        lineas.append(f"✅ {revisadas} consultas analizadas, {con_escaneo} con recorridos completos.")
+        return "\n".join(lineas)
@@ -0,0 +1,64 @@
+from collections import OrderedDict
+
+
+class PreparedStatementCache:
+    """
+    LRU de sentencias preparadas en el servidor para una conexión.
+    Cada SQL distinto tiene su propio cursor preparado; al re-ejecutar el mismo
+    texto el servidor reutiliza el plan y solo recibe los parámetros.
+    Al superar `size` se cierra el cursor menos usado (DEALLOCATE en el servidor).
+    """
+
+    ATRIBUTO = "_prepared_cache"
+
+    def __init__(self, conn, size: int = 64):
+        self.conn = conn
+        self.size = size
+        self._cursores: OrderedDict = OrderedDict()
+
+    @classmethod
+    def for_connection(cls, conn, size: int = 64) -> "PreparedStatementCache":
+        """Devuelve la caché asociada a `conn`, creándola la primera vez."""
+        cache = getattr(conn, cls.ATRIBUTO, None)
+        if cache is None:
+            cache = cls(conn, size)
+            setattr(conn, cls.ATRIBUTO, cache)
+        return cache
+
+    def get(self, query: str):
+        """
+        Devuelve `(cursor, hit)`: el cursor preparado para `query` y si ya
+        estaba en la caché.
+        """
+        cursor = self._cursores.get(query)
+        if cursor is not None:
+            self._cursores.move_to_end(query)
+            return cursor, True
+
+        cursor = self.conn.cursor(prepared=True)
+        self._cursores[query] = cursor
+        while len(self._cursores) > self.size:
+            _, viejo = self._cursores.popitem(last=False)
+            self._cerrar(viejo)
+        return cursor, False
+
+    def discard(self, query: str) -> None:
+        """Elimina de la caché un cursor que quedó en estado inválido."""
+        cursor = self._cursores.pop(query, None)
+        if cursor is not None:
+            self._cerrar(cursor)
+
+    def clear(self) -> None:
+        while self._cursores:
+            _, cursor = self._cursores.popitem()
+            self._cerrar(cursor)
+
+    def __len__(self) -> int:
+        return len(self._cursores)
+
+    @staticmethod
+    def _cerrar(cursor) -> None:
+        try:
+            cursor.close()
+        except Exception:
+            pass
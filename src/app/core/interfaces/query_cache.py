@@ -0,0 +1,174 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from functools import lru_cache
+from app.config.config import DB_CACHE_SIZE, DB_CACHE_TTL
+
+
+_RE_TABLAS_LEIDAS = re.compile(r"\b(?:FROM|JOIN)\s+`?(\w+)`?", re.I)
+_RE_TABLAS_ESCRITAS = re.compile(
+    r"^\s*(?:INSERT(?:\s+IGNORE)?\s+INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM"
+    r"|TRUNCATE(?:\s+TABLE)?|ALTER\s+TABLE|DROP\s+TABLE(?:\s+IF\s+EXISTS)?)\s+`?(\w+)`?",
+    re.I
+)
+_RE_BORRADO = re.compile(r"^\s*(DELETE|TRUNCATE|DROP|ALTER)\b", re.I)
+
+
+@lru_cache(maxsize=1024)
+def tablas_leidas(query: str) -> frozenset:
+    """Tablas que aparecen en FROM/JOIN de una consulta."""
+    return frozenset(t.lower() for t in _RE_TABLAS_LEIDAS.findall(query))
+
+
+@lru_cache(maxsize=1024)
+def tablas_escritas(query: str) -> frozenset | None:
+    """
+    Tablas que modifica una sentencia. Devuelve None cuando el efecto puede alcanzar
+    a otras tablas (DELETE/DROP/ALTER con ON DELETE CASCADE) y conviene vaciar toda la caché.
+    """
+    if _RE_BORRADO.match(query):
+        return None
+    return frozenset(t.lower() for t in _RE_TABLAS_ESCRITAS.findall(query))
+
+
+class QueryCache:
+    """
+    Caché de resultados de lectura (opcional por consulta), con clave SQL + parámetros.
+    Cada entrada queda etiquetada con las tablas que lee; una escritura sobre
+    cualquiera de ellas la invalida. Límite de tamaño (LRU) y de antigüedad (TTL).
+    Cada tabla lleva un número de generación que sube al invalidarla: quien lee de la base
+    de datos toma `generacion(query)` antes de consultar y `put` no guarda el resultado si
+    una escritura confirmada en medio lo dejó viejo.
+    """
+
+    def __init__(self, max_entries: int = DB_CACHE_SIZE, ttl: float = DB_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entradas: OrderedDict = OrderedDict()
+        self._por_tabla: dict = {}
+        self._generaciones: dict = {}
+        self._generacion_global = 0
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0, "expired": 0, "stale": 0}
+        self._oyentes = []
+
+    @staticmethod
+    def clave(query: str, params, dictionary: bool) -> tuple:
+        # Parámetros con nombre: la clave lleva nombres y valores, no solo los nombres
+        if isinstance(params, Mapping):
+            return query, tuple(sorted(params.items())), dictionary
+        return query, tuple(params or ()), dictionary
+
+    def generacion(self, query: str) -> tuple:
+        """Estado de las tablas que lee `query`, para pasarlo a `put` tras la lectura."""
+        with self._lock:
+            return self._generacion_de(tablas_leidas(query))
+
+    def _generacion_de(self, tablas) -> tuple:
+        return self._generacion_global, tuple(sorted((t, self._generaciones.get(t, 0)) for t in tablas))
+
+    @staticmethod
+    def _copia(rows):
+        # Los llamadores pueden modificar las filas: la caché guarda y entrega copias
+        if isinstance(rows, list):
+            return [dict(r) if isinstance(r, dict) else r for r in rows]
+        return rows
+
+    def get(self, clave: tuple):
+        """Devuelve `(hit, valor)`."""
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is None:
+                self._stats["misses"] += 1
+                return False, None
+
+            expira, _, valor = entrada
+            if expira < time.monotonic():
+                self._quitar(clave)
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return False, None
+
+            self._entradas.move_to_end(clave)
+            self._stats["hits"] += 1
+            return True, self._copia(valor)
+
+    def put(self, clave: tuple, query: str, valor, ttl: float | None = None, generacion: tuple = None) -> None:
+        tablas = tablas_leidas(query)
+        with self._lock:
+            if generacion is not None and generacion != self._generacion_de(tablas):
+                # Una escritura invalidó estas tablas durante la lectura
+                self._stats["stale"] += 1
+                return
+            self._quitar(clave)
+            self._entradas[clave] = (time.monotonic() + (ttl or self.ttl), tablas, self._copia(valor))
+            for tabla in tablas:
+                self._por_tabla.setdefault(tabla, set()).add(clave)
+            while len(self._entradas) > self.max_entries:
+                viejo = next(iter(self._entradas))
+                self._quitar(viejo)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, query: str) -> None:
+        """Invalida las entradas que leen las tablas que modifica `query`."""
+        tablas = tablas_escritas(query)
+        if tablas is None:
+            self.clear()
+            return
+        self.invalidate_tables(tablas)
+
+    def invalidate_tables(self, tablas) -> None:
+        with self._lock:
+            for tabla in tablas:
+                self._generaciones[tabla] = self._generaciones.get(tabla, 0) + 1
+                for clave in list(self._por_tabla.get(tabla, ())):
+                    self._quitar(clave)
+                    self._stats["invalidations"] += 1
+        self._notificar(frozenset(tablas))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._stats["invalidations"] += len(self._entradas)
+            self._generacion_global += 1
+            self._entradas.clear()
+            self._por_tabla.clear()
+        self._notificar(None)
+
+    def on_invalidate(self, callback) -> None:
+        """
+        Registra `callback(tablas)`, llamado tras cada invalidación con las tablas
+        modificadas (None cuando se vacía toda la caché). Permite que otras cachés
+        en memoria se invaliden con las mismas escrituras.
+        """
+        if callback not in self._oyentes:
+            self._oyentes.append(callback)
+
+    def _notificar(self, tablas) -> None:
+        for callback in list(self._oyentes):
+            try:
+                callback(tablas)
+            except Exception as e:
+                print(f"⚠️ Error en oyente de invalidación de caché: {e}")
+
+    def _quitar(self, clave: tuple) -> None:
+        entrada = self._entradas.pop(clave, None)
+        if entrada is None:
+            return
+        for tabla in entrada[1]:
+            claves = self._por_tabla.get(tabla)
+            if claves is not None:
+                claves.discard(clave)
+                if not claves:
+                    del self._por_tabla[tabla]
+
+    def stats(self) -> dict:
+        with self._lock:
+            data = dict(self._stats)
+            data["size"] = len(self._entradas)
+        total = data["hits"] + data["misses"]
+        data["hit_rate"] = round(data["hits"] / total, 4) if total else 0.0
+        data["max_entries"] = self.max_entries
+        data["ttl"] = self.ttl
+        return data
@@ -0,0 +1,225 @@
+import json
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache, wraps
+from app.helpers.class_singleton import class_singleton
+from app.config.config import DB_SLOW_QUERY_MS, DB_N1_THRESHOLD
+
+
+_RE_COMENTARIOS = re.compile(r"(--[^\n]*|/\*.*?\*/)", re.S)
+_RE_CADENAS = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_RE_NUMEROS = re.compile(r"\b\d+(?:\.\d+)?\b")
+_RE_PARAMS = re.compile(r"%s|%\(\w+\)s|\?")
+_RE_LISTAS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_RE_VALUES = re.compile(r"(values\s*\(\?\+?\))(?:\s*,\s*\(\?\+?\))+")
+_RE_ESPACIOS = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(query: str) -> str:
+    """
+    Normaliza una sentencia SQL para agrupar consultas equivalentes:
+    literales y parámetros se vuelven `?`, las listas `IN (?, ?, ...)` se colapsan
+    y los espacios se compactan.
+    """
+    sql = _RE_COMENTARIOS.sub(" ", query)
+    sql = _RE_CADENAS.sub("?", sql)
+    sql = _RE_PARAMS.sub("?", sql)
+    sql = _RE_NUMEROS.sub("?", sql)
+    sql = _RE_ESPACIOS.sub(" ", sql).strip().lower()
+    sql = _RE_LISTAS.sub("(?+)", sql)
+    sql = _RE_VALUES.sub(r"\1", sql)
+    return sql
+
+
+@class_singleton
+class QueryStats:
+    """
+    Registro en memoria de latencia y filas por huella (fingerprint) de SQL,
+    consultas lentas y conteo de consultas por acción de la interfaz.
+    """
+
+    def __init__(self, slow_ms: float = DB_SLOW_QUERY_MS, n1_threshold: int = DB_N1_THRESHOLD):
+        self.slow_ms = slow_ms
+        self.n1_threshold = n1_threshold
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._queries = {}
+            self._actions = {}
+            self._slow = deque(maxlen=100)
+            self._muestras = {}
+            self._desde = datetime.now()
+
+    # --------------------------------------------------------
+    # Registro
+    # --------------------------------------------------------
+
+    def record(self, query: str, elapsed: float, rows: int = 0, error: bool = False, params=None) -> None:
+        """
+        Registra una ejecución. `elapsed` en segundos.
+        Con `params` se guarda en memoria (no se exporta) la primera ejecución de
+        cada huella como muestra para analizar su plan con EXPLAIN.
+        """
+        fp = fingerprint(query)
+        ms = elapsed * 1000
+
+        with self._lock:
+            q = self._queries.get(fp)
+            if q is None:
+                q = self._queries[fp] = {
+                    "count": 0, "errors": 0, "rows": 0,
+                    "total_ms": 0.0, "max_ms": 0.0, "min_ms": None
+                }
+            q["count"] += 1
+            q["rows"] += max(rows or 0, 0)
+            q["total_ms"] += ms
+            q["max_ms"] = max(q["max_ms"], ms)
+            q["min_ms"] = ms if q["min_ms"] is None else min(q["min_ms"], ms)
+            if error:
+                q["errors"] += 1
+            if params is not None and fp not in self._muestras:
+                self._muestras[fp] = (query, tuple(params))
+
+            if ms >= self.slow_ms:
+                self._slow.append({
+                    "fingerprint": fp,
+                    "ms": round(ms, 2),
+                    "rows": rows,
+                    "at": datetime.now().isoformat(timespec="seconds")
+                })
+
+        if ms >= self.slow_ms:
+            print(f"🐢 Query lenta ({ms:.1f} ms, {rows} filas): {fp[:160]}")
+
+        for scope in getattr(self._local, "scopes", ()):
+            scope["queries"] += 1
+            scope["fingerprints"][fp] = scope["fingerprints"].get(fp, 0) + 1
+
+    def record_counter(self, query: str, counter: str, amount: int = 1) -> None:
+        """Suma un contador adicional (p. ej. aciertos de caché) a la huella de `query`."""
+        fp = fingerprint(query)
+        with self._lock:
+            q = self._queries.setdefault(fp, {
+                "count": 0, "errors": 0, "rows": 0,
+                "total_ms": 0.0, "max_ms": 0.0, "min_ms": None
+            })
+            q[counter] = q.get(counter, 0) + amount
+
+    # --------------------------------------------------------
+    # Acciones de interfaz
+    # --------------------------------------------------------
+
+    @contextmanager
+    def action(self, name: str):
+        """
+        Cuenta las consultas ejecutadas dentro del bloque y las asocia a `name`.
+        Si una misma huella se repite `n1_threshold` veces o más, se reporta como posible N+1.
+        """
+        scopes = getattr(self._local, "scopes", None)
+        if scopes is None:
+            scopes = self._local.scopes = []
+
+        scope = {"queries": 0, "fingerprints": {}}
+        scopes.append(scope)
+        inicio = time.perf_counter()
+        try:
+            yield scope
+        finally:
+            scopes.remove(scope)
+            ms = (time.perf_counter() - inicio) * 1000
+            repetidas = {
+                fp: n for fp, n in scope["fingerprints"].items() if n >= self.n1_threshold
+            }
+
+            with self._lock:
+                a = self._actions.get(name)
+                if a is None:
+                    a = self._actions[name] = {
+                        "calls": 0, "queries": 0, "max_queries": 0,
+                        "total_ms": 0.0, "last_queries": 0, "n_plus_one": {}
+                    }
+                a["calls"] += 1
+                a["queries"] += scope["queries"]
+                a["last_queries"] = scope["queries"]
+                a["max_queries"] = max(a["max_queries"], scope["queries"])
+                a["total_ms"] += ms
+                for fp, n in repetidas.items():
+                    a["n_plus_one"][fp] = max(a["n_plus_one"].get(fp, 0), n)
+
+            for fp, n in repetidas.items():
+                print(f"🔁 Posible N+1 en '{name}': {n} ejecuciones de {fp[:120]}")
+
+    # --------------------------------------------------------
+    # Consulta y exportación
+    # --------------------------------------------------------
+
+    def muestras(self) -> list:
+        """Pares `(query, params)`: una ejecución real por huella registrada."""
+        with self._lock:
+            return list(self._muestras.values())
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            queries = []
+            for fp, q in self._queries.items():
+                item = dict(q, fingerprint=fp)
+                item["avg_ms"] = round(q["total_ms"] / q["count"], 3) if q["count"] else 0.0
+                item["total_ms"] = round(q["total_ms"], 3)
+                item["max_ms"] = round(q["max_ms"], 3)
+                item["min_ms"] = round(q["min_ms"], 3) if q["min_ms"] is not None else None
+                queries.append(item)
+            queries.sort(key=lambda x: x["total_ms"], reverse=True)
+
+            actions = []
+            for name, a in self._actions.items():
+                item = dict(a, action=name, n_plus_one=dict(a["n_plus_one"]))
+                item["avg_queries"] = round(a["queries"] / a["calls"], 2) if a["calls"] else 0
+                item["total_ms"] = round(a["total_ms"], 3)
+                actions.append(item)
+            actions.sort(key=lambda x: x["queries"], reverse=True)
+
+            return {
+                "since": self._desde.isoformat(timespec="seconds"),
+                "slow_threshold_ms": self.slow_ms,
+                "queries": queries,
+                "actions": actions,
+                "slow": list(self._slow),
+            }
+
+    def dump_json(self, path: str, extra: dict | None = None) -> bool:
+        """Escribe el estado actual de las estadísticas en un archivo JSON."""
+        try:
+            data = self.snapshot()
+            if extra:
+                data.update(extra)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            print(f"✅ Estadísticas de queries exportadas a: {path}")
+            return True
+        except Exception as e:
+            print(f"❌ Error al exportar estadísticas: {e}")
+            return False
+
+
+def medir_accion(name: str):
+    """
+    Decorador que cuenta las consultas de una acción de interfaz:
+
+        @medir_accion("PagosContainer._cargar_pagos")
+        def _cargar_pagos(self): ...
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with QueryStats().action(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
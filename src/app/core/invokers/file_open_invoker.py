@@ -1,11 +1,14 @@
+import os
 import flet as ft
 from flet import FilePicker, FilePickerResultEvent
 
 class FileOpenInvoker:
     """
     Módulo genérico para seleccionar un archivo desde diálogo nativo.
-    - `on_select`: callback que recibe la ruta seleccionada.
+    - `on_select`: callback que recibe la ruta seleccionada
+      (con `allow_multiple=True`, la lista de rutas).
     - `allowed_extensions`: lista de extensiones permitidas (sin punto).
+    - `allow_multiple`: permite elegir varios archivos o una carpeta (`open_directory`).
     """
     def __init__(
         self,
@@ -13,11 +16,13 @@ class FileOpenInvoker:
         on_select: callable,
         dialog_title: str = "Selecciona un archivo",
         allowed_extensions: list[str] | None = None,
+        allow_multiple: bool = False,
     ):
         self.page = page
         self.on_select = on_select
         self.dialog_title = dialog_title
         self.allowed_extensions = allowed_extensions or []
+        self.allow_multiple = allow_multiple
 
         self.picker = FilePicker(on_result=self._on_result)
 
@@ -32,18 +37,49 @@ class FileOpenInvoker:
 
         self.picker.pick_files(
             dialog_title=self.dialog_title,
-            allow_multiple=False,
+            allow_multiple=self.allow_multiple,
             allowed_extensions=[
                 ext.lower().lstrip(".") for ext in self.allowed_extensions
             ]
         )
 
+    def open_directory(self) -> None:
+        """Abre el diálogo para elegir una carpeta; se seleccionan sus archivos con extensión permitida."""
+        if not self.allow_multiple:
+            raise ValueError("open_directory requiere allow_multiple=True")
+        if self.picker not in self.page.overlay:
+            self.page.overlay.append(self.picker)
+            self.page.update()
+
+        self.picker.get_directory_path(dialog_title=self.dialog_title)
+
+    def _archivos_de_carpeta(self, carpeta: str) -> list[str]:
+        extensiones = {"." + ext.lower().lstrip(".") for ext in self.allowed_extensions}
+        return sorted(
+            os.path.join(carpeta, nombre)
+            for nombre in os.listdir(carpeta)
+            if os.path.isfile(os.path.join(carpeta, nombre))
+            and not nombre.startswith("~$")  # archivos de bloqueo de Excel
+            and (not extensiones or os.path.splitext(nombre)[1].lower() in extensiones)
+        )
+
     def _on_result(self, e: FilePickerResultEvent) -> None:
+        # Selección de carpeta (get_directory_path)
+        if e.path and not e.files:
+            archivos = self._archivos_de_carpeta(e.path)
+            if archivos:
+                self.on_select(archivos)
+            else:
+                print(f"⚠️ La carpeta no contiene archivos {self.allowed_extensions}: {e.path}")
+            return
+
         if not e.files:
             return
 
-        selected = e.files[0].path
-        self.on_select(selected)
+        if self.allow_multiple:
+            self.on_select([f.path for f in e.files])
+        else:
+            self.on_select(e.files[0].path)
 
     def get_open_button(
         self,
@@ -1,6 +1,6 @@
 import flet as ft
 from flet import FilePicker, FilePickerResultEvent
-from app.core.interfaces.database_mysql import DatabaseMysql
+from app.core.interfaces.database import get_database
 
 
 class FileSaveInvoker:
@@ -26,7 +26,7 @@ class FileSaveInvoker:
         self.allowed_extensions = allowed_extensions or []
         self.import_extensions = import_extensions or []
 
-        self.db = DatabaseMysql()
+        self.db = get_database()
 
         self.save_picker = FilePicker(on_result=self._on_save_result)
         self.import_picker = FilePicker(on_result=self._on_import_result)
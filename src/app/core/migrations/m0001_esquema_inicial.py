@@ -0,0 +1,216 @@
+from app.core.enums.e_employes_model import E_EMPLOYE
+from app.core.enums.e_user_model import E_USER
+from app.core.enums.e_assistance_model import E_ASSISTANCE
+from app.core.enums.e_prestamos_model import E_PRESTAMOS
+from app.core.enums.e_payment_model import E_PAYMENT
+from app.core.enums.e_discount_model import E_DISCOUNT
+from app.core.enums.e_loan_payment_model import E_PAGOS_PRESTAMO
+from app.core.enums.e_performance_model import E_PERFORMANCE
+from app.core.enums.e_weekly_report_model import E_WEEKLY_REPORT
+from app.core.enums.e_descuento_detalles_model import E_DESCUENTO_DETALLES
+from app.core.enums.e_detalles_pagos_prestamo_model import E_DETALLES_PAGOS_PRESTAMO
+from app.core.migrations.migration import Migration
+
+
+# Tablas en orden de dependencia (llaves foráneas)
+EMPLEADOS = f"""
+CREATE TABLE IF NOT EXISTS {E_EMPLOYE.TABLE.value} (
+    {E_EMPLOYE.NUMERO_NOMINA.value} SMALLINT UNSIGNED PRIMARY KEY,
+    {E_EMPLOYE.NOMBRE_COMPLETO.value} VARCHAR(255) NOT NULL,
+    {E_EMPLOYE.ESTADO.value} ENUM('activo','inactivo') NOT NULL,
+    {E_EMPLOYE.TIPO_TRABAJADOR.value} ENUM('taller','externo','no definido') NOT NULL,
+    {E_EMPLOYE.SUELDO_POR_HORA.value} DECIMAL(8,2) NOT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+USUARIOS = f"""
+CREATE TABLE IF NOT EXISTS {E_USER.TABLE.value} (
+    {E_USER.ID.value} INT AUTO_INCREMENT PRIMARY KEY,
+    {E_USER.USERNAME.value} VARCHAR(100) NOT NULL UNIQUE,
+    {E_USER.PASSWORD.value} VARCHAR(255) NOT NULL,
+    {E_USER.ROLE.value} ENUM('root','user') NOT NULL DEFAULT 'user',
+    {E_USER.FECHA_CREACION.value} TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    {E_USER.FECHA_MODIFICACION.value} TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+ASISTENCIAS = f"""
+CREATE TABLE IF NOT EXISTS {E_ASSISTANCE.TABLE.value} (
+    id_asistencia INT AUTO_INCREMENT PRIMARY KEY,
+    numero_nomina SMALLINT UNSIGNED NOT NULL,
+    fecha DATE NOT NULL,
+    hora_entrada TIME,
+    hora_salida TIME,
+    retardo TIME,
+    estado VARCHAR(20),
+    tiempo_trabajo TIME,
+    fecha_generada DATE DEFAULT NULL,
+    FOREIGN KEY (numero_nomina) REFERENCES empleados(numero_nomina) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+PRESTAMOS = f"""
+CREATE TABLE IF NOT EXISTS {E_PRESTAMOS.TABLE.value} (
+    {E_PRESTAMOS.PRESTAMO_ID.value} INT AUTO_INCREMENT PRIMARY KEY,
+    {E_PRESTAMOS.PRESTAMO_NUMERO_NOMINA.value} SMALLINT UNSIGNED NOT NULL,
+    {E_PRESTAMOS.PRESTAMO_MONTO.value} DECIMAL(10,2) NOT NULL,
+    {E_PRESTAMOS.PRESTAMO_SALDO.value} DECIMAL(10,2) NOT NULL,
+    {E_PRESTAMOS.PRESTAMO_ESTADO.value} ENUM('pagando','terminado') NOT NULL,
+    {E_PRESTAMOS.PRESTAMO_FECHA_SOLICITUD.value} DATE NOT NULL,
+    {E_PRESTAMOS.PRESTAMO_FECHA_CREACION.value} TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    {E_PRESTAMOS.PRESTAMO_FECHA_MODIFICACION.value} TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY ({E_PRESTAMOS.PRESTAMO_NUMERO_NOMINA.value}) REFERENCES empleados(numero_nomina) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+PAGOS = f"""
+CREATE TABLE IF NOT EXISTS {E_PAYMENT.TABLE.value} (
+    {E_PAYMENT.ID.value} INT AUTO_INCREMENT PRIMARY KEY,
+    {E_PAYMENT.NUMERO_NOMINA.value} SMALLINT UNSIGNED NOT NULL,
+    {E_PAYMENT.FECHA_PAGO.value} DATE NOT NULL,
+    {E_PAYMENT.TOTAL_HORAS_TRABAJADAS.value} DECIMAL(5,2) DEFAULT 0,
+    {E_PAYMENT.MONTO_BASE.value} DECIMAL(10,2) NOT NULL,
+    {E_PAYMENT.MONTO_TOTAL.value} DECIMAL(10,2) NOT NULL,
+    {E_DISCOUNT.MONTO_DESCUENTO.value} DECIMAL(10,2) DEFAULT 0,
+    {E_PRESTAMOS.PRESTAMO_MONTO.value} DECIMAL(10,2) DEFAULT 0,
+    {E_PAYMENT.SALDO.value} DECIMAL(10,2) DEFAULT 0,
+    {E_PAYMENT.PAGO_DEPOSITO.value} DECIMAL(10,2) NOT NULL,
+    {E_PAYMENT.PAGO_EFECTIVO.value} DECIMAL(10,2) NOT NULL,
+    {E_PAYMENT.ESTADO.value} VARCHAR(20) DEFAULT 'pendiente',
+    fecha_creacion TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    fecha_modificacion TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY ({E_PAYMENT.NUMERO_NOMINA.value})
+        REFERENCES empleados(numero_nomina)
+        ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+DESCUENTOS = f"""
+CREATE TABLE IF NOT EXISTS {E_DISCOUNT.TABLE.value} (
+    {E_DISCOUNT.ID.value} INT AUTO_INCREMENT PRIMARY KEY,
+    numero_nomina SMALLINT UNSIGNED NOT NULL,
+    {E_DISCOUNT.ID_PAGO.value} INT DEFAULT NULL,
+    {E_DISCOUNT.TIPO.value} VARCHAR(50) NOT NULL,
+    {E_DISCOUNT.DESCRIPCION.value} VARCHAR(100) DEFAULT NULL,
+    {E_DISCOUNT.MONTO_DESCUENTO.value} DECIMAL(10,2) NOT NULL,
+    {E_DISCOUNT.FECHA_APLICACION.value} DATE NOT NULL DEFAULT (CURRENT_DATE),
+    {E_DISCOUNT.FECHA_CREACION.value} TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (numero_nomina) REFERENCES empleados(numero_nomina) ON DELETE CASCADE,
+    FOREIGN KEY ({E_DISCOUNT.ID_PAGO.value}) REFERENCES pagos(id_pago) ON DELETE SET NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+PAGOS_PRESTAMO = f"""
+CREATE TABLE IF NOT EXISTS {E_PAGOS_PRESTAMO.TABLE.value} (
+    {E_PAGOS_PRESTAMO.PAGO_ID.value} INT AUTO_INCREMENT PRIMARY KEY,
+    {E_PAGOS_PRESTAMO.PAGO_ID_PRESTAMO.value} INT NOT NULL,
+    {E_PAGOS_PRESTAMO.PAGO_ID_NOMINA.value} INT NOT NULL,
+    {E_PAGOS_PRESTAMO.PAGO_MONTO_PAGADO.value} DECIMAL(10,2) NOT NULL,
+    {E_PAGOS_PRESTAMO.PAGO_FECHA_PAGO.value} DATE NOT NULL,
+    {E_PAGOS_PRESTAMO.PAGO_FECHA_REAL.value} DATE,
+    {E_PAGOS_PRESTAMO.PAGO_APLICADO.value} BOOLEAN NOT NULL DEFAULT 0,
+    {E_PAGOS_PRESTAMO.PAGO_INTERES_PORCENTAJE.value} INT NOT NULL,
+    {E_PAGOS_PRESTAMO.PAGO_INTERES_APLICADO.value} DECIMAL(10,2) NOT NULL,
+    {E_PAGOS_PRESTAMO.PAGO_DIAS_RETRASO.value} INT DEFAULT 0,
+    {E_PAGOS_PRESTAMO.PAGO_SALDO_RESTANTE.value} DECIMAL(10,2),
+    {E_PAGOS_PRESTAMO.PAGO_OBSERVACIONES.value} TEXT,
+    FOREIGN KEY ({E_PAGOS_PRESTAMO.PAGO_ID_PRESTAMO.value})
+        REFERENCES {E_PRESTAMOS.TABLE.value}({E_PRESTAMOS.PRESTAMO_ID.value})
+        ON DELETE CASCADE,
+    FOREIGN KEY ({E_PAGOS_PRESTAMO.PAGO_ID_NOMINA.value})
+        REFERENCES pagos(id_pago)
+        ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+DESEMPENO = f"""
+CREATE TABLE IF NOT EXISTS {E_PERFORMANCE.TABLE.value} (
+    {E_PERFORMANCE.ID.value} INT AUTO_INCREMENT PRIMARY KEY,
+    {E_PERFORMANCE.NUMERO_NOMINA.value} SMALLINT UNSIGNED NOT NULL,
+    {E_PERFORMANCE.PUNTUALIDAD.value} TINYINT UNSIGNED CHECK ({E_PERFORMANCE.PUNTUALIDAD.value} BETWEEN 0 AND 100),
+    {E_PERFORMANCE.EFICIENCIA.value} DECIMAL(5,2),
+    {E_PERFORMANCE.BONIFICACION.value} DECIMAL(10,2),
+    {E_PERFORMANCE.HISTORIAL_FALTAS.value} JSON,
+    fecha_creacion TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    fecha_modificacion TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY ({E_PERFORMANCE.NUMERO_NOMINA.value})
+        REFERENCES empleados(numero_nomina)
+        ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+REPORTES_SEMANALES = f"""
+CREATE TABLE IF NOT EXISTS {E_WEEKLY_REPORT.TABLE.value} (
+    {E_WEEKLY_REPORT.ID.value} INT AUTO_INCREMENT PRIMARY KEY,
+    {E_WEEKLY_REPORT.NUMERO_NOMINA.value} SMALLINT UNSIGNED NOT NULL,
+    {E_WEEKLY_REPORT.FECHA_INICIO.value} DATE NOT NULL,
+    {E_WEEKLY_REPORT.FECHA_FIN.value} DATE NOT NULL,
+    {E_WEEKLY_REPORT.TOTAL_HORAS_TRABAJADAS.value} DECIMAL(10,2) NOT NULL,
+    {E_WEEKLY_REPORT.TOTAL_DEUDAS.value} DECIMAL(10,2) NOT NULL,
+    {E_WEEKLY_REPORT.TOTAL_ABONADO.value} DECIMAL(10,2) NOT NULL,
+    {E_WEEKLY_REPORT.SALDO_FINAL.value} DECIMAL(10,2) NOT NULL,
+    {E_WEEKLY_REPORT.TOTAL_EFECTIVO.value} DECIMAL(10,2) NOT NULL,
+    {E_WEEKLY_REPORT.TOTAL_TARJETA.value} DECIMAL(10,2) NOT NULL,
+    fecha_creacion TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    fecha_modificacion TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY ({E_WEEKLY_REPORT.NUMERO_NOMINA.value})
+        REFERENCES empleados(numero_nomina)
+        ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+DESCUENTO_DETALLES = f"""
+CREATE TABLE IF NOT EXISTS {E_DESCUENTO_DETALLES.TABLE.value} (
+    id_detalle INT AUTO_INCREMENT PRIMARY KEY,
+    id_pago INT NOT NULL,
+
+    aplicado_imss BOOLEAN DEFAULT FALSE,
+    monto_imss DECIMAL(10,2) DEFAULT 50.0,
+
+    aplicado_transporte BOOLEAN DEFAULT FALSE,
+    monto_transporte DECIMAL(10,2) DEFAULT 0.0,
+
+    aplicado_comida BOOLEAN DEFAULT FALSE,
+    monto_comida DECIMAL(10,2) DEFAULT 0.0,
+
+    aplicado_extra BOOLEAN DEFAULT FALSE,
+    descripcion_extra VARCHAR(100) DEFAULT '',
+    monto_extra DECIMAL(10,2) DEFAULT 0.0,
+
+    FOREIGN KEY (id_pago) REFERENCES pagos(id_pago) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+DETALLES_PAGOS_PRESTAMO = f"""
+CREATE TABLE IF NOT EXISTS {E_DETALLES_PAGOS_PRESTAMO.TABLE.value} (
+    {E_DETALLES_PAGOS_PRESTAMO.ID.value} INT AUTO_INCREMENT PRIMARY KEY,
+    {E_DETALLES_PAGOS_PRESTAMO.ID_PAGO.value} INT NOT NULL,
+    {E_DETALLES_PAGOS_PRESTAMO.ID_PRESTAMO.value} INT NOT NULL,
+    {E_DETALLES_PAGOS_PRESTAMO.MONTO_GUARDADO.value} DECIMAL(10,2),
+    {E_DETALLES_PAGOS_PRESTAMO.INTERES_GUARDADO.value} INT,
+    {E_DETALLES_PAGOS_PRESTAMO.OBSERVACIONES.value} TEXT,
+    {E_DETALLES_PAGOS_PRESTAMO.FECHA.value} DATETIME DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE KEY uk_pago_prestamo ({E_DETALLES_PAGOS_PRESTAMO.ID_PAGO.value}, {E_DETALLES_PAGOS_PRESTAMO.ID_PRESTAMO.value}),
+    FOREIGN KEY ({E_DETALLES_PAGOS_PRESTAMO.ID_PAGO.value}) REFERENCES pagos(id_pago) ON DELETE CASCADE,
+    FOREIGN KEY ({E_DETALLES_PAGOS_PRESTAMO.ID_PRESTAMO.value}) REFERENCES prestamos(id_prestamo) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+
+MIGRATION = Migration(
+    version=1,
+    nombre="esquema inicial",
+    sentencias=[
+        EMPLEADOS,
+        USUARIOS,
+        ASISTENCIAS,
+        PRESTAMOS,
+        PAGOS,
+        DESCUENTOS,
+        PAGOS_PRESTAMO,
+        DESEMPENO,
+        REPORTES_SEMANALES,
+        DESCUENTO_DETALLES,
+        DETALLES_PAGOS_PRESTAMO,
+    ]
+)
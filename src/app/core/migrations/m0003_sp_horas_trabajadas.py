@@ -0,0 +1,50 @@
+from app.core.migrations.migration import Migration
+
+
+# Horas trabajadas (asistencias completas) por empleado en un rango de fechas
+SP_HORAS_TRABAJADAS_PARA_PAGOS = """
+CREATE PROCEDURE horas_trabajadas_para_pagos (
+    IN p_numero_nomina INT,
+    IN p_fecha_inicio DATE,
+    IN p_fecha_fin DATE
+)
+BEGIN
+    IF p_numero_nomina IS NOT NULL THEN
+        IF EXISTS (SELECT 1 FROM empleados WHERE numero_nomina = p_numero_nomina) THEN
+            SELECT
+                a.numero_nomina,
+                e.nombre_completo,
+                IFNULL(SEC_TO_TIME(SUM(TIME_TO_SEC(a.tiempo_trabajo))), '00:00:00') AS total_horas_trabajadas
+            FROM asistencias a
+            JOIN empleados e ON a.numero_nomina = e.numero_nomina
+            WHERE a.numero_nomina = p_numero_nomina
+            AND a.fecha BETWEEN p_fecha_inicio AND p_fecha_fin
+            AND a.estado = 'completo'
+            GROUP BY a.numero_nomina, e.nombre_completo;
+        ELSE
+            SELECT 'Empleado no encontrado' AS mensaje;
+        END IF;
+    ELSE
+        SELECT
+            a.numero_nomina,
+            e.nombre_completo,
+            IFNULL(SEC_TO_TIME(SUM(TIME_TO_SEC(a.tiempo_trabajo))), '00:00:00') AS total_horas_trabajadas
+        FROM asistencias a
+        JOIN empleados e ON a.numero_nomina = e.numero_nomina
+        WHERE a.fecha BETWEEN p_fecha_inicio AND p_fecha_fin
+        AND a.estado = 'completo'
+        GROUP BY a.numero_nomina, e.nombre_completo;
+    END IF;
+END
+"""
+
+
+MIGRATION = Migration(
+    version=3,
+    nombre="procedimiento horas_trabajadas_para_pagos",
+    sentencias=[
+        "DROP PROCEDURE IF EXISTS horas_trabajadas_para_pagos",
+        SP_HORAS_TRABAJADAS_PARA_PAGOS,
+    ],
+    depende_de=(1, 2)
+)
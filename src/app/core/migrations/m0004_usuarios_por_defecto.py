@@ -0,0 +1,23 @@
+from app.core.enums.e_user_model import E_USER
+from app.core.migrations.migration import Migration
+
+
+# Solo si la tabla está vacía: usuarios 'root' y 'usuario' por defecto (⚠️ Hashear en producción)
+USUARIOS_POR_DEFECTO = f"""
+INSERT INTO {E_USER.TABLE.value} ({E_USER.USERNAME.value}, {E_USER.PASSWORD.value}, {E_USER.ROLE.value})
+SELECT d.username, d.password, d.role
+FROM (
+    SELECT 'root' AS username, 'root' AS password, 'root' AS role
+    UNION ALL
+    SELECT 'usuario', 'usuario', 'user'
+) AS d
+WHERE NOT EXISTS (SELECT 1 FROM {E_USER.TABLE.value})
+"""
+
+
+MIGRATION = Migration(
+    version=4,
+    nombre="usuarios por defecto",
+    sentencias=[USUARIOS_POR_DEFECTO],
+    depende_de=(1,)
+)
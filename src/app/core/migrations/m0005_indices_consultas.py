@@ -0,0 +1,73 @@
+from app.core.migrations.migration import Migration, Indice
+
+
+# Asistencias repetidas por empleado y día, y cuántas ya entraron en una nómina generada
+DUPLICADOS_ASISTENCIAS = """
+SELECT numero_nomina, fecha, COUNT(*) AS filas,
+       SUM(CASE WHEN fecha_generada IS NOT NULL THEN 1 ELSE 0 END) AS generadas
+FROM asistencias
+GROUP BY numero_nomina, fecha
+HAVING COUNT(*) > 1
+"""
+
+# Se conserva la asistencia que usa una nómina generada; si ninguna, la primera
+QUITAR_ASISTENCIAS_DUPLICADAS = """
+DELETE FROM asistencias
+WHERE id_asistencia NOT IN (
+    SELECT id FROM (
+        SELECT COALESCE(
+            MIN(CASE WHEN fecha_generada IS NOT NULL THEN id_asistencia END),
+            MIN(id_asistencia)
+        ) AS id
+        FROM asistencias
+        GROUP BY numero_nomina, fecha
+    ) AS conservadas
+)
+"""
+
+
+def quitar_asistencias_duplicadas(db) -> None:
+    """
+    Antes de la llave única (numero_nomina, fecha): deja una asistencia por empleado y día.
+    Si más de una del mismo día ya entró en una nómina generada no hay cuál conservar sin
+    perder datos: la migración se detiene y las lista para corregirlas a mano.
+    """
+    duplicados = db.get_data_list(DUPLICADOS_ASISTENCIAS, dictionary=True)
+    if not duplicados:
+        return
+
+    conflictos = [d for d in duplicados if int(d["generadas"] or 0) > 1]
+    if conflictos:
+        for d in conflictos[:20]:
+            print(f"   empleado {d['numero_nomina']}, {d['fecha']}: {d['filas']} asistencias en nóminas generadas")
+        raise RuntimeError(
+            f"{len(conflictos)} días tienen varias asistencias ya usadas en nóminas generadas; "
+            "corríjalos antes de crear la llave única de asistencias."
+        )
+
+    borradas = db.run_query(QUITAR_ASISTENCIAS_DUPLICADAS)["rowcount"]
+    print(f"⚠️ Se quitaron {borradas} asistencias duplicadas ({len(duplicados)} días repetidos).")
+
+
+MIGRATION = Migration(
+    version=5,
+    nombre="índices de consultas frecuentes",
+    sentencias=[
+        quitar_asistencias_duplicadas,
+        # Verificación de duplicados al importar y horas por empleado en un rango
+        Indice("uk_asistencias_empleado_fecha", "asistencias", "numero_nomina, fecha", unico=True),
+        # Horas de todos los empleados en un rango (SP sin número de nómina)
+        Indice("idx_asistencias_fecha_estado", "asistencias", "fecha, estado"),
+        # Existencia de pago por empleado y fecha, último pago por estado
+        Indice("idx_pagos_empleado_fecha_estado", "pagos", "numero_nomina, fecha_pago, estado"),
+        # Descuentos y totales por pago
+        Indice("idx_descuentos_pago", "descuentos", "id_pago"),
+        # Totales de abonos aplicados por pago de nómina
+        Indice("idx_pagos_prestamo_nomina_aplicado", "pagos_prestamo", "id_pago_nomina, aplicado"),
+        # Abonos y total pagado por préstamo
+        Indice("idx_pagos_prestamo_prestamo_aplicado", "pagos_prestamo", "id_prestamo, aplicado"),
+        # Préstamo activo por empleado
+        Indice("idx_prestamos_empleado_estado", "prestamos", "numero_nomina, estado"),
+    ],
+    depende_de=(1,)
+)
@@ -0,0 +1,80 @@
+from app.core.migrations.migration import Migration
+
+
+# Mismos triggers que en la versión 2, pero no hacen nada cuando la sesión define
+# @omitir_triggers_asistencias: la importación masiva ya trae retardo, tiempo_trabajo
+# y estado calculados por columnas (app/helpers/horas_asistencia.py).
+TRG_CALCULAR_HORAS = """
+CREATE TRIGGER trg_calcular_horas_trabajadas
+BEFORE INSERT ON asistencias
+FOR EACH ROW
+BEGIN
+    DECLARE entrada_ajustada TIME;
+    DECLARE salida_ajustada TIME;
+    DECLARE tiempo_final TIME;
+
+    IF @omitir_triggers_asistencias IS NULL
+    AND NEW.hora_entrada IS NOT NULL AND NEW.hora_entrada NOT IN ('00:00:00', '0:00:00')
+    AND NEW.hora_salida IS NOT NULL AND NEW.hora_salida NOT IN ('00:00:00', '0:00:00') THEN
+
+        -- Redondear hora de entrada hacia arriba al siguiente bloque de 30 minutos
+        SET entrada_ajustada = MAKETIME(
+            HOUR(NEW.hora_entrada),
+            IF(MINUTE(NEW.hora_entrada) <= 30, 30, 0),
+            0
+        );
+        IF MINUTE(NEW.hora_entrada) > 30 THEN
+            SET entrada_ajustada = ADDTIME(entrada_ajustada, '01:00:00');
+        END IF;
+
+        -- Redondear hora de salida hacia abajo al bloque de 30 minutos anterior
+        SET salida_ajustada = MAKETIME(
+            HOUR(NEW.hora_salida),
+            IF(MINUTE(NEW.hora_salida) >= 30, 30, 0),
+            0
+        );
+
+        -- Si la salida es menor o igual a la entrada, asumimos cruce de día
+        IF salida_ajustada <= entrada_ajustada THEN
+            SET salida_ajustada = ADDTIME(salida_ajustada, '24:00:00');
+        END IF;
+
+        -- Calcular tiempo trabajado
+        SET tiempo_final = TIMEDIFF(salida_ajustada, entrada_ajustada);
+
+        -- Asignar valores
+        SET NEW.retardo = entrada_ajustada;
+        SET NEW.tiempo_trabajo = tiempo_final;
+    END IF;
+END
+"""
+
+TRG_VERIFICAR_ESTADO = """
+CREATE TRIGGER trg_verificar_estado_asistencia
+BEFORE INSERT ON asistencias
+FOR EACH ROW
+BEGIN
+    IF @omitir_triggers_asistencias IS NULL THEN
+        IF NEW.hora_entrada IS NULL OR NEW.hora_salida IS NULL
+        OR NEW.hora_entrada IN ('00:00:00', '0:00:00')
+        OR NEW.hora_salida IN ('00:00:00', '0:00:00') THEN
+            SET NEW.estado = 'incompleto';
+        ELSE
+            SET NEW.estado = 'completo';
+        END IF;
+    END IF;
+END;
+"""
+
+
+MIGRATION = Migration(
+    version=6,
+    nombre="triggers de asistencias omitibles en cargas masivas",
+    sentencias=[
+        "DROP TRIGGER IF EXISTS trg_calcular_horas_trabajadas",
+        TRG_CALCULAR_HORAS,
+        "DROP TRIGGER IF EXISTS trg_verificar_estado_asistencia",
+        TRG_VERIFICAR_ESTADO,
+    ],
+    depende_de=(2,)
+)
@@ -0,0 +1,45 @@
+from app.core.migrations.migration import Migration, Indice
+
+
+# Una fila por archivo importado: huella SHA-256 del contenido y rango de fechas
+IMPORTACIONES = """
+CREATE TABLE IF NOT EXISTS importaciones (
+    id_importacion INT AUTO_INCREMENT PRIMARY KEY,
+    archivo VARCHAR(255) NOT NULL,
+    hash_archivo CHAR(64) NOT NULL,
+    estado ENUM('en_proceso','completa','parcial','cancelada','error') NOT NULL DEFAULT 'en_proceso',
+    fecha_inicio DATE DEFAULT NULL,
+    fecha_fin DATE DEFAULT NULL,
+    filas INT NOT NULL DEFAULT 0,
+    insertadas INT NOT NULL DEFAULT 0,
+    fecha_importacion TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+# Huella de 64 bits de cada asistencia ya procesada (numero_nomina, fecha, entrada, salida)
+IMPORTACIONES_FILAS = """
+CREATE TABLE IF NOT EXISTS importaciones_filas (
+    hash_fila BIGINT PRIMARY KEY,
+    id_importacion INT NOT NULL,
+    numero_nomina SMALLINT UNSIGNED NOT NULL,
+    fecha DATE NOT NULL,
+    FOREIGN KEY (id_importacion) REFERENCES importaciones(id_importacion) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+"""
+
+
+MIGRATION = Migration(
+    version=7,
+    nombre="manifiesto de importaciones",
+    sentencias=[
+        IMPORTACIONES,
+        IMPORTACIONES_FILAS,
+        # Archivo ya importado por completo
+        Indice("idx_importaciones_hash_estado", "importaciones", "hash_archivo, estado"),
+        # Huellas conocidas en el rango de fechas de un bloque
+        Indice("idx_importaciones_filas_fecha", "importaciones_filas", "fecha, hash_fila"),
+        # Olvidar la huella al borrar una asistencia
+        Indice("idx_importaciones_filas_empleado_fecha", "importaciones_filas", "numero_nomina, fecha"),
+    ],
+    depende_de=(1,)
+)
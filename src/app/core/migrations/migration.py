@@ -0,0 +1,57 @@
+class Migration:
+    """
+    Cambio de esquema versionado. Se aplica una sola vez: al terminar, su `version`
+    queda registrada en la tabla `schema_version`.
+    - `version`: entero único y creciente; define el orden de aplicación.
+    - `nombre`: descripción corta que se guarda junto con la versión.
+    - `sentencias`: SQL a ejecutar en orden, o pasos `f(db)` como `Indice`. Deben ser
+      idempotentes (IF NOT EXISTS, DROP ... IF EXISTS) para bases creadas antes del versionado
+      y para reintentar una migración que falló a la mitad (el DDL de MySQL no se revierte).
+    - `depende_de`: versiones que deben estar aplicadas antes que esta.
+    """
+
+    def __init__(self, version: int, nombre: str, sentencias: list, depende_de: tuple = ()):
+        self.version = version
+        self.nombre = nombre
+        self.sentencias = list(sentencias)
+        self.depende_de = tuple(depende_de)
+
+    def aplicar(self, db) -> None:
+        for sentencia in self.sentencias:
+            if callable(sentencia):
+                sentencia(db)
+            else:
+                db.run_query(sentencia)
+
+    def __repr__(self) -> str:
+        return f"Migration({self.version}, {self.nombre!r})"
+
+
+class Indice:
+    """
+    Paso de migración que crea un índice solo si la tabla aún no lo tiene
+    (MySQL no admite CREATE INDEX IF NOT EXISTS).
+    """
+
+    def __init__(self, nombre: str, tabla: str, columnas: str, unico: bool = False):
+        self.nombre = nombre
+        self.tabla = tabla
+        self.columnas = columnas
+        self.unico = unico
+
+    def __call__(self, db) -> None:
+        existe = db.get_data(
+            """
+            SELECT 1 FROM information_schema.statistics
+            WHERE table_schema = %s AND table_name = %s AND index_name = %s
+            LIMIT 1
+            """,
+            (db.database, self.tabla, self.nombre)
+        )
+        if existe:
+            print(f"⏭️ El índice {self.nombre} ya existe.")
+            return
+        db.run_query(f"CREATE {'UNIQUE ' if self.unico else ''}INDEX {self.nombre} ON {self.tabla} ({self.columnas})")
+
+    def __repr__(self) -> str:
+        return f"Indice({self.nombre!r}, {self.tabla!r})"
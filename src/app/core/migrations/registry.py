@@ -0,0 +1,39 @@
+from app.core.migrations import (
+    m0001_esquema_inicial,
+    m0002_triggers_asistencias,
+    m0003_sp_horas_trabajadas,
+    m0004_usuarios_por_defecto,
+    m0005_indices_consultas,
+    m0006_triggers_omitibles,
+    m0007_manifiesto_importaciones,
+)
+
+
+# Todas las migraciones, en el orden en que se aplican.
+# Para cambiar el esquema se agrega un módulo nuevo con la siguiente versión.
+MIGRACIONES = [
+    m0001_esquema_inicial.MIGRATION,
+    m0002_triggers_asistencias.MIGRATION,
+    m0003_sp_horas_trabajadas.MIGRATION,
+    m0004_usuarios_por_defecto.MIGRATION,
+    m0005_indices_consultas.MIGRATION,
+    m0006_triggers_omitibles.MIGRATION,
+    m0007_manifiesto_importaciones.MIGRATION,
+]
+
+
+def validar_registro(migraciones: list = MIGRACIONES) -> None:
+    """
+    Comprueba que las versiones sean únicas y crecientes y que cada migración
+    dependa solo de versiones anteriores. Lanza ValueError si no se cumple.
+    """
+    vistas = set()
+    anterior = 0
+    for m in migraciones:
+        if m.version <= anterior:
+            raise ValueError(f"La migración {m!r} no sigue el orden de versiones (anterior: {anterior})")
+        faltantes = [v for v in m.depende_de if v not in vistas]
+        if faltantes:
+            raise ValueError(f"La migración {m!r} depende de versiones posteriores o inexistentes: {faltantes}")
+        vistas.add(m.version)
+        anterior = m.version
@@ -0,0 +1,74 @@
+import time
+from app.core.interfaces.database import get_database
+from app.core.migrations.registry import MIGRACIONES, validar_registro
+
+SCHEMA_VERSION = "schema_version"
+
+
+class MigrationRunner:
+    """
+    Aplica una sola vez, en orden, las migraciones del registro que aún no
+    aparecen en la tabla `schema_version`. Con el esquema al día, el arranque
+    se reduce a leer las versiones aplicadas.
+    """
+
+    def __init__(self, db=None, migraciones: list = None):
+        self.db = db or get_database()
+        self.migraciones = MIGRACIONES if migraciones is None else migraciones
+        validar_registro(self.migraciones)
+
+    def _crear_tabla_versiones(self) -> None:
+        self.db.run_query(f"""
+            CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION} (
+                version INT PRIMARY KEY,
+                nombre VARCHAR(100) NOT NULL,
+                fecha_aplicada TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+        """)
+
+    def versiones_aplicadas(self) -> set:
+        self._crear_tabla_versiones()
+        filas = self.db.get_data_list(f"SELECT version FROM {SCHEMA_VERSION}")
+        return {int(fila[0]) for fila in filas}
+
+    def pendientes(self) -> list:
+        aplicadas = self.versiones_aplicadas()
+        return [m for m in self.migraciones if m.version not in aplicadas]
+
+    def migrar(self) -> bool:
+        """
+        Aplica las migraciones pendientes. Se detiene en la primera que falle
+        (las siguientes pueden depender de ella) y devuelve False.
+        """
+        inicio = time.perf_counter()
+        try:
+            pendientes = self.pendientes()
+        except Exception as ex:
+            print(f"❌ Error al leer la versión del esquema: {ex}")
+            return False
+
+        if not pendientes:
+            version = max((m.version for m in self.migraciones), default=0)
+            print(f"✔️ Esquema al día (versión {version}).")
+            return True
+
+        for m in pendientes:
+            print(f"⚠️ Aplicando migración {m.version}: {m.nombre}...")
+            try:
+                m.aplicar(self.db)
+                self.db.run_query(
+                    f"INSERT INTO {SCHEMA_VERSION} (version, nombre) VALUES (%s, %s)",
+                    (m.version, m.nombre)
+                )
+            except Exception as ex:
+                print(f"❌ Error en la migración {m.version} ({m.nombre}): {ex}")
+                return False
+            print(f"✅ Migración {m.version} aplicada.")
+
+        print(f"✅ Esquema actualizado en {time.perf_counter() - inicio:.2f} s.")
+        return True
+
+
+def run_migrations() -> bool:
+    """Aplica las migraciones pendientes sobre la base de datos configurada."""
+    return MigrationRunner().migrar()
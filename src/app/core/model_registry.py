@@ -0,0 +1,45 @@
+import threading
+from app.helpers.class_singleton import class_singleton
+
+
+@class_singleton
+class ModelRegistry:
+    """
+    Instancias compartidas de los modelos para todo el proceso.
+    Cada modelo se crea la primera vez que se pide (`get`) y después se reutiliza,
+    de modo que contenedores y modales no reconstruyen modelos al abrirse.
+    `reset` descarta las instancias (p. ej. tras importar otra base de datos);
+    la siguiente petición las vuelve a crear.
+    """
+
+    def __init__(self):
+        self._instancias = {}
+        # RLock: el constructor de un modelo puede pedir otros modelos al registro
+        self._lock = threading.RLock()
+
+    def get(self, model_cls):
+        instancia = self._instancias.get(model_cls)
+        if instancia is not None:
+            return instancia
+        with self._lock:
+            instancia = self._instancias.get(model_cls)
+            if instancia is None:
+                instancia = self._instancias[model_cls] = model_cls()
+            return instancia
+
+    def reset(self, model_cls=None) -> None:
+        """Descarta la instancia de `model_cls`, o todas si no se indica."""
+        with self._lock:
+            if model_cls is None:
+                self._instancias.clear()
+            else:
+                self._instancias.pop(model_cls, None)
+
+    def registrados(self) -> list:
+        """Nombres de los modelos ya instanciados."""
+        return [cls.__name__ for cls in self._instancias]
+
+
+def get_model(model_cls):
+    """Atajo para `ModelRegistry().get(model_cls)`."""
+    return ModelRegistry().get(model_cls)
@@ -0,0 +1,152 @@
+import threading
+import time
+from app.config.config import DB_CACHE_TTL
+from app.helpers.class_singleton import class_singleton
+
+
+def _empleados():
+    from app.core.model_registry import get_model
+    from app.models.employes_model import EmployesModel
+    resultado = get_model(EmployesModel).get_all()
+    if resultado["status"] != "success":
+        raise RuntimeError(resultado["message"])
+    return resultado["data"]
+
+
+def _fecha_minima_asistencia():
+    from app.core.model_registry import get_model
+    from app.models.assistance_model import AssistanceModel
+    return get_model(AssistanceModel).get_fecha_minima_asistencia()
+
+
+def _fecha_maxima_asistencia():
+    from app.core.model_registry import get_model
+    from app.models.assistance_model import AssistanceModel
+    return get_model(AssistanceModel).get_fecha_maxima_asistencia()
+
+
+def _fechas_pago_utilizadas():
+    from app.core.model_registry import get_model
+    from app.models.payment_model import PaymentModel
+    return get_model(PaymentModel).get_fechas_utilizadas()
+
+
+def _prestamos_activos():
+    from app.core.model_registry import get_model
+    from app.models.loan_model import LoanModel
+    return get_model(LoanModel).get_prestamos_activos()
+
+
+# nombre → (cargador, tablas de las que depende)
+REFERENCIAS = {
+    "empleados": (_empleados, {"empleados"}),
+    "fecha_minima_asistencia": (_fecha_minima_asistencia, {"asistencias"}),
+    "fecha_maxima_asistencia": (_fecha_maxima_asistencia, {"asistencias"}),
+    "fechas_pago_utilizadas": (_fechas_pago_utilizadas, {"pagos"}),
+    "prestamos_activos": (_prestamos_activos, {"prestamos"}),
+}
+
+
+@class_singleton
+class ReferenceCache:
+    """
+    Datos de referencia que casi no cambian y que varias secciones necesitan al abrirse
+    (plantilla de empleados, rango de fechas de asistencias, fechas de pago usadas,
+    préstamos activos por empleado).
+
+    `precargar()` los carga en un hilo de fondo mientras se muestra el login, de modo que
+    la primera sección que se abra los encuentre listos. `get(nombre)` devuelve el valor
+    en memoria o lo carga en ese momento si aún no está.
+
+    Se invalidan con las mismas escrituras que la caché de consultas (`QueryCache.on_invalidate`),
+    con `invalidar(...)` o al vencer `DB_CACHE_TTL`.
+    """
+
+    def __init__(self, db=None, referencias: dict = None, ttl: float = DB_CACHE_TTL):
+        if db is None:
+            from app.core.interfaces.database import get_database
+            db = get_database()
+        self.db = db
+        self.ttl = ttl
+        self._referencias = dict(referencias or REFERENCIAS)
+        self._valores = {}
+        # Se incrementa al invalidar: una carga iniciada antes no debe guardar datos viejos
+        self._generacion = {nombre: 0 for nombre in self._referencias}
+        self._lock = threading.RLock()
+        self._hilo = None
+        self.precargado = threading.Event()
+        self._stats = {"hits": 0, "cargas": 0, "invalidaciones": 0, "errores": 0}
+        self.db.cache.on_invalidate(self._on_tablas_modificadas)
+
+    def get(self, nombre: str, default=None):
+        """Valor de la referencia `nombre`; lo carga si no está en memoria o venció."""
+        with self._lock:
+            entrada = self._valores.get(nombre)
+            if entrada is not None and entrada[0] >= time.monotonic():
+                self._stats["hits"] += 1
+                return self._copia(entrada[1])
+            generacion = self._generacion[nombre]
+
+        cargador, _ = self._referencias[nombre]
+        try:
+            valor = cargador()
+        except Exception as e:
+            with self._lock:
+                self._stats["errores"] += 1
+            print(f"❌ Error al cargar la referencia '{nombre}': {e}")
+            return default
+
+        with self._lock:
+            self._stats["cargas"] += 1
+            if self._generacion[nombre] == generacion:
+                self._valores[nombre] = (time.monotonic() + self.ttl, valor)
+        return self._copia(valor)
+
+    @staticmethod
+    def _copia(valor):
+        # Los llamadores pueden ordenar o modificar lo que reciben
+        if isinstance(valor, list):
+            return [dict(v) if isinstance(v, dict) else v for v in valor]
+        if isinstance(valor, dict):
+            return dict(valor)
+        return valor
+
+    def precargar(self) -> threading.Thread:
+        """Carga todas las referencias en un hilo de fondo (una sola vez a la vez)."""
+        with self._lock:
+            if self._hilo is not None and self._hilo.is_alive():
+                return self._hilo
+            self.precargado.clear()
+            self._hilo = threading.Thread(target=self._precargar, name="precarga-referencias", daemon=True)
+            self._hilo.start()
+            return self._hilo
+
+    def _precargar(self) -> None:
+        inicio = time.perf_counter()
+        for nombre in self._referencias:
+            self.get(nombre)
+        self.precargado.set()
+        print(f"✅ Datos de referencia precargados en {(time.perf_counter() - inicio) * 1000:.0f} ms")
+
+    def invalidar(self, *nombres: str) -> None:
+        """Descarta las referencias indicadas, o todas si no se indica ninguna."""
+        with self._lock:
+            for nombre in nombres or list(self._referencias):
+                self._generacion[nombre] += 1
+                if self._valores.pop(nombre, None) is not None:
+                    self._stats["invalidaciones"] += 1
+
+    def _on_tablas_modificadas(self, tablas) -> None:
+        if tablas is None:
+            self.invalidar()
+            return
+        afectadas = [n for n, (_, dependencias) in self._referencias.items() if dependencias & tablas]
+        if afectadas:
+            self.invalidar(*afectadas)
+
+    def stats(self) -> dict:
+        with self._lock:
+            data = dict(self._stats)
+            data["cargadas"] = sorted(self._valores)
+        data["precargado"] = self.precargado.is_set()
+        return data
@@ -0,0 +1,304 @@
+import codecs
+import csv
+import os
+import zipfile
+from app.helpers.lazy_import import lazy_import
+
+pd = lazy_import("pandas")
+openpyxl = lazy_import("openpyxl")
+
+_FIRMA_ZIP = b"PK\x03\x04"
+_FIRMA_OLE2 = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+_FIRMA_PARQUET = b"PAR1"
+_EXTENSIONES_TEXTO = {".csv", ".txt"}
+_SEPARADORES = (",", ";", "\t", "|")
+_TAMANO_LECTURA = 1 << 20
+
+
+def detectar_formato(path: str) -> str:
+    """
+    Identifica el archivo por sus primeros bytes (no por la extensión):
+    'xlsx' (zip con workbook.xml), 'xlsb' (zip con workbook.bin), 'xls' (OLE2) o 'parquet' (PAR1).
+    El texto no tiene firma: los .csv y .txt se leen como 'csv'.
+    """
+    with open(path, "rb") as f:
+        firma = f.read(8)
+
+    if firma.startswith(_FIRMA_ZIP):
+        with zipfile.ZipFile(path) as libro:
+            nombres = set(libro.namelist())
+        if "xl/workbook.bin" in nombres:
+            return "xlsb"
+        if "xl/workbook.xml" in nombres:
+            return "xlsx"
+    elif firma == _FIRMA_OLE2:
+        return "xls"
+    elif firma.startswith(_FIRMA_PARQUET):
+        return "parquet"
+
+    if os.path.splitext(path)[1].lower() in _EXTENSIONES_TEXTO:
+        return "csv"
+    raise ValueError(f"El archivo no es un libro de Excel, CSV o Parquet reconocido: {path}")
+
+
+def iterar_filas(path: str, formato: str = None):
+    """
+    Recorre las filas de la primera hoja como tuplas de valores, sin cargar el libro completo
+    (openpyxl en modo solo lectura, pyxlsb por filas). Las celdas vacías valen None.
+    """
+    formato = formato or detectar_formato(path)
+
+    if formato == "xlsx":
+        libro = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            hoja = libro.worksheets[0]
+            # Algunos exportadores guardan dimensiones incorrectas: se leen las filas reales
+            hoja.reset_dimensions()
+            yield from hoja.iter_rows(values_only=True)
+        finally:
+            libro.close()
+
+    elif formato == "xlsb":
+        from pyxlsb import open_workbook
+        with open_workbook(path) as libro:
+            with libro.get_sheet(1) as hoja:
+                for fila in hoja.rows(sparse=False):
+                    yield tuple(celda.v for celda in fila)
+
+    elif formato == "xls":
+        import xlrd
+        libro = xlrd.open_workbook(path, on_demand=True)
+        try:
+            hoja = libro.sheet_by_index(0)
+            for i in range(hoja.nrows):
+                yield tuple(_valor_xls(celda, libro.datemode) for celda in hoja.row(i))
+        finally:
+            libro.release_resources()
+
+    else:
+        raise ValueError(f"Formato no soportado: {formato}")
+
+
+def estimar_filas(path: str, formato: str = None) -> int | None:
+    """
+    Número aproximado de filas de la primera hoja sin recorrerla (para estimar el avance):
+    la dimensión declarada en xlsx, el conteo de filas en xls y Parquet y los saltos de línea
+    en CSV. None si no se conoce, también cuando el archivo no existe o no es de un formato
+    reconocido (el error se reporta al leerlo, no al estimar).
+    """
+    try:
+        formato = formato or detectar_formato(path)
+        if formato == "csv":
+            with open(path, "rb") as f:
+                return sum(parte.count(b"\n") for parte in iter(lambda: f.read(_TAMANO_LECTURA), b"")) or None
+        if formato == "parquet":
+            import pyarrow.parquet as pq
+            return pq.ParquetFile(path).metadata.num_rows
+        if formato == "xlsx":
+            libro = openpyxl.load_workbook(path, read_only=True)
+            try:
+                filas = libro.worksheets[0].max_row
+            finally:
+                libro.close()
+            return filas if filas and filas > 1 else None
+        if formato == "xls":
+            import xlrd
+            libro = xlrd.open_workbook(path, on_demand=True)
+            try:
+                return libro.sheet_by_index(0).nrows
+            finally:
+                libro.release_resources()
+    except Exception as e:
+        print(f"⚠️ No se pudo estimar el tamaño de {path}: {e}")
+    return None
+
+
+def _valor_xls(celda, datemode: int):
+    import xlrd
+    if celda.ctype == xlrd.XL_CELL_DATE:
+        valor = xlrd.xldate_as_datetime(celda.value, datemode)
+        # Solo hora (fracción del día): se entrega como time
+        return valor.time() if celda.value < 1 else valor
+    if celda.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK):
+        return None
+    return celda.value
+
+
+def _vacia(fila) -> bool:
+    return all(v is None or (isinstance(v, str) and not v.strip()) for v in fila)
+
+
+def _nombres_columnas(encabezado) -> list:
+    """
+    Nombres como los de pandas: 'Unnamed: i' para vacíos y sufijo '.n' para repetidos.
+    Las celdas vacías al final del encabezado no generan columnas.
+    """
+    encabezado = list(encabezado)
+    while encabezado and (encabezado[-1] is None or not str(encabezado[-1]).strip()):
+        encabezado.pop()
+    nombres, vistos = [], {}
+    for i, valor in enumerate(encabezado):
+        nombre = str(valor).strip() if valor is not None and str(valor).strip() else f"Unnamed: {i}"
+        if nombre in vistos:
+            vistos[nombre] += 1
+            nombre = f"{nombre}.{vistos[nombre]}"
+        else:
+            vistos[nombre] = 0
+        nombres.append(nombre)
+    return nombres
+
+
+def _buscar_encabezado(filas, encabezado: str | None, max_filas_encabezado: int) -> tuple:
+    """
+    Recorre `filas` hasta la fila de encabezados: la primera que contiene la celda `encabezado`,
+    o la primera no vacía si no se indica. Devuelve `(numero_de_fila, nombres_de_columnas)`.
+    """
+    for numero, fila in enumerate(filas):
+        if numero >= max_filas_encabezado:
+            break
+        if _vacia(fila):
+            continue
+        if encabezado is None or any(isinstance(v, str) and v.strip() == encabezado for v in fila):
+            return numero, _nombres_columnas(fila)
+
+    buscado = f"la columna '{encabezado}'" if encabezado else "encabezados"
+    raise ValueError(f"No se encontró {buscado} en las primeras {max_filas_encabezado} filas.")
+
+
+def leer_excel_por_bloques(path: str, encabezado: str = None, tamano_bloque: int = 5000,
+                           max_filas_encabezado: int = 50):
+    """
+    Lee la primera hoja en DataFrames de hasta `tamano_bloque` filas, de modo que la memoria
+    no crece con el tamaño del archivo.
+
+    La fila de encabezados es la primera que contiene la celda `encabezado`
+    (p. ej. "ID Checador"), o la primera fila no vacía si no se indica. El índice de
+    cada bloque continúa el del anterior (0, 1, 2... desde la primera fila de datos).
+    """
+    formato = detectar_formato(path)
+    filas = iterar_filas(path, formato)
+    print(f"📥 Leyendo '{path}' como {formato} (bloques de {tamano_bloque} filas)")
+
+    try:
+        _, columnas = _buscar_encabezado(filas, encabezado, max_filas_encabezado)
+    except ValueError:
+        filas.close()
+        raise
+
+    ancho = len(columnas)
+    inicio = 0
+    bloque = []
+    for fila in filas:
+        fila = tuple(fila[:ancho]) + (None,) * (ancho - len(fila))
+        bloque.append(fila)
+        if len(bloque) >= tamano_bloque:
+            yield _a_dataframe(bloque, columnas, inicio)
+            inicio += len(bloque)
+            bloque = []
+    if bloque:
+        yield _a_dataframe(bloque, columnas, inicio)
+
+
+def _a_dataframe(bloque: list, columnas: list, inicio: int) -> "pd.DataFrame":
+    return pd.DataFrame.from_records(bloque, columns=columnas, index=pd.RangeIndex(inicio, inicio + len(bloque)))
+
+
+def leer_archivo_por_bloques(path: str, encabezado: str = None, tamano_bloque: int = 5000,
+                             max_filas_encabezado: int = 50, tipos: dict = None):
+    """
+    Igual que `leer_excel_por_bloques` para cualquier formato soportado (Excel, CSV o Parquet).
+    Los CSV se leen con el lector en C de pandas; `tipos` (columna → dtype, p. ej. "string")
+    fija el tipo de esas columnas en lugar de inferirlo en cada bloque. Parquet conserva los
+    tipos guardados en el archivo.
+    """
+    formato = detectar_formato(path)
+    if formato == "csv":
+        yield from _leer_csv_por_bloques(path, encabezado, tamano_bloque, max_filas_encabezado, tipos)
+    elif formato == "parquet":
+        yield from _leer_parquet_por_bloques(path, encabezado, tamano_bloque)
+    else:
+        yield from leer_excel_por_bloques(path, encabezado, tamano_bloque, max_filas_encabezado)
+
+
+def _dialecto_csv(path: str, max_filas: int, encabezado: str = None) -> tuple:
+    """
+    Codificación (UTF-8, con o sin BOM, o Latin-1 como la de muchos exportadores en Windows),
+    separador y primeras filas del archivo, para ubicar el encabezado.
+    El separador se elige en la línea del encabezado: las líneas de título que algunos
+    exportadores ponen arriba no tienen la forma del resto del archivo.
+    """
+    with open(path, "rb") as f:
+        muestra = f.read(64 * 1024)
+
+    if muestra.startswith(codecs.BOM_UTF8):
+        codificacion = "utf-8-sig"
+    else:
+        try:
+            # Decodificador incremental: un carácter cortado al final de la muestra no es error
+            codecs.getincrementaldecoder("utf-8")().decode(muestra)
+            codificacion = "utf-8"
+        except UnicodeDecodeError:
+            codificacion = "latin-1"
+
+    lineas = muestra.decode(codificacion, errors="ignore").splitlines()[:max_filas]
+    linea = next(
+        (l for l in lineas if (encabezado in l if encabezado else l.strip())),
+        ""
+    )
+    conteos = {c: linea.count(c) for c in _SEPARADORES}
+    separador = max(conteos, key=conteos.get) if any(conteos.values()) else ","
+    return codificacion, separador, list(csv.reader(lineas, delimiter=separador))
+
+
+def _leer_csv_por_bloques(path: str, encabezado: str, tamano_bloque: int, max_filas_encabezado: int,
+                          tipos: dict = None):
+    codificacion, separador, muestra = _dialecto_csv(path, max_filas_encabezado, encabezado)
+    numero, columnas = _buscar_encabezado(muestra, encabezado, max_filas_encabezado)
+    print(f"📥 Leyendo '{path}' como csv ({codificacion}, separador {separador!r}, bloques de {tamano_bloque} filas)")
+
+    lector = pd.read_csv(
+        path,
+        sep=separador,
+        encoding=codificacion,
+        header=None,
+        names=columnas,
+        skiprows=numero + 1,
+        # Celdas de más al final de una fila se ignoran, como en Excel
+        usecols=range(len(columnas)),
+        index_col=False,
+        dtype={c: t for c, t in (tipos or {}).items() if c in columnas} or None,
+        chunksize=tamano_bloque,
+    )
+    inicio = 0
+    with lector:
+        for bloque in lector:
+            bloque.index = pd.RangeIndex(inicio, inicio + len(bloque))
+            inicio += len(bloque)
+            yield bloque
+
+
+def _leer_parquet_por_bloques(path: str, encabezado: str, tamano_bloque: int):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Para leer archivos Parquet se necesita el paquete pyarrow.") from None
+
+    archivo = pq.ParquetFile(path)
+    if encabezado is not None and encabezado not in archivo.schema_arrow.names:
+        raise ValueError(f"No se encontró la columna '{encabezado}' en el archivo Parquet.")
+    print(f"📥 Leyendo '{path}' como parquet ({archivo.metadata.num_rows} filas, bloques de {tamano_bloque})")
+
+    inicio = 0
+    for lote in archivo.iter_batches(batch_size=tamano_bloque):
+        bloque = lote.to_pandas()
+        bloque.index = pd.RangeIndex(inicio, inicio + len(bloque))
+        inicio += len(bloque)
+        yield bloque
+
+
+def leer_archivo(path: str, encabezado: str = None, tipos: dict = None) -> "pd.DataFrame":
+    """Lee el archivo completo en un solo DataFrame (para archivos pequeños, como el de empleados)."""
+    bloques = list(leer_archivo_por_bloques(path, encabezado, tipos=tipos))
+    if not bloques:
+        return pd.DataFrame()
+    return pd.concat(bloques)
@@ -0,0 +1,95 @@
+from app.helpers.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+pd = lazy_import("pandas")
+
+_DIA = 24 * 3600
+
+
+def horas_a_segundos(serie: "pd.Series") -> "np.ndarray":
+    """
+    Columna de horas ('HH:MM[:SS]', time, timedelta o None) → segundos como float64.
+    NaN donde la hora falta o no se puede interpretar. Se convierten solo los valores distintos.
+    """
+    codigos, unicos = pd.factorize(pd.Series(serie, dtype=object))
+    # timedelta (TIME leído de MySQL) se pasa a segundos; lo demás se interpreta como texto
+    texto = [
+        v if type(v) is str else f"0:0:{int(v.total_seconds())}" if hasattr(v, "total_seconds") else str(v)
+        for v in unicos
+    ]
+    segundos = np.full(len(texto), np.nan)
+
+    # Caso común 'HH:MM:SS': se leen los dígitos directamente de los códigos UCS-4
+    arreglo = np.array(texto + ["00:00:00"], dtype=str)[:-1]
+    ancho = arreglo.dtype.itemsize // 4
+    if len(texto) and ancho >= 8:
+        codigos_char = arreglo.view(np.uint32).reshape(len(texto), ancho).astype("int64")
+        digitos = codigos_char[:, [0, 1, 3, 4, 6, 7]] - ord("0")
+        fijo = (
+            ((digitos >= 0) & (digitos <= 9)).all(axis=1)
+            & (codigos_char[:, 2] == ord(":")) & (codigos_char[:, 5] == ord(":"))
+            & (codigos_char[:, 8:] == 0).all(axis=1)
+        )
+        segundos[fijo] = (digitos[fijo] * [36000, 3600, 600, 60, 10, 1]).sum(axis=1)
+    else:
+        fijo = np.zeros(len(texto), dtype=bool)
+
+    # Resto de formatos ('8:05', '-01:00:00', '100:00:00', '08:05:30.5'...)
+    resto = pd.Series(texto, dtype="string")[~fijo].str.strip()
+    partes = resto.str.extract(r"^(-?)(\d+)(?::(\d+))?(?::(\d+)(?:\.\d*)?)?$")
+    segundos[~fijo] = (
+        pd.to_numeric(partes[1], errors="coerce") * 3600
+        + pd.to_numeric(partes[2], errors="coerce").fillna(0) * 60
+        + pd.to_numeric(partes[3], errors="coerce").fillna(0)
+    ).to_numpy(dtype="float64") * np.where((partes[0] == "-").fillna(False), -1.0, 1.0)
+
+    # Los nulos tienen código -1: apuntan al NaN agregado al final
+    return np.append(segundos, np.nan)[codigos]
+
+
+def segundos_a_horas(segundos: "np.ndarray") -> "np.ndarray":
+    """Segundos → 'HH:MM:SS' (las horas pueden pasar de 24, como TIME de MySQL); None donde hay NaN."""
+    segundos = np.asarray(segundos, dtype="float64")
+    nulos = np.isnan(segundos)
+    unicos, codigos = np.unique(np.where(nulos, 0, segundos).astype("int64"), return_inverse=True)
+    texto = np.array([
+        f"{'-' if s < 0 else ''}{abs(s) // 3600:02d}:{abs(s) % 3600 // 60:02d}:{abs(s) % 60:02d}"
+        for s in unicos.tolist()
+    ] + [None], dtype=object)
+    return texto[np.where(nulos, len(unicos), codigos.ravel())]
+
+
+def calcular_asistencias(hora_entrada: "pd.Series", hora_salida: "pd.Series") -> "pd.DataFrame":
+    """
+    Versión por columnas de los triggers `trg_calcular_horas_trabajadas` y
+    `trg_verificar_estado_asistencia`, para calcular un bloque completo antes de insertarlo.
+    Devuelve un DataFrame con `retardo`, `tiempo_trabajo` y `estado` alineado con `hora_entrada`.
+
+    Mismas reglas que el trigger: una hora NULL o '00:00:00' no está registrada; la entrada
+    se redondea hacia arriba al bloque de 30 minutos (minuto <= 30 → HH:30, si no → HH+1:00),
+    la salida hacia abajo (minuto >= 30 → HH:30, si no → HH:00) y, si la salida ajustada no
+    pasa de la entrada ajustada, se suma un día. Los segundos se ignoran.
+    """
+    entrada = horas_a_segundos(hora_entrada)
+    salida = horas_a_segundos(hora_salida)
+
+    registrada = ~np.isnan(entrada) & (entrada != 0) & ~np.isnan(salida) & (salida != 0)
+    e = np.where(registrada, entrada, 0).astype("int64")
+    s = np.where(registrada, salida, 0).astype("int64")
+
+    # HOUR() y MINUTE() de MySQL ignoran el signo de la hora
+    e, s = np.abs(e), np.abs(s)
+    minuto_e = e % 3600 // 60
+    minuto_s = s % 3600 // 60
+    entrada_ajustada = e // 3600 * 3600 + np.where(minuto_e <= 30, 1800, 3600)
+    salida_ajustada = s // 3600 * 3600 + np.where(minuto_s >= 30, 1800, 0)
+    salida_ajustada = np.where(salida_ajustada <= entrada_ajustada, salida_ajustada + _DIA, salida_ajustada)
+
+    index = hora_entrada.index if isinstance(hora_entrada, pd.Series) else None
+    columnas = {
+        "retardo": segundos_a_horas(np.where(registrada, entrada_ajustada, np.nan)),
+        "tiempo_trabajo": segundos_a_horas(np.where(registrada, salida_ajustada - entrada_ajustada, np.nan)),
+        "estado": np.where(registrada, "completo", "incompleto"),
+    }
+    # dtype object: las horas sin calcular quedan como None (NULL), no NaN
+    return pd.DataFrame({k: pd.Series(v, index=index, dtype=object) for k, v in columnas.items()})
@@ -0,0 +1,47 @@
+import importlib
+import threading
+import time
+
+# Segundos que tardó la primera importación de cada módulo diferido
+tiempos_de_carga: dict = {}
+_lock = threading.Lock()
+
+
+class LazyModule:
+    """
+    Sustituto de un módulo pesado (pandas, openpyxl, tabulate...) que lo importa
+    en el primer acceso a uno de sus atributos:
+
+        pd = lazy_import("pandas")
+        ...
+        df = pd.read_excel(path)   # aquí se importa pandas
+
+    Las anotaciones de tipo que usen el módulo deben ir entre comillas
+    para no forzar la importación al definir la función.
+    """
+
+    def __init__(self, nombre: str):
+        self._nombre = nombre
+        self._modulo = None
+
+    def _cargar(self):
+        if self._modulo is None:
+            with _lock:
+                if self._modulo is None:
+                    inicio = time.perf_counter()
+                    self._modulo = importlib.import_module(self._nombre)
+                    tiempos_de_carga[self._nombre] = time.perf_counter() - inicio
+                    print(f"📦 Módulo '{self._nombre}' cargado en {tiempos_de_carga[self._nombre] * 1000:.0f} ms")
+        return self._modulo
+
+    def __getattr__(self, atributo: str):
+        return getattr(self._cargar(), atributo)
+
+    def __repr__(self) -> str:
+        estado = "cargado" if self._modulo is not None else "diferido"
+        return f"<LazyModule '{self._nombre}' ({estado})>"
+
+
+def lazy_import(nombre: str) -> LazyModule:
+    """Devuelve un módulo que se importa hasta su primer uso."""
+    return LazyModule(nombre)
@@ -1,171 +1,15 @@
 from app.core.enums.e_assistance_model import E_ASSISTANCE
-from app.core.interfaces.database_mysql import DatabaseMysql
+from app.core.interfaces.database import get_database
+from app.core.import_manifest import ImportManifest
 from datetime import date, datetime, timedelta
 from typing import Optional
-import pandas as pd 
+from app.helpers.lazy_import import lazy_import
+
+pd = lazy_import("pandas")
 
 class AssistanceModel:
     def __init__(self):
-        self.db = DatabaseMysql()
-        self._exists_table = self.check_table()
-        self.verificar_o_crear_triggers()
-
-    def check_table(self) -> bool:
-        """
-        Verifica si la tabla 'asistencias' existe. Si no existe, la crea con la estructura adecuada,
-        incluyendo la columna 'fecha_generada' para marcar asistencias ya utilizadas en generación de pagos.
-        """
-        try:
-            query = """
-                SELECT COUNT(*) AS c
-                FROM information_schema.tables
-                WHERE table_schema = %s AND table_name = %s
-            """
-            result = self.db.get_data(query, (self.db.database, E_ASSISTANCE.TABLE.value), dictionary=True)
-            existe = result.get("c", 0) > 0
-
-            if not existe:
-                print(f"⚠️ La tabla {E_ASSISTANCE.TABLE.value} no existe. Creando...")
-
-                create_query = f"""
-                CREATE TABLE IF NOT EXISTS {E_ASSISTANCE.TABLE.value} (
-                    id_asistencia INT AUTO_INCREMENT PRIMARY KEY,
-                    numero_nomina SMALLINT UNSIGNED NOT NULL,
-                    fecha DATE NOT NULL,
-                    hora_entrada TIME,
-                    hora_salida TIME,
-                    retardo TIME,
-                    estado VARCHAR(20),
-                    tiempo_trabajo TIME,
-                    fecha_generada DATE DEFAULT NULL,
-                    FOREIGN KEY (numero_nomina) REFERENCES empleados(numero_nomina) ON DELETE CASCADE
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-                """
-                self.db.run_query(create_query)
-                print(f"✅ Tabla {E_ASSISTANCE.TABLE.value} creada correctamente.")
-            else:
-                print(f"✔️ La tabla {E_ASSISTANCE.TABLE.value} ya existe.")
-
-            return True
-
-        except Exception as ex:
-            print(f"❌ Error al verificar/crear la tabla {E_ASSISTANCE.TABLE.value}: {ex}")
-            return False
-
-
-    def verificar_o_crear_triggers(self):
-        try:
-            self._crear_trigger_calculo_horas()
-            self._crear_trigger_estado()
-        except Exception as ex:
-            print(f"❌ Error al verificar/crear triggers: {ex}")
-
-    def _crear_trigger_calculo_horas(self):
-        trigger_name = "trg_calcular_horas_trabajadas"
-        check_query = """
-            SELECT COUNT(*) AS c
-            FROM information_schema.triggers
-            WHERE trigger_schema = %s AND trigger_name = %s
-        """
-        result = self.db.get_data(check_query, (self.db.database, trigger_name), dictionary=True)
-        if result.get("c", 0) == 0:
-            print(f"⚠️ Trigger '{trigger_name}' no existe. Creando...")
-
-            cursor = self.db.connection.cursor()
-            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
-
-            trigger_sql = """
-            CREATE TRIGGER trg_calcular_horas_trabajadas
-            BEFORE INSERT ON asistencias
-            FOR EACH ROW
-            BEGIN
-                DECLARE entrada_ajustada TIME;
-                DECLARE salida_ajustada TIME;
-                DECLARE tiempo_final TIME;
-
-                IF NEW.hora_entrada IS NOT NULL AND NEW.hora_entrada NOT IN ('00:00:00', '0:00:00')
-                AND NEW.hora_salida IS NOT NULL AND NEW.hora_salida NOT IN ('00:00:00', '0:00:00') THEN
-
-                    -- Redondear hora de entrada hacia arriba al siguiente bloque de 30 minutos
-                    SET entrada_ajustada = MAKETIME(
-                        HOUR(NEW.hora_entrada),
-                        IF(MINUTE(NEW.hora_entrada) <= 30, 30, 0),
-                        0
-                    );
-                    IF MINUTE(NEW.hora_entrada) > 30 THEN
-                        SET entrada_ajustada = ADDTIME(entrada_ajustada, '01:00:00');
-                    END IF;
-
-                    -- Redondear hora de salida hacia abajo al bloque de 30 minutos anterior
-                    SET salida_ajustada = MAKETIME(
-                        HOUR(NEW.hora_salida),
-                        IF(MINUTE(NEW.hora_salida) >= 30, 30, 0),
-                        0
-                    );
-
-                    -- Si la salida es menor o igual a la entrada, asumimos cruce de día
-                    IF salida_ajustada <= entrada_ajustada THEN
-                        SET salida_ajustada = ADDTIME(salida_ajustada, '24:00:00');
-                    END IF;
-
-                    -- Calcular tiempo trabajado
-                    SET tiempo_final = TIMEDIFF(salida_ajustada, entrada_ajustada);
-
-                    -- Asignar valores
-                    SET NEW.retardo = entrada_ajustada;
-                    SET NEW.tiempo_trabajo = tiempo_final;
-                END IF;
-            END
-            """
-
-            cursor.execute(trigger_sql)
-            self.db.connection.commit()
-            cursor.close()
-
-            print(f"✅ Trigger '{trigger_name}' creado correctamente.")
-        else:
-            print(f"✔️ Trigger '{trigger_name}' ya existe.")
-
-
-
-
-
-    def _crear_trigger_estado(self):
-        trigger_name = "trg_verificar_estado_asistencia"
-        check_query = """
-            SELECT COUNT(*) AS c
-            FROM information_schema.triggers
-            WHERE trigger_schema = %s AND trigger_name = %s
-        """
-        result = self.db.get_data(check_query, (self.db.database, trigger_name), dictionary=True)
-        if result.get("c", 0) == 0:
-            print(f"⚠️ Trigger '{trigger_name}' no existe. Creando...")
-
-            cursor = self.db.connection.cursor()
-            cursor.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
-
-            trigger_sql = """
-            CREATE TRIGGER trg_verificar_estado_asistencia
-            BEFORE INSERT ON asistencias
-            FOR EACH ROW
-            BEGIN
-                IF NEW.hora_entrada IS NULL OR NEW.hora_salida IS NULL
-                OR NEW.hora_entrada IN ('00:00:00', '0:00:00')
-                OR NEW.hora_salida IN ('00:00:00', '0:00:00') THEN
-                    SET NEW.estado = 'incompleto';
-                ELSE
-                    SET NEW.estado = 'completo';
-                END IF;
-            END;
-            """
-
-            cursor.execute(trigger_sql)
-            self.db.connection.commit()
-            cursor.close()
-
-            print(f"✅ Trigger '{trigger_name}' creado correctamente.")
-        else:
-            print(f"✔️ Trigger '{trigger_name}' ya existe.")
+        self.db = get_database()
 
     def add(
         self,
@@ -259,6 +103,24 @@ class AssistanceModel:
         except Exception as ex:
             return {"status": "error", "message": f"Error al obtener asistencias: {ex}"}
 
+    def iter_all(self, batch_size: int = 500):
+        """
+        Recorre todas las asistencias (con nombre del empleado) en memoria constante,
+        entregando bloques de filas ya formateadas. Pensado para exportaciones y
+        recorridos grandes que escriben o pintan de forma incremental.
+        """
+        query = f"""
+        SELECT a.*, e.nombre_completo AS nombre
+        FROM {E_ASSISTANCE.TABLE.value} a
+        JOIN empleados e ON a.numero_nomina = e.numero_nomina
+        ORDER BY a.fecha ASC
+        """
+        for rows in self.db.iter_data_chunks(query, dictionary=True, batch_size=batch_size):
+            for row in rows:
+                if "fecha" in row:
+                    row["fecha"] = self._formatear_fecha(str(row["fecha"]))
+            yield rows
+
     def get_by_id(self, id_asistencia: int) -> dict:
         try:
             query = f"""
@@ -302,7 +164,10 @@ class AssistanceModel:
                 DELETE FROM asistencias
                 WHERE numero_nomina = %s AND fecha = %s
             """
-            self.db.run_query(query, (numero_nomina, fecha_sql))
+            with self.db.transaction():
+                self.db.run_query(query, (numero_nomina, fecha_sql))
+                # Para que reimportar el archivo del checador vuelva a registrarla
+                ImportManifest(self.db).olvidar(numero_nomina, fecha_sql)
             return {"status": "success"}
         except Exception as e:
             return {"status": "error", "message": str(e)}
@@ -419,7 +284,7 @@ class AssistanceModel:
     def get_fecha_minima_asistencia(self) -> Optional[date]:
         try:
             query = f"SELECT MIN({E_ASSISTANCE.FECHA.value}) AS min_fecha FROM {E_ASSISTANCE.TABLE.value}"
-            result = self.db.get_data(query, dictionary=True)
+            result = self.db.get_data(query, dictionary=True, cache=True)
 
             print(f"🟡 Resultado crudo MIN fecha asistencia: {result}")
 
@@ -443,7 +308,7 @@ class AssistanceModel:
     def get_fecha_maxima_asistencia(self) -> Optional[date]:
         try:
             query = f"SELECT MAX({E_ASSISTANCE.FECHA.value}) AS max_fecha FROM {E_ASSISTANCE.TABLE.value}"
-            result = self.db.get_data(query, dictionary=True)
+            result = self.db.get_data(query, dictionary=True, cache=True)
 
             print(f"🟡 Resultado crudo MAX fecha asistencia: {result}")
 
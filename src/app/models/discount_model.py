@@ -1,32 +1,14 @@
 from datetime import date
 from app.core.enums.e_discount_model import E_DISCOUNT
-from app.core.interfaces.database_mysql import DatabaseMysql
+from app.core.interfaces.database import get_database
 
 VALOR_IMSS_POR_DEFECTO = 50.0
 
 
 class DiscountModel:
     def __init__(self):
-        self.db = DatabaseMysql()
+        self.db = get_database()
         self.E = E_DISCOUNT
-        self._create_table()
-
-    def _create_table(self):
-        query = f"""
-        CREATE TABLE IF NOT EXISTS {self.E.TABLE.value} (
-            {self.E.ID.value} INT AUTO_INCREMENT PRIMARY KEY,
-            numero_nomina SMALLINT UNSIGNED NOT NULL,
-            {self.E.ID_PAGO.value} INT DEFAULT NULL,
-            {self.E.TIPO.value} VARCHAR(50) NOT NULL,
-            {self.E.DESCRIPCION.value} VARCHAR(100) DEFAULT NULL,
-            {self.E.MONTO_DESCUENTO.value} DECIMAL(10,2) NOT NULL,
-            {self.E.FECHA_APLICACION.value} DATE NOT NULL DEFAULT (CURRENT_DATE),
-            {self.E.FECHA_CREACION.value} TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (numero_nomina) REFERENCES empleados(numero_nomina) ON DELETE CASCADE,
-            FOREIGN KEY ({self.E.ID_PAGO.value}) REFERENCES pagos(id_pago) ON DELETE SET NULL
-        ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-        """
-        self.db.run_query(query)
 
     # --------------------------------------------------------
     # Inserción
@@ -49,6 +31,53 @@ class DiscountModel:
         except Exception as e:
             return {"status": "error", "message": str(e)}
 
+    def agregar_descuentos(self, descuentos: list) -> dict:
+        """
+        Inserta varios descuentos en una sola operación.
+        Cada elemento es una tupla (numero_nomina, tipo, descripcion, monto, id_pago).
+        """
+        try:
+            if any(monto < 0 for _, _, _, monto, _ in descuentos):
+                return {"status": "error", "message": "El monto no puede ser negativo"}
+            if not descuentos:
+                return {"status": "success"}
+
+            query = f"""
+            INSERT INTO {self.E.TABLE.value} (
+                numero_nomina, {self.E.ID_PAGO.value}, {self.E.TIPO.value},
+                {self.E.DESCRIPCION.value}, {self.E.MONTO_DESCUENTO.value}
+            ) VALUES (%s, %s, %s, %s, %s)
+            """
+            valores = [
+                (numero_nomina, id_pago, tipo, descripcion, monto)
+                for numero_nomina, tipo, descripcion, monto, id_pago in descuentos
+            ]
+            resultado = self.db.run_many(query, valores)
+            if resultado["errores"]:
+                return {"status": "error", "message": resultado["errores"][0]["error"]}
+            return {"status": "success"}
+
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
+    def reemplazar_descuentos(self, id_pago: int, descuentos: list) -> dict:
+        """
+        Sustituye los descuentos de un pago en una sola transacción:
+        si la inserción falla, los descuentos anteriores no se pierden.
+        """
+        try:
+            with self.db.transaction():
+                eliminado = self.eliminar_por_id_pago(id_pago)
+                if eliminado["status"] != "success":
+                    raise RuntimeError(eliminado["message"])
+
+                resultado = self.agregar_descuentos(descuentos)
+                if resultado["status"] != "success":
+                    raise RuntimeError(resultado["message"])
+            return resultado
+        except Exception as e:
+            return {"status": "error", "message": str(e)}
+
     def agregar_descuentos_opcionales(
         self,
         id_pago: int,
@@ -99,21 +128,21 @@ class DiscountModel:
         descripcion_extra: str
     ) -> dict:
         try:
-            self.eliminar_por_id_pago(id_pago)
+            descuentos = []
 
             if aplicar_imss and monto_imss >= 0:
-                self.agregar_descuento(numero_nomina, "retenciones_imss", "Cuota IMSS", monto_imss or VALOR_IMSS_POR_DEFECTO, id_pago)
+                descuentos.append((numero_nomina, "retenciones_imss", "Cuota IMSS", monto_imss or VALOR_IMSS_POR_DEFECTO, id_pago))
 
             if aplicar_transporte and monto_transporte >= 0:
-                self.agregar_descuento(numero_nomina, "transporte", "Pasaje diario", monto_transporte, id_pago)
+                descuentos.append((numero_nomina, "transporte", "Pasaje diario", monto_transporte, id_pago))
 
             if aplicar_comida and monto_comida >= 0:
-                self.agregar_descuento(numero_nomina, "comida", "Comida diaria", monto_comida, id_pago)
+                descuentos.append((numero_nomina, "comida", "Comida diaria", monto_comida, id_pago))
 
             if aplicar_extra and monto_extra > 0 and descripcion_extra:
-                self.agregar_descuento(numero_nomina, "descuento_extra", descripcion_extra, monto_extra, id_pago)
+                descuentos.append((numero_nomina, "descuento_extra", descripcion_extra, monto_extra, id_pago))
 
-            return {"status": "success"}
+            return self.reemplazar_descuentos(id_pago, descuentos)
 
         except Exception as e:
             return {"status": "error", "message": str(e)}
@@ -131,13 +160,13 @@ class DiscountModel:
         descripcion_extra: str
     ) -> dict:
         try:
-            self.eliminar_por_id_pago(id_pago)
+            descuentos = []
 
             if aplicar_imss:
-                self.agregar_descuento(numero_nomina, "retenciones_imss", "Cuota IMSS", VALOR_IMSS_POR_DEFECTO, id_pago)
+                descuentos.append((numero_nomina, "retenciones_imss", "Cuota IMSS", VALOR_IMSS_POR_DEFECTO, id_pago))
 
             if aplicar_transporte:
-                self.agregar_descuento(numero_nomina, "transporte", "Pasaje diario", monto_transporte, id_pago)
+                descuentos.append((numero_nomina, "transporte", "Pasaje diario", monto_transporte, id_pago))
 
             if aplicar_comida:
                 monto_comida = (
@@ -145,12 +174,12 @@ class DiscountModel:
                     else 100.0 if estado_comida == "100 pesos"
                     else 0.0
                 )
-                self.agregar_descuento(numero_nomina, "comida", estado_comida, monto_comida, id_pago)
+                descuentos.append((numero_nomina, "comida", estado_comida, monto_comida, id_pago))
 
             if descuento_extra > 0 and descripcion_extra:
-                self.agregar_descuento(numero_nomina, "descuento_extra", descripcion_extra, descuento_extra, id_pago)
+                descuentos.append((numero_nomina, "descuento_extra", descripcion_extra, descuento_extra, id_pago))
 
-            return {"status": "success"}
+            return self.reemplazar_descuentos(id_pago, descuentos)
 
         except Exception as e:
             return {"status": "error", "message": str(e)}
@@ -190,7 +219,7 @@ class DiscountModel:
             FROM {self.E.TABLE.value}
             WHERE {self.E.ID_PAGO.value} = %s
             """
-            result = self.db.get_data(query, (id_pago,), dictionary=True)
+            result = self.db.get_data(query, (id_pago,), dictionary=True, prepared=True)
             return float(result["total"]) if result and result.get("total") else 0.0
         except Exception as e:
             print(f"❌ Error al obtener total de descuentos para el pago {id_pago}: {e}")
@@ -219,23 +248,26 @@ class DiscountModel:
         descripcion_extra: str = ""
     ) -> dict:
         try:
-            # Primero eliminamos si ya existía
-            self.eliminar_por_id_pago(id_pago)
-
-            # Insertamos el nuevo registro
-            query = f"""
-            INSERT INTO {self.E.TABLE.value} (
-                numero_nomina, {self.E.ID_PAGO.value},
-                monto_imss, monto_transporte, monto_comida,
-                monto_extra, descripcion_extra
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """
-            values = (
-                numero_nomina, id_pago,
-                monto_imss, monto_transporte, monto_comida,
-                monto_extra, descripcion_extra
-            )
-            self.db.run_query(query, values)
+            with self.db.transaction():
+                # Primero eliminamos si ya existía
+                eliminado = self.eliminar_por_id_pago(id_pago)
+                if eliminado["status"] != "success":
+                    raise RuntimeError(eliminado["message"])
+
+                # Insertamos el nuevo registro
+                query = f"""
+                INSERT INTO {self.E.TABLE.value} (
+                    numero_nomina, {self.E.ID_PAGO.value},
+                    monto_imss, monto_transporte, monto_comida,
+                    monto_extra, descripcion_extra
+                ) VALUES (%s, %s, %s, %s, %s, %s, %s)
+                """
+                values = (
+                    numero_nomina, id_pago,
+                    monto_imss, monto_transporte, monto_comida,
+                    monto_extra, descripcion_extra
+                )
+                self.db.run_query(query, values)
             return {"status": "success"}
         except Exception as e:
             return {"status": "error", "message": str(e)}
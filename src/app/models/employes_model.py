@@ -1,5 +1,5 @@
 from app.core.enums.e_employes_model import E_EMPLOYE
-from app.core.interfaces.database_mysql import DatabaseMysql
+from app.core.interfaces.database import get_database
 
 class EmployesModel:
     """
@@ -7,63 +7,45 @@ class EmployesModel:
     """
 
     def __init__(self):
-        self.db = DatabaseMysql()
-        self._exists_table = self.check_table()
-
-    def check_table(self) -> bool:
-        """
-        Verifica si la tabla de empleados existe y la crea con la estructura correcta si no.
-        """
-        try:
-            query = """
-                SELECT COUNT(*) AS c
-                FROM information_schema.tables
-                WHERE table_schema = %s AND table_name = %s
-            """
-            result = self.db.get_data(query, (self.db.database, E_EMPLOYE.TABLE.value), dictionary=True)
-            if result.get("c", 0) == 0:
-                print(f"⚠️ La tabla {E_EMPLOYE.TABLE.value} no existe. Creando...")
-
-                create_query = f"""
-                CREATE TABLE IF NOT EXISTS {E_EMPLOYE.TABLE.value} (
-                    {E_EMPLOYE.NUMERO_NOMINA.value} SMALLINT UNSIGNED PRIMARY KEY,
-                    {E_EMPLOYE.NOMBRE_COMPLETO.value} VARCHAR(255) NOT NULL,
-                    {E_EMPLOYE.ESTADO.value} ENUM('activo','inactivo') NOT NULL,
-                    {E_EMPLOYE.TIPO_TRABAJADOR.value} ENUM('taller','externo','no definido') NOT NULL,
-                    {E_EMPLOYE.SUELDO_POR_HORA.value} DECIMAL(8,2) NOT NULL
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-                """
-                self.db.run_query(create_query)
-                print(f"✅ Tabla {E_EMPLOYE.TABLE.value} creada correctamente.")
-            else:
-                print(f"✔️ La tabla {E_EMPLOYE.TABLE.value} ya existe.")
-            return True
-        except Exception as ex:
-            print(f"❌ Error al verificar/crear la tabla {E_EMPLOYE.TABLE.value}: {ex}")
-            return False
+        self.db = get_database()
 
     def add(self, numero_nomina, nombre_completo, estado, tipo_trabajador, sueldo_por_hora):
         """
         Agrega un nuevo empleado.
+        Si `numero_nomina` es None, el número se asigna en la misma sentencia
+        (MAX + 1) y se devuelve en el resultado.
         """
         try:
-            query = f"""
-            INSERT INTO {E_EMPLOYE.TABLE.value} (
+            columnas = f"""
                 {E_EMPLOYE.NUMERO_NOMINA.value},
                 {E_EMPLOYE.NOMBRE_COMPLETO.value},
                 {E_EMPLOYE.ESTADO.value},
                 {E_EMPLOYE.TIPO_TRABAJADOR.value},
                 {E_EMPLOYE.SUELDO_POR_HORA.value}
-            ) VALUES (%s, %s, %s, %s, %s)
             """
-            self.db.run_query(query, (
-                numero_nomina,
-                nombre_completo,
-                estado,
-                tipo_trabajador,
-                sueldo_por_hora
-            ))
-            return {"status": "success", "message": "Empleado registrado correctamente"}
+            valores = (nombre_completo, estado, tipo_trabajador, sueldo_por_hora)
+
+            if numero_nomina is None:
+                # numero_nomina no es AUTO_INCREMENT: LAST_INSERT_ID(expr) hace que el
+                # número calculado llegue como lastrowid sin otra consulta.
+                query = f"""
+                INSERT INTO {E_EMPLOYE.TABLE.value} ({columnas})
+                SELECT LAST_INSERT_ID(COALESCE(MAX({E_EMPLOYE.NUMERO_NOMINA.value}), 0) + 1), %s, %s, %s, %s
+                FROM {E_EMPLOYE.TABLE.value}
+                """
+                numero_nomina = self.db.run_query(query, valores)["lastrowid"]
+            else:
+                query = f"""
+                INSERT INTO {E_EMPLOYE.TABLE.value} ({columnas})
+                VALUES (%s, %s, %s, %s, %s)
+                """
+                self.db.run_query(query, (numero_nomina, *valores))
+
+            return {
+                "status": "success",
+                "message": "Empleado registrado correctamente",
+                "numero_nomina": numero_nomina
+            }
         except Exception as ex:
             return {"status": "error", "message": f"Error al registrar el empleado: {ex}"}
 
@@ -73,7 +55,7 @@ class EmployesModel:
         """
         try:
             query = f"SELECT * FROM {E_EMPLOYE.TABLE.value}"
-            result = self.db.get_data_list(query, dictionary=True)
+            result = self.db.get_data_list(query, dictionary=True, cache=True)
             return {"status": "success", "data": result}
         except Exception as ex:
             return {"status": "error", "message": f"Error al obtener empleados: {ex}"}
@@ -87,7 +69,7 @@ class EmployesModel:
                 SELECT * FROM {E_EMPLOYE.TABLE.value}
                 WHERE {E_EMPLOYE.NUMERO_NOMINA.value} = %s
             """
-            return self.db.get_data(query, (numero_nomina,), dictionary=True)
+            return self.db.get_data(query, (numero_nomina,), dictionary=True, prepared=True)
         except Exception as ex:
             print(f"❌ Error al obtener el empleado: {ex}")
             return {}
@@ -103,14 +85,6 @@ class EmployesModel:
         except Exception as ex:
             return {"status": "error", "message": f"Error al eliminar el empleado: {ex}"}
 
-    def get_ultimo_numero_nomina(self) -> int:
-        try:
-            query = f"SELECT MAX({E_EMPLOYE.NUMERO_NOMINA.value}) AS ultimo FROM {E_EMPLOYE.TABLE.value}"
-            result = self.db.get_data(query, dictionary=True)
-            return int(result.get("ultimo", 0)) if result else 0
-        except Exception:
-            return 0
-
     def update(self, numero_nomina, estado, tipo_trabajador, sueldo_por_hora):
         """
         Actualiza un empleado por su número de nómina.
@@ -1,5 +1,5 @@
 from app.core.enums.e_prestamos_model import E_PRESTAMOS
-from app.core.interfaces.database_mysql import DatabaseMysql
+from app.core.interfaces.database import get_database
 from datetime import datetime
 
 class LoanModel:
@@ -9,76 +9,31 @@ class LoanModel:
     """
 
     def __init__(self):
-        self.db = DatabaseMysql()
+        self.db = get_database()
         self.E = E_PRESTAMOS
-        self._exists_table = self.check_table()
-
-    def check_table(self) -> bool:
-        """
-        Verifica si la tabla de préstamos existe y la crea si no.
-        """
-        try:
-            query = """
-                SELECT COUNT(*) AS c
-                FROM information_schema.tables
-                WHERE table_schema = %s AND table_name = %s
-            """
-            result = self.db.get_data(query, (self.db.database, self.E.TABLE.value), dictionary=True)
-            count = result.get("c", 0)
-
-            if count == 0:
-                print(f"⚠️ La tabla {self.E.TABLE.value} no existe. Creando...")
-
-                create_query = f"""
-                CREATE TABLE {self.E.TABLE.value} (
-                    {self.E.PRESTAMO_ID.value} INT AUTO_INCREMENT PRIMARY KEY,
-                    {self.E.PRESTAMO_NUMERO_NOMINA.value} SMALLINT UNSIGNED NOT NULL,
-                    {self.E.PRESTAMO_MONTO.value} DECIMAL(10,2) NOT NULL,
-                    {self.E.PRESTAMO_SALDO.value} DECIMAL(10,2) NOT NULL,
-                    {self.E.PRESTAMO_ESTADO.value} ENUM('pagando','terminado') NOT NULL,
-                    {self.E.PRESTAMO_FECHA_SOLICITUD.value} DATE NOT NULL,
-                    {self.E.PRESTAMO_FECHA_CREACION.value} TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    {self.E.PRESTAMO_FECHA_MODIFICACION.value} TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                    FOREIGN KEY ({self.E.PRESTAMO_NUMERO_NOMINA.value}) REFERENCES empleados(numero_nomina) ON DELETE CASCADE
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-                """
-                self.db.run_query(create_query)
-                print(f"✅ Tabla {self.E.TABLE.value} creada correctamente.")
-            else:
-                print(f"✔️ La tabla {self.E.TABLE.value} ya existe.")
-            return True
-        except Exception as ex:
-            print(f"❌ Error al verificar/crear la tabla {self.E.TABLE.value}: {ex}")
-            return False
 
     def add(self, numero_nomina, monto_prestamo, saldo_prestamo=None, estado="pagando", fecha_solicitud=None):
         try:
-            query_id = f"SELECT MAX({self.E.PRESTAMO_ID.value}) AS max_id FROM {self.E.TABLE.value}"
-            result = self.db.get_data(query_id, dictionary=True)
-            next_id = (result.get("max_id") or 0) + 1
-
             saldo = saldo_prestamo if saldo_prestamo is not None else monto_prestamo
             fecha = fecha_solicitud or datetime.today().strftime("%Y-%m-%d")
 
             query = f"""
                 INSERT INTO {self.E.TABLE.value} (
-                    {self.E.PRESTAMO_ID.value},
                     {self.E.PRESTAMO_NUMERO_NOMINA.value},
                     {self.E.PRESTAMO_MONTO.value},
                     {self.E.PRESTAMO_SALDO.value},
                     {self.E.PRESTAMO_ESTADO.value},
                     {self.E.PRESTAMO_FECHA_SOLICITUD.value}
-                ) VALUES (%s, %s, %s, %s, %s, %s)
+                ) VALUES (%s, %s, %s, %s, %s)
             """
-            self.db.run_query(query, (
-                next_id,
+            resultado = self.db.run_query(query, (
                 numero_nomina,
                 monto_prestamo,
                 saldo,
                 estado,
                 fecha
             ))
-            return {"status": "success", "message": "Préstamo registrado correctamente", "id": next_id}
+            return {"status": "success", "message": "Préstamo registrado correctamente", "id": resultado["lastrowid"]}
         except Exception as ex:
             return {"status": "error", "message": f"Error al registrar el préstamo: {ex}"}
 
@@ -143,11 +98,6 @@ class LoanModel:
         except Exception as ex:
             return {"status": "error", "message": f"Error al eliminar el préstamo: {ex}"}
 
-    def get_next_id_prestamo(self):
-        query = "SELECT AUTO_INCREMENT FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_SCHEMA = %s AND TABLE_NAME = 'prestamos'"
-        result = self.db.get_data(query, (self.db.database,), dictionary=True)
-        return result.get("AUTO_INCREMENT", None)
-
     def get_total_prestamos_por_empleado(self, numero_nomina: int, fecha_pago: str) -> float:
         try:
             query = f"""
@@ -181,6 +131,19 @@ class LoanModel:
             print(f"❌ Error al verificar préstamo activo: {ex}")
             return None
 
+    def get_prestamos_activos(self) -> dict:
+        """
+        Préstamos activos (estado = 'pagando') de todos los empleados en una sola consulta,
+        indexados por número de nómina (el de menor id si hubiera más de uno).
+        """
+        query = f"""
+            SELECT * FROM {self.E.TABLE.value}
+            WHERE {self.E.PRESTAMO_ESTADO.value} = 'pagando'
+            ORDER BY {self.E.PRESTAMO_ID.value} DESC
+        """
+        filas = self.db.get_data_list(query, dictionary=True, cache=True)
+        return {f[self.E.PRESTAMO_NUMERO_NOMINA.value]: f for f in filas}
+
     def get_prestamos_por_empleado(self, numero_nomina: int) -> list:
         query = """
             SELECT id_prestamo, saldo_prestamo, estado
@@ -188,4 +151,4 @@ class LoanModel:
             WHERE numero_nomina = %s
             ORDER BY fecha_solicitud DESC
         """
-        return self.db.get_data_list(query, (numero_nomina,), dictionary=True)
\ No newline at end of file
+        return self.db.get_data_list(query, (numero_nomina,), dictionary=True, cache=True)
\ No newline at end of file
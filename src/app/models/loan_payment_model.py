@@ -1,6 +1,6 @@
 from datetime import datetime
 from decimal import Decimal
-from app.core.interfaces.database_mysql import DatabaseMysql
+from app.core.interfaces.database import get_database
 from app.core.enums.e_loan_payment_model import E_PAGOS_PRESTAMO
 from app.core.enums.e_prestamos_model import E_PRESTAMOS
 
@@ -9,53 +9,9 @@ class LoanPaymentModel:
     INTERESES_PERMITIDOS = (5, 10, 15)
 
     def __init__(self):
-        self.db = DatabaseMysql()
+        self.db = get_database()
         self.E = E_PAGOS_PRESTAMO
         self.P = E_PRESTAMOS
-        self._exists_table = self.check_table()
-
-
-    def check_table(self) -> bool:
-        try:
-            query = """
-                SELECT COUNT(*) AS c
-                FROM information_schema.tables
-                WHERE table_schema = %s AND table_name = %s
-            """
-            result = self.db.get_data(query, (self.db.database, self.E.TABLE.value), dictionary=True)
-            if result.get("c", 0) == 0:
-                print(f"⚠️ La tabla {self.E.TABLE.value} no existe. Creando...")
-
-                create_query = f"""
-                CREATE TABLE {self.E.TABLE.value} (
-                    {self.E.PAGO_ID.value} INT AUTO_INCREMENT PRIMARY KEY,
-                    {self.E.PAGO_ID_PRESTAMO.value} INT NOT NULL,
-                    {self.E.PAGO_ID_NOMINA.value} INT NOT NULL,
-                    {self.E.PAGO_MONTO_PAGADO.value} DECIMAL(10,2) NOT NULL,
-                    {self.E.PAGO_FECHA_PAGO.value} DATE NOT NULL,
-                    {self.E.PAGO_FECHA_REAL.value} DATE,
-                    {self.E.PAGO_APLICADO.value} BOOLEAN NOT NULL DEFAULT 0,
-                    {self.E.PAGO_INTERES_PORCENTAJE.value} INT NOT NULL,
-                    {self.E.PAGO_INTERES_APLICADO.value} DECIMAL(10,2) NOT NULL,
-                    {self.E.PAGO_DIAS_RETRASO.value} INT DEFAULT 0,
-                    {self.E.PAGO_SALDO_RESTANTE.value} DECIMAL(10,2),
-                    {self.E.PAGO_OBSERVACIONES.value} TEXT,
-                    FOREIGN KEY ({self.E.PAGO_ID_PRESTAMO.value})
-                        REFERENCES {self.P.TABLE.value}({self.P.PRESTAMO_ID.value})
-                        ON DELETE CASCADE,
-                    FOREIGN KEY ({self.E.PAGO_ID_NOMINA.value})
-                        REFERENCES pagos(id_pago)
-                        ON DELETE CASCADE
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-                """
-                self.db.run_query(create_query)
-                print(f"✅ Tabla {self.E.TABLE.value} creada correctamente.")
-            else:
-                print(f"✔️ La tabla {self.E.TABLE.value} ya existe.")
-            return True
-        except Exception as ex:
-            print(f"❌ Error al verificar/crear la tabla: {ex}")
-            return False
 
 
     def add_payment(
@@ -71,75 +27,74 @@ class LoanPaymentModel:
         observaciones: str = None
     ):
         try:
-            # Obtener saldo actual del préstamo
-            result = self.db.get_data(f"""
-                SELECT {self.P.PRESTAMO_SALDO.value}
-                FROM {self.P.TABLE.value}
-                WHERE {self.P.PRESTAMO_ID.value} = %s
-            """, (id_prestamo,), dictionary=True)
-
-            if not result:
-                return {"status": "error", "message": "Préstamo no encontrado"}
-
-            saldo_actual = float(result.get(self.P.PRESTAMO_SALDO.value, 0))
-
             if interes_porcentaje not in self.INTERESES_PERMITIDOS:
                 return {"status": "error", "message": "Solo se permiten intereses del 5%, 10% o 15%"}
 
-            interes_aplicado = round(saldo_actual * (interes_porcentaje / 100), 2)
-            saldo_con_interes = saldo_actual + interes_aplicado
-            nuevo_saldo = round(saldo_con_interes - monto_pagado, 2)
-
             f_gen = datetime.strptime(fecha_generacion, "%Y-%m-%d")
             f_pago = datetime.strptime(fecha_real_pago or fecha_pago, "%Y-%m-%d")
             dias_retraso = max((f_pago - f_gen).days, 0)
 
-            # Insertar el nuevo pago
-            insert_query = f"""
-                INSERT INTO {self.E.TABLE.value} (
-                    {self.E.PAGO_ID_PRESTAMO.value},
-                    {self.E.PAGO_ID_NOMINA.value},
-                    {self.E.PAGO_MONTO_PAGADO.value},
-                    {self.E.PAGO_FECHA_PAGO.value},
-                    {self.E.PAGO_FECHA_REAL.value},
-                    {self.E.PAGO_APLICADO.value},
-                    {self.E.PAGO_INTERES_PORCENTAJE.value},
-                    {self.E.PAGO_INTERES_APLICADO.value},
-                    {self.E.PAGO_DIAS_RETRASO.value},
-                    {self.E.PAGO_SALDO_RESTANTE.value},
-                    {self.E.PAGO_OBSERVACIONES.value}
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            self.db.run_query(insert_query, (
-                id_prestamo,
-                id_pago_nomina,
-                monto_pagado,
-                fecha_pago,
-                fecha_real_pago or fecha_pago,
-                aplicado,
-                interes_porcentaje,
-                interes_aplicado,
-                dias_retraso,
-                nuevo_saldo,
-                observaciones
-            ))
-
-            # Actualizar el saldo del préstamo
-            self.db.run_query(
-                f"UPDATE {self.P.TABLE.value} SET {self.P.PRESTAMO_SALDO.value} = %s WHERE {self.P.PRESTAMO_ID.value} = %s",
-                (nuevo_saldo, id_prestamo)
-            )
-
-            # Si el saldo está saldado, actualizar el estado
-            if nuevo_saldo <= 0:
-                self.db.run_query(
-                    f"UPDATE {self.P.TABLE.value} SET {self.P.PRESTAMO_ESTADO.value} = 'terminado' WHERE {self.P.PRESTAMO_ID.value} = %s",
-                    (id_prestamo,)
-                )
+            # Lectura del saldo, registro del pago y actualización del préstamo en una sola transacción
+            with self.db.transaction():
+                # Obtener saldo actual del préstamo (bloqueado hasta el COMMIT)
+                result = self.db.get_data(f"""
+                    SELECT {self.P.PRESTAMO_SALDO.value}
+                    FROM {self.P.TABLE.value}
+                    WHERE {self.P.PRESTAMO_ID.value} = %s
+                    FOR UPDATE
+                """, (id_prestamo,), dictionary=True)
+
+                if not result:
+                    return {"status": "error", "message": "Préstamo no encontrado"}
+
+                saldo_actual = float(result.get(self.P.PRESTAMO_SALDO.value, 0))
+
+                interes_aplicado = round(saldo_actual * (interes_porcentaje / 100), 2)
+                saldo_con_interes = saldo_actual + interes_aplicado
+                nuevo_saldo = round(saldo_con_interes - monto_pagado, 2)
+
+                # Insertar el nuevo pago
+                insert_query = f"""
+                    INSERT INTO {self.E.TABLE.value} (
+                        {self.E.PAGO_ID_PRESTAMO.value},
+                        {self.E.PAGO_ID_NOMINA.value},
+                        {self.E.PAGO_MONTO_PAGADO.value},
+                        {self.E.PAGO_FECHA_PAGO.value},
+                        {self.E.PAGO_FECHA_REAL.value},
+                        {self.E.PAGO_APLICADO.value},
+                        {self.E.PAGO_INTERES_PORCENTAJE.value},
+                        {self.E.PAGO_INTERES_APLICADO.value},
+                        {self.E.PAGO_DIAS_RETRASO.value},
+                        {self.E.PAGO_SALDO_RESTANTE.value},
+                        {self.E.PAGO_OBSERVACIONES.value}
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """
+                id_pago_prestamo = self.db.run_query(insert_query, (
+                    id_prestamo,
+                    id_pago_nomina,
+                    monto_pagado,
+                    fecha_pago,
+                    fecha_real_pago or fecha_pago,
+                    aplicado,
+                    interes_porcentaje,
+                    interes_aplicado,
+                    dias_retraso,
+                    nuevo_saldo,
+                    observaciones
+                ))["lastrowid"]
+
+                # Actualizar el saldo del préstamo y, si quedó saldado, su estado
+                self.db.run_query(f"""
+                    UPDATE {self.P.TABLE.value}
+                    SET {self.P.PRESTAMO_SALDO.value} = %s,
+                        {self.P.PRESTAMO_ESTADO.value} = IF(%s <= 0, 'terminado', {self.P.PRESTAMO_ESTADO.value})
+                    WHERE {self.P.PRESTAMO_ID.value} = %s
+                """, (nuevo_saldo, nuevo_saldo, id_prestamo))
 
             return {
                 "status": "success",
-                "message": f"Pago registrado. Interés: ${interes_aplicado}, nuevo saldo: ${nuevo_saldo}, retraso: {dias_retraso} días"
+                "message": f"Pago registrado. Interés: ${interes_aplicado}, nuevo saldo: ${nuevo_saldo}, retraso: {dias_retraso} días",
+                "id": id_pago_prestamo
             }
 
         except Exception as ex:
@@ -207,13 +162,6 @@ class LoanPaymentModel:
             return {}
 
 
-    def get_next_id(self):
-        query = f"SELECT MAX({self.E.PAGO_ID.value}) AS max_id FROM {self.E.TABLE.value}"
-        result = self.db.get_data(query, dictionary=True)
-        max_id = result.get("max_id", 0) if result else 0
-        return int(max_id) + 1 if max_id else 1
-
-
     def get_prestamo_activo_por_empleado(self, numero_nomina: int) -> dict:
         try:
             query = f"""
@@ -2,129 +2,20 @@ from datetime import datetime, date
 from app.core.enums.e_payment_model import E_PAYMENT
 from app.core.enums.e_discount_model import E_DISCOUNT
 from app.core.enums.e_prestamos_model import E_PRESTAMOS
-from app.core.interfaces.database_mysql import DatabaseMysql
+from app.core.interfaces.database import get_database
 from app.models.employes_model import EmployesModel
 from app.models.discount_model import DiscountModel
 from app.models.loan_model import LoanModel
 from app.models.loan_payment_model import LoanPaymentModel
+from app.core.model_registry import get_model
 
 class PaymentModel:
     def __init__(self):
-        self.db = DatabaseMysql()
-        self.employee_model = EmployesModel()
-        self._exists_table = self.check_table()
-        self.discount_model = DiscountModel()
-        self.loan_model = LoanModel()
-        self.loan_payment_model = LoanPaymentModel()
-
-
-    def check_table(self) -> bool:
-        try:
-            query = """
-                SELECT COUNT(*) AS c
-                FROM information_schema.tables
-                WHERE table_schema = %s AND table_name = %s
-            """
-            result = self.db.get_data(query, (self.db.database, E_PAYMENT.TABLE.value), dictionary=True)
-            if result.get("c", 0) == 0:
-                print(f"⚠️ La tabla {E_PAYMENT.TABLE.value} no existe. Creando...")
-
-                create_query = f"""
-                CREATE TABLE IF NOT EXISTS {E_PAYMENT.TABLE.value} (
-                    {E_PAYMENT.ID.value} INT AUTO_INCREMENT PRIMARY KEY,
-                    {E_PAYMENT.NUMERO_NOMINA.value} SMALLINT UNSIGNED NOT NULL,
-                    {E_PAYMENT.FECHA_PAGO.value} DATE NOT NULL,
-                    {E_PAYMENT.TOTAL_HORAS_TRABAJADAS.value} DECIMAL(5,2) DEFAULT 0,
-                    {E_PAYMENT.MONTO_BASE.value} DECIMAL(10,2) NOT NULL,
-                    {E_PAYMENT.MONTO_TOTAL.value} DECIMAL(10,2) NOT NULL,
-                    {E_DISCOUNT.MONTO_DESCUENTO.value} DECIMAL(10,2) DEFAULT 0,
-                    {E_PRESTAMOS.PRESTAMO_MONTO.value} DECIMAL(10,2) DEFAULT 0,
-                    {E_PAYMENT.SALDO.value} DECIMAL(10,2) DEFAULT 0,
-                    {E_PAYMENT.PAGO_DEPOSITO.value} DECIMAL(10,2) NOT NULL,
-                    {E_PAYMENT.PAGO_EFECTIVO.value} DECIMAL(10,2) NOT NULL,
-                    {E_PAYMENT.ESTADO.value} VARCHAR(20) DEFAULT 'pendiente',
-                    fecha_creacion TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    fecha_modificacion TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                    FOREIGN KEY ({E_PAYMENT.NUMERO_NOMINA.value})
-                        REFERENCES empleados(numero_nomina)
-                        ON DELETE CASCADE
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-                """
-                self.db.run_query(create_query)
-                print(f"✅ Tabla {E_PAYMENT.TABLE.value} creada correctamente.")
-            else:
-                print(f"✔️ La tabla {E_PAYMENT.TABLE.value} ya existe.")
-            return True
-        except Exception as ex:
-            print(f"❌ Error al verificar/crear la tabla {E_PAYMENT.TABLE.value}: {ex}")
-            return False
-
-
-    def crear_sp_horas_trabajadas_para_pagos(self):
-        """
-        Crea el stored procedure 'horas_trabajadas_para_pagos' si no existe.
-        Este procedimiento usa el campo correcto 'tiempo_trabajo' de la tabla asistencias.
-        """
-        try:
-            check_query = """
-                SELECT COUNT(*) AS c
-                FROM information_schema.routines
-                WHERE routine_schema = %s
-                AND routine_name = 'horas_trabajadas_para_pagos'
-                AND routine_type = 'PROCEDURE'
-            """
-            result = self.db.get_data(check_query, (self.db.database,), dictionary=True)
-            if result.get("c", 0) == 0:
-                print("⚠️ Stored Procedure 'horas_trabajadas_para_pagos' no existe. Creando...")
-
-                cursor = self.db.connection.cursor()
-                cursor.execute("DROP PROCEDURE IF EXISTS horas_trabajadas_para_pagos")
-
-                sp_sql = """
-                CREATE PROCEDURE horas_trabajadas_para_pagos (
-                    IN p_numero_nomina INT,
-                    IN p_fecha_inicio DATE,
-                    IN p_fecha_fin DATE
-                )
-                BEGIN
-                    IF p_numero_nomina IS NOT NULL THEN
-                        IF EXISTS (SELECT 1 FROM empleados WHERE numero_nomina = p_numero_nomina) THEN
-                            SELECT
-                                a.numero_nomina,
-                                e.nombre_completo,
-                                IFNULL(SEC_TO_TIME(SUM(TIME_TO_SEC(a.tiempo_trabajo))), '00:00:00') AS total_horas_trabajadas
-                            FROM asistencias a
-                            JOIN empleados e ON a.numero_nomina = e.numero_nomina
-                            WHERE a.numero_nomina = p_numero_nomina
-                            AND a.fecha BETWEEN p_fecha_inicio AND p_fecha_fin
-                            AND a.estado = 'completo'
-                            GROUP BY a.numero_nomina, e.nombre_completo;
-                        ELSE
-                            SELECT 'Empleado no encontrado' AS mensaje;
-                        END IF;
-                    ELSE
-                        SELECT
-                            a.numero_nomina,
-                            e.nombre_completo,
-                            IFNULL(SEC_TO_TIME(SUM(TIME_TO_SEC(a.tiempo_trabajo))), '00:00:00') AS total_horas_trabajadas
-                        FROM asistencias a
-                        JOIN empleados e ON a.numero_nomina = e.numero_nomina
-                        WHERE a.fecha BETWEEN p_fecha_inicio AND p_fecha_fin
-                        AND a.estado = 'completo'
-                        GROUP BY a.numero_nomina, e.nombre_completo;
-                    END IF;
-                END
-                """
-
-                cursor.execute(sp_sql)
-                self.db.connection.commit()
-                cursor.close()
-
-                print("✅ Stored Procedure 'horas_trabajadas_para_pagos' creado correctamente.")
-            else:
-                print("✔️ Stored Procedure 'horas_trabajadas_para_pagos' ya existe.")
-        except Exception as ex:
-            print(f"❌ Error al crear SP 'horas_trabajadas_para_pagos': {ex}")
+        self.db = get_database()
+        self.employee_model = get_model(EmployesModel)
+        self.discount_model = get_model(DiscountModel)
+        self.loan_model = get_model(LoanModel)
+        self.loan_payment_model = get_model(LoanPaymentModel)
 
 
     def registrar_pago_manual(self, numero_nomina: int) -> dict:
@@ -257,31 +148,36 @@ class PaymentModel:
                 monto_base,
                 monto_base
             )
-            self.db.run_query(insert_query, params)
-            id_pago = self.db.get_last_insert_id()
-
-            # Aplicar descuentos ahora con el ID real
-            self.discount_model.agregar_descuentos_opcionales(
-                numero_nomina=numero_nomina,
-                id_pago=id_pago,
-                aplicar_imss=True,
-                aplicar_transporte=True,
-                aplicar_comida=True,
-                estado_comida="media"
-            )
+            # Pago, descuentos y montos finales se confirman juntos o no se guarda nada
+            with self.db.transaction():
+                id_pago = self.db.run_query(insert_query, params)["lastrowid"]
+
+                # Aplicar descuentos ahora con el ID real
+                descuentos = self.discount_model.agregar_descuentos_opcionales(
+                    numero_nomina=numero_nomina,
+                    id_pago=id_pago,
+                    aplicar_imss=True,
+                    aplicar_transporte=True,
+                    aplicar_comida=True,
+                    estado_comida="media"
+                )
+                if descuentos.get("status") != "success":
+                    raise RuntimeError(descuentos.get("message", "No se pudieron aplicar los descuentos."))
 
-            total_descuentos = self.discount_model.get_total_descuentos_por_pago(id_pago)
-            total_prestamos = self.loan_model.get_total_prestamos_por_empleado(numero_nomina, fecha_fin)
+                total_descuentos = self.discount_model.get_total_descuentos_por_pago(id_pago)
+                total_prestamos = self.loan_model.get_total_prestamos_por_empleado(numero_nomina, fecha_fin)
 
-            monto_final = max(0.0, monto_base - total_descuentos - total_prestamos)
+                monto_final = max(0.0, monto_base - total_descuentos - total_prestamos)
 
-            # Actualizar campos restantes del pago
-            self.update_pago(id_pago, {
-                E_PAYMENT.MONTO_TOTAL.value: monto_final,
-                E_DISCOUNT.MONTO_DESCUENTO.value: total_descuentos,
-                E_PRESTAMOS.PRESTAMO_MONTO.value: total_prestamos,
-                E_PAYMENT.PAGO_EFECTIVO.value: monto_final
-            })
+                # Actualizar campos restantes del pago
+                actualizado = self.update_pago(id_pago, {
+                    E_PAYMENT.MONTO_TOTAL.value: monto_final,
+                    E_DISCOUNT.MONTO_DESCUENTO.value: total_descuentos,
+                    E_PRESTAMOS.PRESTAMO_MONTO.value: total_prestamos,
+                    E_PAYMENT.PAGO_EFECTIVO.value: monto_final
+                })
+                if actualizado["status"] != "success":
+                    raise RuntimeError(actualizado["message"])
 
             return {
                 "status": "success",
@@ -387,7 +283,7 @@ class PaymentModel:
         Asegura que todas sean objetos datetime.date
         """
         query = "SELECT DISTINCT fecha_pago FROM pagos"
-        resultados = self.db.get_data_list(query, dictionary=True)
+        resultados = self.db.get_data_list(query, dictionary=True, cache=True)
         return [r["fecha_pago"] for r in resultados if isinstance(r.get("fecha_pago"), (datetime, date))]
 
 
@@ -452,7 +348,7 @@ class PaymentModel:
                 """
                 params = (numero_nomina, fecha)
 
-            res = self.db.get_data(query, params, dictionary=True)
+            res = self.db.get_data(query, params, dictionary=True, prepared=True)
             return res.get("c", 0) > 0
         except:
             return False
@@ -473,29 +369,35 @@ class PaymentModel:
 
             # Convertir descuentos del dict al formato esperado por guardar_o_actualizar_descuentos
             numero_nomina = pago["data"].get("numero_nomina")
-            self.discount_model.guardar_o_actualizar_descuentos(
-                id_pago=id_pago,
-                numero_nomina=numero_nomina,
-                monto_imss=descuentos.get("monto_imss", 0.0),
-                monto_transporte=descuentos.get("monto_transporte", 0.0),
-                monto_comida=descuentos.get("monto_comida", 0.0),
-                monto_extra=descuentos.get("monto_extra", 0.0),
-                descripcion_extra=descuentos.get("descripcion_extra", "")
-            )
+            with self.db.transaction():
+                guardado = self.discount_model.guardar_o_actualizar_descuentos(
+                    id_pago=id_pago,
+                    numero_nomina=numero_nomina,
+                    monto_imss=descuentos.get("monto_imss", 0.0),
+                    monto_transporte=descuentos.get("monto_transporte", 0.0),
+                    monto_comida=descuentos.get("monto_comida", 0.0),
+                    monto_extra=descuentos.get("monto_extra", 0.0),
+                    descripcion_extra=descuentos.get("descripcion_extra", "")
+                )
+                if guardado["status"] != "success":
+                    raise RuntimeError(guardado["message"])
 
-            total_descuentos = self.discount_model.get_total_descuentos_por_pago(id_pago)
-            total_prestamos = self.loan_payment_model.get_total_prestamos_por_pago(id_pago)
+                total_descuentos = self.discount_model.get_total_descuentos_por_pago(id_pago)
+                total_prestamos = self.loan_payment_model.get_total_prestamos_por_pago(id_pago)
 
-            monto_final = max(0.0, monto_base - total_descuentos - total_prestamos)
+                monto_final = max(0.0, monto_base - total_descuentos - total_prestamos)
 
-            campos_actualizados = {
-                E_PAYMENT.MONTO_TOTAL.value: monto_final,
-                E_PAYMENT.PAGO_EFECTIVO.value: monto_final,
-                E_DISCOUNT.MONTO_DESCUENTO.value: total_descuentos,
-                E_PRESTAMOS.PRESTAMO_MONTO.value: total_prestamos,
-                E_PAYMENT.ESTADO.value: estado
-            }
-            return self.update_pago(id_pago, campos_actualizados)
+                campos_actualizados = {
+                    E_PAYMENT.MONTO_TOTAL.value: monto_final,
+                    E_PAYMENT.PAGO_EFECTIVO.value: monto_final,
+                    E_DISCOUNT.MONTO_DESCUENTO.value: total_descuentos,
+                    E_PRESTAMOS.PRESTAMO_MONTO.value: total_prestamos,
+                    E_PAYMENT.ESTADO.value: estado
+                }
+                actualizado = self.update_pago(id_pago, campos_actualizados)
+                if actualizado["status"] != "success":
+                    raise RuntimeError(actualizado["message"])
+            return actualizado
 
         except Exception as ex:
             print(f"❌ Error en update_pago_completo: {ex}")
@@ -522,10 +424,13 @@ class PaymentModel:
             if not isinstance(id_pago, int) or id_pago <= 0:
                 return {"status": "error", "message": "ID de pago inválido"}
 
-            self.discount_model.delete_by_pago(id_pago)
+            with self.db.transaction():
+                eliminado = self.discount_model.delete_by_pago(id_pago)
+                if eliminado["status"] != "success":
+                    raise RuntimeError(eliminado["message"])
 
-            delete_query = f"DELETE FROM {E_PAYMENT.TABLE.value} WHERE {E_PAYMENT.ID.value} = %s"
-            self.db.run_query(delete_query, (id_pago,))
+                delete_query = f"DELETE FROM {E_PAYMENT.TABLE.value} WHERE {E_PAYMENT.ID.value} = %s"
+                self.db.run_query(delete_query, (id_pago,))
 
             print(f"🗑️ Pago con ID {id_pago} eliminado correctamente.")
             return {"status": "success", "message": "Pago eliminado correctamente."}
@@ -1,54 +1,9 @@
 from app.core.enums.e_user_model import E_USER
-from app.core.interfaces.database_mysql import DatabaseMysql
+from app.core.interfaces.database import get_database
 
 class UserModel:
     def __init__(self):
-        self.db = DatabaseMysql()
-        self.check_table()
-        self.check_root_user()
-
-    def check_table(self) -> bool:
-        try:
-            query = """
-                SELECT COUNT(*) AS c FROM information_schema.tables 
-                WHERE table_schema = %s AND table_name = %s
-            """
-            result = self.db.get_data(query, (self.db.database, E_USER.TABLE.value), dictionary=True)
-            if result.get("c", 0) == 0:
-                print(f"⚠️ Tabla '{E_USER.TABLE.value}' no existe. Creando...")
-                create_query = f"""
-                CREATE TABLE {E_USER.TABLE.value} (
-                    {E_USER.ID.value} INT AUTO_INCREMENT PRIMARY KEY,
-                    {E_USER.USERNAME.value} VARCHAR(100) NOT NULL UNIQUE,
-                    {E_USER.PASSWORD.value} VARCHAR(255) NOT NULL,
-                    {E_USER.ROLE.value} ENUM('root','user') NOT NULL DEFAULT 'user',
-                    {E_USER.FECHA_CREACION.value} TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    {E_USER.FECHA_MODIFICACION.value} TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
-                """
-                self.db.run_query(create_query)
-                print("✅ Tabla creada correctamente.")
-            return True
-        except Exception as ex:
-            print(f"❌ Error al verificar/crear tabla: {ex}")
-            return False
-
-    def check_root_user(self):
-        try:
-            # Verifica si hay al menos un usuario registrado
-            query = f"SELECT COUNT(*) AS total FROM {E_USER.TABLE.value}"
-            result = self.db.get_data(query, (), dictionary=True)
-
-            if result.get("total", 0) == 0:
-                print("🔐 No hay usuarios registrados. Creando usuario 'root' y 'usuario' por defecto...")
-
-                self.add(username='root', password_hash='root', role='root')       # ⚠️ Hashear en producción
-                self.add(username='usuario', password_hash='usuario', role='user') # ⚠️ Hashear en producción
-            else:
-                print("✅ Ya existen usuarios. No se crean usuarios por defecto.")
-        except Exception as ex:
-            print(f"❌ Error verificando usuarios por defecto: {ex}")
-
+        self.db = get_database()
 
     def add(self, username: str, password_hash: str, role: str = 'user') -> dict:
         try:
@@ -59,8 +14,12 @@ class UserModel:
                     ({E_USER.USERNAME.value}, {E_USER.PASSWORD.value}, {E_USER.ROLE.value})
                 VALUES (%s, %s, %s)
             """
-            self.db.run_query(query, (username, password_hash, role))
-            return {"status": "success", "message": f"Usuario '{username}' agregado correctamente."}
+            resultado = self.db.run_query(query, (username, password_hash, role))
+            return {
+                "status": "success",
+                "message": f"Usuario '{username}' agregado correctamente.",
+                "id": resultado["lastrowid"]
+            }
         except Exception as ex:
             return {"status": "error", "message": f"Error al agregar usuario: {ex}"}
 
@@ -113,15 +72,6 @@ class UserModel:
         except Exception as ex:
             return {"status": "error", "message": f"Error al eliminar usuario: {ex}"}
 
-    def get_last_id(self) -> int:
-        try:
-            query = f"SELECT MAX({E_USER.ID.value}) AS last_id FROM {E_USER.TABLE.value}"
-            result = self.db.get_data(query, dictionary=True)
-            return result.get("last_id", 0) or 0
-        except Exception as ex:
-            print(f"❌ Error al obtener el último ID: {ex}")
-            return 0
-        
     def get_password(self, user_id: int) -> dict:
         """
         Retorna la contraseña de un usuario específico.
@@ -1,16 +1,21 @@
 import flet as ft
-import pandas as pd
 from datetime import datetime, timedelta
 import functools
 from app.models.assistance_model import AssistanceModel
+from app.core.model_registry import get_model
+from app.core.reference_cache import ReferenceCache
 from app.core.enums.e_assistance_model import E_ASSISTANCE
 from app.controllers.asistencias_import_controller import AsistenciasImportController
 from app.core.app_state import AppState
+from app.core.interfaces.query_stats import medir_accion
 from app.core.invokers.file_save_invoker import FileSaveInvoker
 from app.views.containers.theme_controller import ThemeController
 from app.views.containers.modal_alert import ModalAlert
 from app.views.containers.window_snackbar import WindowSnackbar
-from tabulate import tabulate
+from app.helpers.lazy_import import lazy_import
+
+tabulate = lazy_import("tabulate")
+openpyxl = lazy_import("openpyxl")
 
 
 class AsistenciasContainer(ft.Container):
@@ -22,7 +27,7 @@ class AsistenciasContainer(ft.Container):
         )
 
         self.page = AppState().page
-        self.asistencia_model = AssistanceModel()
+        self.asistencia_model = get_model(AssistanceModel)
         self.theme_ctrl = ThemeController()
 
         self.sort_key = "numero_nomina"
@@ -58,6 +63,12 @@ class AsistenciasContainer(ft.Container):
             on_tap=lambda _: self.import_controller.file_invoker.open()
         )
 
+        self.import_folder_button = self._build_action_button(
+            label="Importar carpeta",
+            icon=ft.icons.FOLDER_OPEN_OUTLINED,
+            on_tap=lambda _: self.import_controller.file_invoker.open_directory()
+        )
+
         self.export_button = self._build_action_button(
             label="Exportar",
             icon_path="assets/buttons/export-button.png",
@@ -91,6 +102,7 @@ class AsistenciasContainer(ft.Container):
         self._actualizar_tabla()
 
 
+    @medir_accion("AsistenciasContainer._actualizar_tabla")
     def _actualizar_tabla(self, _=None):
         datos = self.asistencia_model.get_all()["data"]
         datos.sort(key=lambda x: x.get(self.sort_key, 0), reverse=not self.sort_asc)
@@ -209,6 +221,7 @@ class AsistenciasContainer(ft.Container):
                             alignment=ft.MainAxisAlignment.START,
                             controls=[
                                 self.import_button,
+                                self.import_folder_button,
                                 self.export_button,
                                 self.new_column_button
                             ]
@@ -271,14 +284,11 @@ class AsistenciasContainer(ft.Container):
 
 
     def _exportar_asistencias(self, path: str):
+        """
+        Exporta las asistencias a Excel escribiendo fila por fila (openpyxl en modo
+        write-only) mientras se leen en bloques de la base de datos.
+        """
         try:
-            resultado = self.asistencia_model.get_all()
-            if resultado["status"] != "success":
-                print("❌ Error al obtener asistencias:", resultado["message"])
-                return
-
-            datos = resultado["data"]
-
             columnas = [
                 ("numero_nomina", "ID Checador"),
                 ("nombre", "Nombre"),
@@ -290,37 +300,46 @@ class AsistenciasContainer(ft.Container):
                 ("tiempo_trabajo", "Tiempo de trabajo")
             ]
 
+            fecha_min = ReferenceCache().get("fecha_minima_asistencia")
+            fecha_max = ReferenceCache().get("fecha_maxima_asistencia")
+            periodo = (
+                [f"Periodo: {fecha_min.strftime('%d/%m/%Y')} al {fecha_max.strftime('%d/%m/%Y')}"]
+                if fecha_min and fecha_max else [""]
+            )
+
             encabezado = [
                 ["CONTROL de Mexico"],
                 ["Entradas y Salidas"],
-                [f"Periodo: {datos[0]['fecha']} al {datos[-1]['fecha']}"] if datos else [""],
+                periodo,
                 ["Sucursales: Sucursal Matriz,Soriana,Mattel"],
                 []
             ]
 
-            cuerpo = []
-            for reg in datos:
-                fila = []
-                for clave, _ in columnas:
-                    valor = reg.get(clave)
-                    if isinstance(valor, (datetime, pd.Timestamp)):
-                        fila.append(valor.strftime("%H:%M:%S"))
-                    elif isinstance(valor, str) and ":" in valor:
-                        fila.append(valor)
-                    elif valor in [None, ""]:
-                        fila.append("00:00:00" if "hora" in clave or "tiempo" in clave or clave in ["retardo"] else "")
-                    else:
-                        fila.append(str(valor))
-                cuerpo.append(fila)
-
-            df = pd.DataFrame(cuerpo, columns=[n for _, n in columnas])
-            with pd.ExcelWriter(path, engine="openpyxl") as writer:
-                df.to_excel(writer, startrow=5, index=False, sheet_name="Asistencias")
-                for idx, fila in enumerate(encabezado, 1):
-                    for col_idx, val in enumerate(fila, 1):
-                        writer.sheets["Asistencias"].cell(row=idx, column=col_idx, value=val)
-
-            print(f"✅ Asistencias exportadas a: {path}")
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet("Asistencias")
+            for fila in encabezado:
+                ws.append(fila)
+            ws.append([n for _, n in columnas])
+
+            total = 0
+            for bloque in self.asistencia_model.iter_all():
+                for reg in bloque:
+                    fila = []
+                    for clave, _ in columnas:
+                        valor = reg.get(clave)
+                        if isinstance(valor, datetime):
+                            fila.append(valor.strftime("%H:%M:%S"))
+                        elif isinstance(valor, str) and ":" in valor:
+                            fila.append(valor)
+                        elif valor in [None, ""]:
+                            fila.append("00:00:00" if "hora" in clave or "tiempo" in clave or clave in ["retardo"] else "")
+                        else:
+                            fila.append(str(valor))
+                    ws.append(fila)
+                    total += 1
+
+            wb.save(path)
+            print(f"✅ {total} asistencias exportadas a: {path}")
         except Exception as e:
             print(f"❌ Error al exportar: {e}")
 
@@ -339,7 +358,7 @@ class AsistenciasContainer(ft.Container):
         columnas = [e.value for e in E_ASSISTANCE]
         tabla = [[registro.get(col) for col in columnas] for registro in datos]
         print("\n📋 Asistencias registradas en la base de datos:")
-        print(tabulate(tabla, headers=columnas, tablefmt="grid"))
+        print(tabulate.tabulate(tabla, headers=columnas, tablefmt="grid"))
 
     def _insertar_asistencia_desde_columna(self, _):
         numero_input = ft.TextField(hint_text="ID Empleado", width=120, keyboard_type=ft.KeyboardType.NUMBER)
@@ -3,14 +3,14 @@
 import flet as ft
 from app.core.app_state import AppState
 from app.core.invokers.file_save_invoker import FileSaveInvoker
-from app.core.interfaces.database_mysql import DatabaseMysql
+from app.core.interfaces.database import get_database
 from app.views.containers.messages import mostrar_mensaje
 
 class DatabaseSettingsArea(ft.Container):
     def __init__(self, page: ft.Page):
         super().__init__(expand=True, padding=20)
         self.page = page  # Este sí es el que viene de Flet, no del AppState
-        self.db = DatabaseMysql()
+        self.db = get_database()
         self._setup_invoker()
         self._build_ui()
 
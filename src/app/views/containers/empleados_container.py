@@ -1,18 +1,22 @@
 import flet as ft
-import pandas as pd
+from app.helpers.lazy_import import lazy_import
 from app.core.app_state import AppState
 from app.controllers.employes_import_controller import EmpleadosImportController
 from app.models.employes_model import EmployesModel
+from app.core.model_registry import get_model
+from app.core.reference_cache import ReferenceCache
 from app.views.containers.modal_alert import ModalAlert
 from app.core.invokers.file_save_invoker import FileSaveInvoker
 
+pd = lazy_import("pandas")
+
 
 class EmpleadosContainer(ft.Container):
     def __init__(self):
         super().__init__()
 
         self.page = AppState().page
-        self.empleado_model = EmployesModel()
+        self.empleado_model = get_model(EmployesModel)
         self.fila_editando = None
 
         self.orden_actual = {
@@ -98,8 +102,7 @@ class EmpleadosContainer(ft.Container):
         self.orden_actual = {k: None for k in self.orden_actual}
         self.orden_actual[columna] = "asc" if ascendente else "desc"
 
-        empleados_result = self.empleado_model.get_all()
-        empleados = empleados_result.get("data", [])
+        empleados = ReferenceCache().get("empleados", [])
 
         if columna in ("numero_nomina", "sueldo_por_hora"):
             empleados.sort(key=lambda x: float(x[columna]), reverse=not ascendente)
@@ -116,8 +119,7 @@ class EmpleadosContainer(ft.Container):
 
 
     def _actualizar_tabla(self, path: str = "", fila_en_edicion=None):
-        empleados_result = self.empleado_model.get_all()
-        empleados = empleados_result.get("data", [])
+        empleados = ReferenceCache().get("empleados", [])
         self.fila_editando = fila_en_edicion
         self._refrescar_tabla(empleados)
 
@@ -309,8 +311,6 @@ class EmpleadosContainer(ft.Container):
         tipo_dropdown = ft.Dropdown(options=[ft.dropdown.Option("taller"), ft.dropdown.Option("externo"), ft.dropdown.Option("no definido")])
         sueldo_input = ft.TextField(hint_text="Sueldo diario", keyboard_type=ft.KeyboardType.NUMBER)
 
-        nuevo_id = self.empleado_model.get_ultimo_numero_nomina() + 1
-
         def validar_nombre_input(_):
             valor = nombre_input.value.strip()
             if len(valor) < 3 or not all(char.isalpha() or char.isspace() for char in valor):
@@ -350,7 +350,7 @@ class EmpleadosContainer(ft.Container):
                     raise ValueError("Sueldo negativo")
 
                 resultado = self.empleado_model.add(
-                    numero_nomina=nuevo_id,
+                    numero_nomina=None,
                     nombre_completo=nombre,
                     estado=estado_dropdown.value,
                     tipo_trabajador=tipo_dropdown.value,
@@ -358,7 +358,7 @@ class EmpleadosContainer(ft.Container):
                 )
 
                 if resultado["status"] == "success":
-                    ModalAlert.mostrar_info("Éxito", f"Empleado agregado con ID {nuevo_id}")
+                    ModalAlert.mostrar_info("Éxito", f"Empleado agregado con ID {resultado['numero_nomina']}")
                     self._actualizar_tabla("")
                 else:
                     ModalAlert.mostrar_info("Error", resultado["message"])
@@ -371,7 +371,7 @@ class EmpleadosContainer(ft.Container):
             self.page.update()
 
         nueva_fila = ft.DataRow(cells=[
-            ft.DataCell(ft.Text(str(nuevo_id))),
+            ft.DataCell(ft.Text("Auto")),
             ft.DataCell(nombre_input),
             ft.DataCell(estado_dropdown),
             ft.DataCell(tipo_dropdown),
@@ -0,0 +1,70 @@
+import flet as ft
+
+
+class ImportProgress:
+    """
+    Panel flotante (esquina inferior derecha) con el avance de una importación en segundo plano:
+    barra de progreso, filas leídas/escritas, filas por segundo, tiempo restante y botón Cancelar.
+    `actualizar` recibe el `snapshot()` de un `ImportJob` y puede llamarse desde otro hilo.
+    """
+
+    def __init__(self, page: ft.Page, titulo: str):
+        self.page = page
+        self.job = None
+
+        self.titulo = ft.Text(titulo, weight="bold", size=13)
+        self.barra = ft.ProgressBar(width=320, value=None)
+        self.detalle = ft.Text("", size=11)
+        self.boton_cancelar = ft.TextButton("Cancelar", on_click=self._cancelar)
+
+        self.panel = ft.Container(
+            right=20,
+            bottom=20,
+            width=360,
+            padding=12,
+            border_radius=12,
+            bgcolor=ft.colors.SURFACE_VARIANT,
+            shadow=ft.BoxShadow(blur_radius=8, color=ft.colors.with_opacity(0.3, ft.colors.BLACK)),
+            visible=False,
+            content=ft.Column(
+                spacing=6,
+                tight=True,
+                controls=[
+                    ft.Row([self.titulo, self.boton_cancelar], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+                    self.barra,
+                    self.detalle,
+                ]
+            )
+        )
+
+    def mostrar(self, job) -> None:
+        self.job = job
+        if self.panel not in self.page.overlay:
+            self.page.overlay.append(self.panel)
+        self.barra.value = None
+        self.detalle.value = "Preparando..."
+        self.boton_cancelar.disabled = False
+        self.panel.visible = True
+        self.page.update()
+
+    def actualizar(self, progreso: dict) -> None:
+        self.barra.value = progreso["fraccion"]  # None: barra indeterminada
+        partes = [
+            progreso["etapa"],
+            f"{progreso['leidas']:,} leídas · {progreso['escritas']:,} escritas",
+            f"{progreso['filas_por_segundo']:,.0f} filas/s",
+        ]
+        if progreso["eta"] is not None:
+            partes.append(f"~{progreso['eta']:.0f} s restantes")
+        self.detalle.value = "\n".join(partes)
+        self.boton_cancelar.disabled = progreso["cancelado"]
+        self.page.update()
+
+    def ocultar(self) -> None:
+        self.panel.visible = False
+        self.job = None
+        self.page.update()
+
+    def _cancelar(self, e=None) -> None:
+        if self.job:
+            self.job.cancelar()
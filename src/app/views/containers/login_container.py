@@ -1,5 +1,6 @@
 import flet as ft
 from app.models.user_model import UserModel
+from app.core.model_registry import get_model
 from app.core.enums.e_user_model import E_USER
 from app.core.app_state import AppState
 
@@ -16,7 +17,7 @@ class LoginContainer(ft.Container):
         self.page = None
 
         # configuramos las respectivas Models
-        self.user_model = UserModel()
+        self.user_model = get_model(UserModel)
 
         # Campos de texto para usuario y contraseña
         self.user_field = ft.TextField(
@@ -4,6 +4,7 @@ from app.core.app_state import AppState
 from app.models.discount_model import DiscountModel
 from app.models.descuento_detalles_model import DescuentoDetallesModel
 from app.models.payment_model import PaymentModel
+from app.core.model_registry import get_model
 
 class ModalDescuentos(ft.AlertDialog):
     def __init__(self, pago_data: dict, on_confirmar):
@@ -19,9 +20,9 @@ class ModalDescuentos(ft.AlertDialog):
         self.id_pago = pago_data["id_pago"]
         self.numero_nomina = pago_data["numero_nomina"]
 
-        self.discount_model = DiscountModel()
-        self.detalles_model = DescuentoDetallesModel()
-        self.payment_model = PaymentModel()
+        self.discount_model = get_model(DiscountModel)
+        self.detalles_model = get_model(DescuentoDetallesModel)
+        self.payment_model = get_model(PaymentModel)
 
         self.pagado = not self.es_pago_editable()
 
@@ -7,6 +7,7 @@ from app.models.loan_model import LoanModel
 from app.models.detalles_pagos_prestamo_model import DetallesPagosPrestamoModel
 from app.models.loan_payment_model import LoanPaymentModel
 from app.models.employes_model import EmployesModel
+from app.core.model_registry import get_model
 from app.views.containers.modal_alert import ModalAlert
 from app.core.enums.e_loan_payment_model import E_PAGOS_PRESTAMO
 
@@ -20,10 +21,10 @@ class ModalPrestamos:
         self.id_pago = pago_data["id_pago"]
         self.estado_pago = pago_data.get("estado", "pendiente")
 
-        self.loan_model = LoanModel()
-        self.pago_model = LoanPaymentModel()
-        self.detalles_model = DetallesPagosPrestamoModel()
-        self.empleado_model = EmployesModel()
+        self.loan_model = get_model(LoanModel)
+        self.pago_model = get_model(LoanPaymentModel)
+        self.detalles_model = get_model(DetallesPagosPrestamoModel)
+        self.empleado_model = get_model(EmployesModel)
         self.E = E_PAGOS_PRESTAMO
 
         empleado = self.empleado_model.get_by_numero_nomina(self.numero_nomina)
@@ -106,10 +106,28 @@ class NavBarContainer(ft.Container):
             )
         )
 
+        btn_stats = ft.GestureDetector(
+            on_tap=self._on_stats,
+            content=ft.Container(
+                bgcolor=colors["BTN_BG"],
+                padding=6,
+                border_radius=6,
+                content=ft.Row(
+                    controls=[
+                        ft.Icon(ft.icons.QUERY_STATS, size=24, color=colors["FG_COLOR"]),
+                        ft.Text("Queries", size=12, visible=expanded, color=colors["FG_COLOR"])
+                    ],
+                    alignment=ft.MainAxisAlignment.START,
+                    vertical_alignment=ft.CrossAxisAlignment.CENTER
+                )
+            )
+        )
+
         return ft.Column(
             controls=[
                 btn_return,
-                btn_database
+                btn_database,
+                btn_stats
             ],
             spacing=10
         )
@@ -132,4 +150,7 @@ class NavBarContainer(ft.Container):
         self.page.go("/home")
 
     def _on_database(self, e):
-        self.page.go("/settings/db")
\ No newline at end of file
+        self.page.go("/settings/db")
+
+    def _on_stats(self, e):
+        self.page.go("/settings/stats")
\ No newline at end of file
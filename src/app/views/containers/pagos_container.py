@@ -3,6 +3,7 @@ from decimal import Decimal
 import flet as ft
 
 from app.core.app_state import AppState
+from app.core.interfaces.query_stats import medir_accion
 from app.models.payment_model import PaymentModel
 from app.models.discount_model import DiscountModel
 from app.models.assistance_model import AssistanceModel
@@ -10,6 +11,8 @@ from app.models.loan_model import LoanModel
 from app.models.loan_payment_model import LoanPaymentModel
 from app.models.descuento_detalles_model import DescuentoDetallesModel
 from app.models.detalles_pagos_prestamo_model import DetallesPagosPrestamoModel
+from app.core.model_registry import get_model
+from app.core.reference_cache import ReferenceCache
 from app.views.containers.modal_alert import ModalAlert
 from app.views.containers.date_modal_selector import DateModalSelector
 from app.views.containers.modal_descuentos import ModalDescuentos
@@ -26,14 +29,13 @@ class PagosContainer(ft.Container):
         self.page = AppState().page
 
         # modelos principales
-        self.payment_model = PaymentModel()
-        self.payment_model.crear_sp_horas_trabajadas_para_pagos()
-        self.discount_model = DiscountModel()
-        self.assistance_model = AssistanceModel()
-        self.loan_model = LoanModel()
-        self.loan_payment_model = LoanPaymentModel()
-        self.detalles_model = DescuentoDetallesModel()
-        self.detalles_prestamo_model = DetallesPagosPrestamoModel()  # ✅ Nuevo: para préstamos pendientes
+        self.payment_model = get_model(PaymentModel)
+        self.discount_model = get_model(DiscountModel)
+        self.assistance_model = get_model(AssistanceModel)
+        self.loan_model = get_model(LoanModel)
+        self.loan_payment_model = get_model(LoanPaymentModel)
+        self.detalles_model = get_model(DescuentoDetallesModel)
+        self.detalles_prestamo_model = get_model(DetallesPagosPrestamoModel)  # ✅ Nuevo: para préstamos pendientes
 
         # rangos de fechas
         self.fecha_inicio_id = None
@@ -133,7 +135,7 @@ class PagosContainer(ft.Container):
 
 
     def _abrir_modal_fecha_periodo(self, e):
-        fechas_bloqueadas = self.payment_model.get_fechas_utilizadas()
+        fechas_bloqueadas = ReferenceCache().get("fechas_pago_utilizadas", [])
         fechas_bloqueadas = [
             datetime.strptime(f, "%Y-%m-%d").date() if isinstance(f, str) else f
             for f in fechas_bloqueadas
@@ -149,8 +151,8 @@ class PagosContainer(ft.Container):
         inicio = self._parse_fecha(inicio)
         fin = self._parse_fecha(fin)
 
-        min_fecha = self.assistance_model.get_fecha_minima_asistencia()
-        max_fecha = self.assistance_model.get_fecha_maxima_asistencia()
+        min_fecha = ReferenceCache().get("fecha_minima_asistencia")
+        max_fecha = ReferenceCache().get("fecha_maxima_asistencia")
         if not min_fecha or not max_fecha:
             ModalAlert.mostrar_info("Error de datos", "No se pudo obtener el rango válido de asistencias.")
             return
@@ -183,6 +185,7 @@ class PagosContainer(ft.Container):
 
 
     # ------------------------------------------------------------------ tabla
+    @medir_accion("PagosContainer._cargar_pagos")
     def _cargar_pagos(self):
         try:
             self.tabla_pagos.columns = [
@@ -215,6 +218,7 @@ class PagosContainer(ft.Container):
             )
 
             pagos = self.payment_model.db.get_data_list(query, dictionary=True)
+            prestamos_activos = ReferenceCache().get("prestamos_activos", {})
 
             if not pagos:
                 self.tabla_pagos.rows.append(ft.DataRow(cells=[ft.DataCell(ft.Text("-")) for _ in range(15)]))
@@ -258,7 +262,7 @@ class PagosContainer(ft.Container):
                         )
                     )
 
-                    prestamo_activo = self.loan_model.get_prestamo_activo_por_empleado(numero_nomina)
+                    prestamo_activo = prestamos_activos.get(numero_nomina)
                     boton_prestamo = ft.IconButton(
                         icon=ft.icons.EDIT_NOTE,
                         tooltip="Editar préstamos" if prestamo_activo else "Sin préstamo activo",
@@ -492,8 +496,8 @@ class PagosContainer(ft.Container):
         inicio = self._parse_fecha(inicio)
         fin = self._parse_fecha(fin)
 
-        min_fecha = self.assistance_model.get_fecha_minima_asistencia()
-        max_fecha = self.assistance_model.get_fecha_maxima_asistencia()
+        min_fecha = ReferenceCache().get("fecha_minima_asistencia")
+        max_fecha = ReferenceCache().get("fecha_maxima_asistencia")
         if not min_fecha or not max_fecha:
             ModalAlert.mostrar_info("Error de datos", "No se pudo obtener el rango válido de asistencias.")
             return
@@ -7,19 +7,22 @@ from app.core.app_state import AppState
 from app.views.containers.modal_alert import ModalAlert
 from app.models.loan_model import LoanModel
 from app.models.loan_payment_model import LoanPaymentModel
+from app.core.model_registry import get_model
 from app.core.enums.e_loan_payment_model import E_PAGOS_PRESTAMO
 from app.core.enums.e_prestamos_model import E_PRESTAMOS
-import pandas as pd
+from app.helpers.lazy_import import lazy_import
 from app.core.invokers.file_open_invoker import FileOpenInvoker
 from app.core.invokers.file_save_invoker import FileSaveInvoker
 
+pd = lazy_import("pandas")
+
 
 class PagosPrestamoContainer(ft.Container):
     def __init__(self):
         super().__init__(expand=True, padding=20)
         self.page = AppState().page
-        self.pago_model = LoanPaymentModel()
-        self.prestamo_model = LoanModel()
+        self.pago_model = get_model(LoanPaymentModel)
+        self.prestamo_model = get_model(LoanModel)
         self.E = E_PAGOS_PRESTAMO
         self.P = E_PRESTAMOS
         self.tabla_pagos = ft.DataTable(columns=[], rows=[], expand=True)
@@ -171,7 +174,6 @@ class PagosPrestamoContainer(ft.Container):
 
     def _crear_fila_nueva(self, monto_total, saldo_actual):
         hoy = datetime.today().strftime("%Y-%m-%d")
-        nuevo_id = str(self.pago_model.get_next_id())
 
         interes_selector = ft.Dropdown(
             label="Interés %",
@@ -287,7 +289,7 @@ class PagosPrestamoContainer(ft.Container):
             self.page.update()
 
         return ft.DataRow(cells=[
-            ft.DataCell(ft.Text(nuevo_id)),
+            ft.DataCell(ft.Text("Auto")),
             ft.DataCell(ft.Text(hoy)),
             ft.DataCell(ft.Text(hoy)),
             ft.DataCell(monto_input),
@@ -1,25 +1,28 @@
 import flet as ft
 from datetime import datetime
 import os
-import pandas as pd
+from app.helpers.lazy_import import lazy_import
 from urllib.parse import urlencode
 from app.core.app_state import AppState
 from app.models.loan_model import LoanModel
 from app.models.payment_model import PaymentModel
 from app.models.descuento_detalles_model import DescuentoDetallesModel
+from app.core.model_registry import get_model
 from app.views.containers.modal_alert import ModalAlert
 from app.core.enums.e_prestamos_model import E_PRESTAMOS
 from app.core.invokers.file_open_invoker import FileOpenInvoker
 from app.core.invokers.file_save_invoker import FileSaveInvoker
 
+pd = lazy_import("pandas")
+
 
 class PrestamosContainer(ft.Container):
     def __init__(self):
         super().__init__(expand=True, padding=20)
         self.page = AppState().page
-        self.loan_model = LoanModel()
-        self.payment_model = PaymentModel()
-        self.detalles_model = DescuentoDetallesModel()
+        self.loan_model = get_model(LoanModel)
+        self.payment_model = get_model(PaymentModel)
+        self.detalles_model = get_model(DescuentoDetallesModel)
         self.E = E_PRESTAMOS
         self.tabla_prestamos = ft.DataTable(columns=[], rows=[], expand=True)
 
@@ -218,7 +221,6 @@ class PrestamosContainer(ft.Container):
         monto_textfield = ft.TextField(hint_text="Monto", expand=True)
 
         hoy = datetime.today().strftime("%Y-%m-%d")
-        nuevo_id = self.loan_model.get_next_id_prestamo() or "?"
 
         def validar_id_empleado(e=None):
             val = numero_input.value.strip()
@@ -292,7 +294,7 @@ class PrestamosContainer(ft.Container):
             )
 
             if resultado["status"] == "success":
-                ModalAlert.mostrar_info("Éxito", "Préstamo agregado correctamente.")
+                ModalAlert.mostrar_info("Éxito", f"Préstamo {resultado['id']} agregado correctamente.")
                 self._actualizar_vista_prestamos()
             else:
                 ModalAlert.mostrar_info("Error", resultado["message"])
@@ -302,7 +304,7 @@ class PrestamosContainer(ft.Container):
             self._actualizar_vista_prestamos()
 
         self.tabla_prestamos.rows.append(ft.DataRow(cells=[
-            ft.DataCell(ft.Text(str(nuevo_id))),             # ID Préstamo
+            ft.DataCell(ft.Text("Auto")),                    # ID Préstamo
             ft.DataCell(numero_input),                       # ID Empleado
             ft.DataCell(monto_textfield),                    # Monto
             ft.DataCell(ft.Text("Auto")),                    # Saldo actual
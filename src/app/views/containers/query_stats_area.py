@@ -0,0 +1,187 @@
+# app/views/containers/query_stats_area.py
+
+import flet as ft
+from flet import FilePicker, FilePickerResultEvent
+from app.core.interfaces.database import get_database
+from app.core.interfaces.index_advisor import IndexAdvisor
+from app.views.containers.messages import mostrar_mensaje
+
+
+class QueryStatsArea(ft.Container):
+    """
+    Panel de diagnóstico: latencia por tipo de query, consultas por acción (N+1),
+    consultas lentas, estado del pool de conexiones y recorridos completos (EXPLAIN).
+    """
+    MAX_FILAS = 25
+
+    def __init__(self, page: ft.Page):
+        super().__init__(expand=True, padding=20)
+        self.page = page
+        self.db = get_database()
+
+        self.save_picker = FilePicker(on_result=self._on_save_result)
+        if self.page and self.save_picker not in self.page.overlay:
+            self.page.overlay.append(self.save_picker)
+
+        self.resumen_pool = ft.Text(size=14)
+        self.resumen_cache = ft.Text(size=14)
+        self.tabla_queries = ft.DataTable(columns=[], rows=[])
+        self.tabla_acciones = ft.DataTable(columns=[], rows=[])
+        self.lista_lentas = ft.Column(spacing=4)
+        self.lista_indices = ft.Column(spacing=4)
+
+        self._build_ui()
+        self._refrescar()
+
+    def _build_ui(self):
+        self.content = ft.Column(
+            scroll=ft.ScrollMode.AUTO,
+            spacing=16,
+            controls=[
+                ft.Text("Estadísticas de Queries", size=24, weight="bold"),
+                ft.Row(
+                    controls=[
+                        ft.ElevatedButton("Actualizar", icon=ft.icons.REFRESH, on_click=lambda _: self._refrescar()),
+                        ft.OutlinedButton("Reiniciar", icon=ft.icons.RESTART_ALT, on_click=self._on_reset),
+                        ft.OutlinedButton("Exportar JSON", icon=ft.icons.SAVE_ALT, on_click=self._on_export),
+                        ft.OutlinedButton("Analizar índices", icon=ft.icons.MANAGE_SEARCH, on_click=self._on_analizar_indices)
+                    ],
+                    spacing=10
+                ),
+                self.resumen_pool,
+                self.resumen_cache,
+                ft.Divider(height=10),
+                ft.Text("Consultas por acción", size=18, weight="bold"),
+                self.tabla_acciones,
+                ft.Divider(height=10),
+                ft.Text("Queries más costosas", size=18, weight="bold"),
+                self.tabla_queries,
+                ft.Divider(height=10),
+                ft.Text("Queries lentas recientes", size=18, weight="bold"),
+                self.lista_lentas,
+                ft.Divider(height=10),
+                ft.Text("Recorridos completos de tabla (EXPLAIN)", size=18, weight="bold"),
+                self.lista_indices
+            ]
+        )
+
+    def _refrescar(self):
+        stats = self.db.get_query_stats()
+        pool = stats.get("pool", {})
+
+        self.resumen_pool.value = (
+            f"Conexión: {self.db.estado} · "
+            f"Pool: {pool.get('active', 0)} activas / {pool.get('created', 0)} abiertas "
+            f"(máx. {pool.get('size', 0)}) · préstamos: {pool.get('checkouts', 0)} · "
+            f"esperas: {pool.get('waits', 0)} ({pool.get('wait_time', 0)} s) · "
+            f"reconexiones: {pool.get('stale', 0)} · "
+            f"desde: {stats.get('since')}"
+        )
+
+        cache = stats.get("cache", {})
+        self.resumen_cache.value = (
+            f"Caché: {cache.get('size', 0)}/{cache.get('max_entries', 0)} entradas · "
+            f"aciertos: {cache.get('hits', 0)} · fallos: {cache.get('misses', 0)} "
+            f"({cache.get('hit_rate', 0):.0%}) · invalidadas: {cache.get('invalidations', 0)} · "
+            f"expiradas: {cache.get('expired', 0)}"
+        )
+
+        self.tabla_acciones.columns = [
+            ft.DataColumn(ft.Text("Acción")),
+            ft.DataColumn(ft.Text("Llamadas"), numeric=True),
+            ft.DataColumn(ft.Text("Queries/llamada"), numeric=True),
+            ft.DataColumn(ft.Text("Última"), numeric=True),
+            ft.DataColumn(ft.Text("Tiempo total (ms)"), numeric=True),
+            ft.DataColumn(ft.Text("Posible N+1")),
+        ]
+        self.tabla_acciones.rows = [
+            ft.DataRow(cells=[
+                ft.DataCell(ft.Text(a["action"])),
+                ft.DataCell(ft.Text(str(a["calls"]))),
+                ft.DataCell(ft.Text(str(a["avg_queries"]))),
+                ft.DataCell(ft.Text(str(a["last_queries"]))),
+                ft.DataCell(ft.Text(f"{a['total_ms']:.1f}")),
+                ft.DataCell(ft.Text(
+                    "⚠️ " + str(max(a["n_plus_one"].values())) + "x" if a["n_plus_one"] else "-",
+                    tooltip="\n".join(a["n_plus_one"].keys()) or None
+                )),
+            ])
+            for a in stats["actions"][:self.MAX_FILAS]
+        ]
+
+        self.tabla_queries.columns = [
+            ft.DataColumn(ft.Text("Query")),
+            ft.DataColumn(ft.Text("Veces"), numeric=True),
+            ft.DataColumn(ft.Text("Prom. (ms)"), numeric=True),
+            ft.DataColumn(ft.Text("Máx. (ms)"), numeric=True),
+            ft.DataColumn(ft.Text("Total (ms)"), numeric=True),
+            ft.DataColumn(ft.Text("Filas"), numeric=True),
+            ft.DataColumn(ft.Text("Errores"), numeric=True),
+            ft.DataColumn(ft.Text("Preparada (aciertos)"), numeric=True),
+        ]
+        self.tabla_queries.rows = [
+            ft.DataRow(cells=[
+                ft.DataCell(ft.Text(q["fingerprint"][:90], tooltip=q["fingerprint"], width=480)),
+                ft.DataCell(ft.Text(str(q["count"]))),
+                ft.DataCell(ft.Text(f"{q['avg_ms']:.2f}")),
+                ft.DataCell(ft.Text(f"{q['max_ms']:.2f}")),
+                ft.DataCell(ft.Text(f"{q['total_ms']:.1f}")),
+                ft.DataCell(ft.Text(str(q["rows"]))),
+                ft.DataCell(ft.Text(str(q["errors"]))),
+                ft.DataCell(ft.Text(self._tasa_preparadas(q))),
+            ])
+            for q in stats["queries"][:self.MAX_FILAS]
+        ]
+
+        self.lista_lentas.controls = [
+            ft.Text(f"{s['at']} · {s['ms']} ms · {s['rows']} filas · {s['fingerprint'][:120]}", size=12)
+            for s in reversed(stats["slow"][-self.MAX_FILAS:])
+        ] or [ft.Text(f"Sin queries por encima de {stats['slow_threshold_ms']} ms.", color=ft.colors.GREY)]
+
+        if self.page:
+            self.page.update()
+
+    @staticmethod
+    def _tasa_preparadas(q: dict) -> str:
+        hits = q.get("prepared_hits", 0)
+        total = hits + q.get("prepared_misses", 0)
+        return f"{hits / total:.0%}" if total else "-"
+
+    def _on_reset(self, e):
+        self.db.stats.reset()
+        self.db.cache.clear()
+        self._refrescar()
+
+    def _on_analizar_indices(self, e):
+        resultados = IndexAdvisor(self.db).analizar()
+        controles = []
+        for r in resultados:
+            if r["error"]:
+                controles.append(ft.Text(f"⚠️ {r['fingerprint'][:120]} · {r['error']}", size=12))
+            elif r["full_scans"]:
+                plan = "\n".join(
+                    f"{p['tabla']}: {p['acceso']} · índice {p['indice'] or '-'} · {p['detalle']}" for p in r["plan"]
+                )
+                controles.append(ft.Text(
+                    f"❌ {', '.join(r['full_scans'])} · {r['fingerprint'][:120]}", size=12, tooltip=plan
+                ))
+        self.lista_indices.controls = controles or [
+            ft.Text(f"Sin recorridos completos en {len(resultados)} consultas analizadas.", color=ft.colors.GREY)
+        ]
+        if self.page:
+            self.page.update()
+
+    def _on_export(self, e):
+        self.save_picker.save_file(
+            dialog_title="Exportar estadísticas de queries",
+            file_name="query_stats.json",
+            allowed_extensions=["json"]
+        )
+
+    def _on_save_result(self, e: FilePickerResultEvent):
+        if not e.path:
+            return
+        if self.db.dump_query_stats(e.path):
+            mostrar_mensaje(self.page, "✅ Exportación completa", f"Estadísticas guardadas en:\n{e.path}")
+        else:
+            mostrar_mensaje(self.page, "⚠️ Error", "No se pudieron exportar las estadísticas.")
@@ -1,20 +1,23 @@
 import flet as ft
-import pandas as pd
+from app.helpers.lazy_import import lazy_import
 from datetime import datetime
 from app.core.app_state import AppState
 from app.models.user_model import UserModel
+from app.core.model_registry import get_model
 from app.core.invokers.file_save_invoker import FileSaveInvoker
 from app.core.invokers.file_open_invoker import FileOpenInvoker
 from app.views.containers.messages import mostrar_mensaje
 from app.views.containers.modal_alert import ModalAlert
 
+pd = lazy_import("pandas")
+
 class UsuariosContainer(ft.Container):
     def __init__(self):
         super().__init__()
 
         self.expand = True
         self.page = AppState().page
-        self.user_model = UserModel()
+        self.user_model = get_model(UserModel)
 
         user_data = self.page.client_storage.get("app.user")
         if not user_data or user_data.get("role") != "root":
@@ -297,7 +300,6 @@ class UsuariosContainer(ft.Container):
 
     def _agregar_usuario(self, e):
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        id_nuevo = self.user_model.get_last_id() + 1
         username_field = ft.TextField(hint_text="Usuario")
         password_field = ft.TextField(hint_text="Contraseña", password=True)
         role_dropdown = ft.Dropdown(options=[ft.dropdown.Option("user"), ft.dropdown.Option("root")])
@@ -319,7 +321,7 @@ class UsuariosContainer(ft.Container):
             self._recargar_tabla()
 
         row = ft.DataRow(cells=[
-            ft.DataCell(ft.Text(str(id_nuevo))),
+            ft.DataCell(ft.Text("Auto")),
             ft.DataCell(ft.CircleAvatar(content=ft.Text("?", size=14))),
             ft.DataCell(username_field),
             ft.DataCell(role_dropdown),
@@ -1,6 +1,7 @@
 import flet as ft
 from app.views.containers.navbar_container import NavBarContainer
 from app.views.containers.database_settings_area import DatabaseSettingsArea
+from app.views.containers.query_stats_area import QueryStatsArea
 
 class SettingsView(ft.View):
     def __init__(self, page: ft.Page):  # ← Recibe el page
@@ -27,6 +28,8 @@ class SettingsView(ft.View):
 
         if section in ["settings", "db"]:
             self.content_area.content = DatabaseSettingsArea(self.page)  # ← Pasa el page correctamente
+        elif section == "stats":
+            self.content_area.content = QueryStatsArea(self.page)
         else:
             self.content_area.content = ft.Text(f"Settings sección: {section}", size=20)
     
\ No newline at end of file
@@ -1,6 +1,8 @@
 import flet as ft
 from typing import Any
+from app.config.config import REFERENCE_PRELOAD
 from app.core.app_state import AppState
+from app.core.reference_cache import ReferenceCache
 from app.views.login_view import LoginView
 from app.views.home_view import HomeView
 from app.views.settings_view import SettingsView
@@ -31,6 +33,10 @@ class WindowMain:
         state = AppState()
         state.set_page(self._page)  # Aquí actualiza dimensiones y modo
 
+        # Mientras se muestra el login, cargar en segundo plano los datos de referencia
+        if REFERENCE_PRELOAD:
+            ReferenceCache().precargar()
+
         # Instancias únicas de vistas principales
         self.home_view = HomeView()
         self.settings_view = SettingsView(self._page)
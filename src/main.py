@@ -1,36 +1,16 @@
+import multiprocessing
 import flet as ft
 from app.views.window_main_view import window_main
 from app.core.app_state import AppState
-
-# Importar todos los modelos
-from app.models.employes_model import EmployesModel
-from app.models.user_model import UserModel
-from app.models.assistance_model import AssistanceModel
-from app.models.loan_model import LoanModel
-from app.models.loan_payment_model import LoanPaymentModel
-from app.models.discount_model import DiscountModel
-from app.models.payment_model import PaymentModel
-from app.models.performance_model import PerformanceModel
-from app.models.weekly_report_model import WeeklyReportModel
+from app.core.migrations.runner import run_migrations
 
 
 def iniciar_aplicacion():
     """
-    Método central que inicializa la base de datos
-    creando todas las tablas requeridas desde sus modelos.
+    Método central que prepara la base de datos aplicando las migraciones
+    pendientes del esquema (tablas, triggers, procedimientos) y lanza la interfaz.
     """
-    # Tablas base (no dependen de otras)
-    EmployesModel()     # empleados
-    UserModel()         # usuarios_app
-
-    # Tablas que dependen de empleados
-    AssistanceModel()   # asistencias → empleados
-    LoanModel()         # prestamos → empleados
-    PaymentModel()      # pagos → empleados ✅ debe ir antes de descuentos
-    DiscountModel()     # descuentos → empleados, pagos
-    LoanPaymentModel()  # pagos_prestamo → prestamos
-    PerformanceModel()  # desempeno → empleados
-    WeeklyReportModel() # reportes_semanales → empleados
+    run_migrations()
 
     # Lanza la interfaz principal de la app
     ft.app(target=window_main, assets_dir="assets")
@@ -38,4 +18,6 @@ def iniciar_aplicacion():
 
 
 if __name__ == "__main__":
+    # Necesario para el pool de procesos de la importación en el ejecutable empaquetado
+    multiprocessing.freeze_support()
     iniciar_aplicacion()
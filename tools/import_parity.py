@@ -0,0 +1,139 @@
+"""
+Paridad de formatos de importación: escribe el mismo reporte de checador en las formas
+de archivo que se reciben (xlsx, CSV con coma y BOM, CSV con punto y coma en Latin-1 con
+líneas de título arriba del encabezado, CSV con tabuladores) y verifica que cada una
+produzca exactamente las mismas asistencias válidas y rechazadas.
+
+Uso (desde la raíz del repositorio):
+
+    python tools/import_parity.py
+    python tools/import_parity.py --filas 50000
+
+No usa la base de datos: lee cada archivo con `leer_archivo_por_bloques` y lo procesa con
+`AsistenciasImportController._procesar_asistencias`, igual que la importación.
+Sale con código 1 si algún formato difiere o no se puede leer.
+"""
+import argparse
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import openpyxl  # noqa: E402
+import pandas as pd  # noqa: E402
+from app.controllers.asistencias_import_controller import AsistenciasImportController  # noqa: E402
+from app.helpers.excel_reader import leer_archivo_por_bloques  # noqa: E402
+
+COLUMNAS = ["ID Checador", "Nombre", "Fecha", "Entrada", "Salida"]
+TITULOS = ["Reporte de asistencia", "Sucursal Peñón, turno matutino", "Periodo: 01/01/2024 - 31/01/2024"]
+CASOS_LIMITE = [
+    ["1", "Límite", "01/01/2024", "", ""],
+    ["2", "Límite", "01/01/2024", "8:05", "17:30:00"],
+    ["abc", "Límite", "01/01/2024", "08:00:00", "17:00:00"],
+    ["3", "Límite", "31/02/2024", "08:00:00", "17:00:00"],
+    ["4", "Límite", "02/01/2024", "25:99", "17:00:00"],
+    ["5", "Coma, en nombre", "03/01/2024", "23:45:00", "07:15:00"],
+]
+
+
+def generar_reporte(filas: int, semilla: int) -> "pd.DataFrame":
+    """Casos límite más `filas` asistencias al azar, todo como texto (como lo exporta el checador)."""
+    azar = random.Random(semilla)
+    datos = list(CASOS_LIMITE)
+    for _ in range(filas):
+        datos.append([
+            str(azar.randrange(1, 300)),
+            f"Empleado {azar.randrange(1000)}",
+            f"{azar.randrange(1, 29):02d}/{azar.randrange(1, 13):02d}/2024",
+            f"{azar.randrange(6, 11):02d}:{azar.randrange(60):02d}:00",
+            f"{azar.randrange(14, 20):02d}:{azar.randrange(60):02d}:00",
+        ])
+    return pd.DataFrame(datos, columns=COLUMNAS)
+
+
+def escribir_formas(reporte: "pd.DataFrame", carpeta: Path) -> dict:
+    """Escribe el reporte en cada forma de archivo; devuelve {descripción: ruta}."""
+    formas = {}
+
+    ruta = carpeta / "reporte.xlsx"
+    libro = openpyxl.Workbook(write_only=True)
+    hoja = libro.create_sheet()
+    for titulo in TITULOS:
+        hoja.append([titulo])
+    hoja.append([])
+    hoja.append(COLUMNAS)
+    for fila in reporte.itertuples(index=False, name=None):
+        hoja.append([v or None for v in fila])
+    libro.save(ruta)
+    formas["xlsx con títulos"] = ruta
+
+    ruta = carpeta / "coma_bom.csv"
+    reporte.to_csv(ruta, index=False, encoding="utf-8-sig")
+    formas["csv coma UTF-8 con BOM"] = ruta
+
+    ruta = carpeta / "punto_y_coma_titulos.csv"
+    with open(ruta, "w", encoding="latin-1", newline="") as f:
+        f.write("\n".join(TITULOS) + "\n\n")
+        reporte.to_csv(f, sep=";", index=False)
+    formas["csv punto y coma Latin-1 con títulos"] = ruta
+
+    ruta = carpeta / "tabuladores.txt"
+    reporte.to_csv(ruta, sep="\t", index=False)
+    formas["txt con tabuladores"] = ruta
+    return formas
+
+
+def procesar(path: Path) -> tuple:
+    """Mismo recorrido que la importación: bloques → validación por columnas."""
+    validas, rechazadas = [], []
+    for bloque in leer_archivo_por_bloques(str(path), encabezado="ID Checador",
+                                           tipos=AsistenciasImportController.TIPOS_CSV):
+        AsistenciasImportController._validar_columnas(bloque)
+        v, r = AsistenciasImportController._procesar_asistencias(bloque)
+        validas.append(v)
+        rechazadas.append(r[["fila", "motivo"]])
+    return pd.concat(validas, ignore_index=True), pd.concat(rechazadas, ignore_index=True)
+
+
+def _normalizar(df: "pd.DataFrame") -> "pd.DataFrame":
+    return df.astype(object).where(df.notna(), None).reset_index(drop=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compara la importación de asistencias entre formatos de archivo.")
+    parser.add_argument("--filas", type=int, default=12000, help="asistencias aleatorias además de los casos límite")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    reporte = generar_reporte(args.filas, args.semilla)
+    esperado_validas, esperado_rechazadas = AsistenciasImportController._procesar_asistencias(
+        reporte.replace("", None)
+    )
+    esperado_validas = _normalizar(esperado_validas)
+    esperado_rechazadas = _normalizar(esperado_rechazadas[["fila", "motivo"]])
+    print(f"🔎 {len(reporte)} filas: {len(esperado_validas)} válidas, {len(esperado_rechazadas)} rechazadas")
+
+    fallas = 0
+    with tempfile.TemporaryDirectory() as carpeta:
+        for descripcion, ruta in escribir_formas(reporte, Path(carpeta)).items():
+            try:
+                validas, rechazadas = procesar(ruta)
+            except Exception as e:
+                print(f"❌ {descripcion}: {e}")
+                fallas += 1
+                continue
+            if _normalizar(validas).equals(esperado_validas) and _normalizar(rechazadas).equals(esperado_rechazadas):
+                print(f"✅ {descripcion}: coincide")
+                continue
+            fallas += 1
+            print(f"❌ {descripcion}: {len(validas)} válidas y {len(rechazadas)} rechazadas")
+            distintas = pd.concat([_normalizar(validas), esperado_validas]).drop_duplicates(keep=False)
+            print(distintas.head(20).to_string())
+
+    return 1 if fallas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
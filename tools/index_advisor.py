@@ -0,0 +1,110 @@
+"""
+Revisión de índices: ejecuta las consultas de lectura de los modelos contra la base
+de datos configurada (.env) y muestra el plan de EXPLAIN de las que recorren tablas
+completas.
+
+Uso (desde la raíz del repositorio):
+
+    python tools/index_advisor.py
+    python tools/index_advisor.py --todas      # muestra también los planes sin problemas
+
+Los argumentos de cada consulta se toman de registros existentes (primer empleado,
+pago, préstamo y asistencia), de modo que los planes reflejan datos reales.
+Sale con código 1 si alguna consulta recorre una tabla completa.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from app.core.interfaces.database import get_database  # noqa: E402
+from app.core.interfaces.index_advisor import IndexAdvisor  # noqa: E402
+from app.core.model_registry import get_model  # noqa: E402
+from app.models.assistance_model import AssistanceModel  # noqa: E402
+from app.models.discount_model import DiscountModel  # noqa: E402
+from app.models.employes_model import EmployesModel  # noqa: E402
+from app.models.loan_model import LoanModel  # noqa: E402
+from app.models.loan_payment_model import LoanPaymentModel  # noqa: E402
+from app.models.payment_model import PaymentModel  # noqa: E402
+from app.models.detalles_pagos_prestamo_model import DetallesPagosPrestamoModel  # noqa: E402
+
+
+def _muestra(db, query: str, default):
+    fila = db.get_data(query, dictionary=True) or {}
+    valor = next(iter(fila.values()), None)
+    return default if valor is None else valor
+
+
+def ejercitar_modelos(db) -> None:
+    """Llama a los métodos de lectura de los modelos para registrar una muestra de cada consulta."""
+    nomina = _muestra(db, "SELECT MIN(numero_nomina) AS v FROM empleados", 1)
+    fecha = str(_muestra(db, "SELECT MIN(fecha) AS v FROM asistencias", "2025-01-01"))
+    fecha_fin = str(_muestra(db, "SELECT MAX(fecha) AS v FROM asistencias", fecha))
+    id_pago = _muestra(db, "SELECT MIN(id_pago) AS v FROM pagos", 1)
+    id_prestamo = _muestra(db, "SELECT MIN(id_prestamo) AS v FROM prestamos", 1)
+
+    empleados = get_model(EmployesModel)
+    asistencias = get_model(AssistanceModel)
+    pagos = get_model(PaymentModel)
+    descuentos = get_model(DiscountModel)
+    prestamos = get_model(LoanModel)
+    abonos = get_model(LoanPaymentModel)
+    detalles = get_model(DetallesPagosPrestamoModel)
+
+    llamadas = [
+        lambda: empleados.get_by_numero_nomina(nomina),
+        lambda: asistencias.get_by_empleado_fecha(nomina, fecha),
+        lambda: asistencias.get_fecha_minima_asistencia(),
+        lambda: asistencias.get_fecha_maxima_asistencia(),
+        lambda: pagos.get_total_horas_trabajadas(fecha, fecha_fin, nomina),
+        lambda: pagos.get_total_horas_trabajadas(fecha, fecha_fin),
+        lambda: pagos.existe_pago_para_fecha(nomina, fecha),
+        lambda: pagos.existe_pago_para_fecha(nomina, fecha, incluir_pendientes=True),
+        lambda: pagos.get_pago_id_por_empleado_y_estado(nomina, "pendiente"),
+        lambda: pagos.get_pagos_por_rango(fecha, fecha_fin),
+        lambda: descuentos.get_descuentos_por_pago(id_pago),
+        lambda: descuentos.get_total_descuentos_por_pago(id_pago),
+        lambda: prestamos.get_prestamo_activo_por_empleado(nomina),
+        lambda: prestamos.get_prestamos_por_empleado(nomina),
+        lambda: prestamos.get_total_prestamos_por_empleado(nomina, fecha),
+        lambda: abonos.get_by_prestamo(id_prestamo),
+        lambda: abonos.get_total_prestamos_por_pago(id_pago),
+        lambda: abonos.get_total_pagado_por_pago(id_pago),
+        lambda: abonos.get_total_pagado_por_prestamo(id_prestamo),
+        lambda: abonos.existe_pago_pendiente_para_pago_nomina(id_pago, id_prestamo),
+        lambda: detalles.get_todos_por_pago(id_pago),
+    ]
+    for llamada in llamadas:
+        try:
+            llamada()
+        except Exception as e:
+            print(f"⚠️ {e}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="EXPLAIN de las consultas de los modelos.")
+    parser.add_argument("--todas", action="store_true", help="mostrar el plan de todas las consultas")
+    args = parser.parse_args()
+
+    db = get_database()
+    ejercitar_modelos(db)
+
+    advisor = IndexAdvisor(db)
+    resultados = advisor.analizar()
+    print()
+    print(advisor.reporte(resultados))
+
+    if args.todas:
+        for r in resultados:
+            if r["full_scans"] or r["error"]:
+                continue
+            print(f"\n✔️ {r['fingerprint'][:120]}")
+            for p in r["plan"]:
+                print(f"    {p['tabla']}: acceso={p['acceso']} índice={p['indice'] or '-'} {p['detalle']}")
+
+    return 1 if any(r["full_scans"] for r in resultados) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""
+Benchmark de arranque de la aplicación.
+
+Mide, en procesos nuevos (sin cachés de importación en memoria):
+  1. Desglose de tiempo de importación por paquete (`python -X importtime -c "import main"`).
+  2. Etapas del arranque: importar flet, importar `main`, aplicar migraciones
+     y tiempo hasta el primer frame de `window_main` (con `--ventana`, abre la
+     ventana real y la cierra en cuanto se pinta la primera vista).
+
+Uso (desde la raíz del repositorio):
+
+    python tools/startup_benchmark.py
+    python tools/startup_benchmark.py --repeticiones 5 --ventana --json startup.json
+    python tools/startup_benchmark.py --max-import-ms 1500   # falla si se supera
+
+Compara el JSON entre versiones para detectar regresiones.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+# Código del proceso hijo: marca el tiempo de cada etapa y lo imprime como JSON
+_ETAPAS = r"""
+import json, sys, time
+t0 = time.perf_counter()
+marcas = {}
+import flet as ft
+marcas["import_flet"] = time.perf_counter() - t0
+import main
+marcas["import_main"] = time.perf_counter() - t0
+from app.helpers import lazy_import
+if "--migraciones" in sys.argv:
+    from app.core.migrations.runner import run_migrations
+    run_migrations()
+    marcas["migraciones"] = time.perf_counter() - t0
+
+def _fin():
+    marcas["diferidos_cargados"] = sorted(lazy_import.tiempos_de_carga)
+    print("@@ETAPAS " + json.dumps(marcas))
+
+if "--ventana" in sys.argv:
+    from app.views.window_main_view import window_main
+    def objetivo(page):
+        window_main(page)
+        page.update()
+        marcas["primer_frame"] = time.perf_counter() - t0
+        _fin()
+        page.window.destroy()
+    ft.app(target=objetivo, assets_dir="assets")
+else:
+    _fin()
+"""
+
+
+def _ejecutar(args: list) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], cwd=SRC,
+        capture_output=True, text=True, encoding="utf-8", errors="replace"
+    )
+
+
+def medir_importaciones() -> dict:
+    """Microsegundos acumulados por paquete raíz según `-X importtime`."""
+    proc = _ejecutar(["-X", "importtime", "-c", "import main"])
+    if proc.returncode != 0:
+        raise RuntimeError(f"No se pudo importar main:\n{proc.stderr[-2000:]}")
+
+    por_paquete = defaultdict(int)
+    total = 0
+    for linea in proc.stderr.splitlines():
+        if not linea.startswith("import time:") or "|" not in linea:
+            continue
+        partes = [p.strip() for p in linea[len("import time:"):].split("|")]
+        if not partes[0].isdigit():
+            continue  # encabezado
+        propio, modulo = int(partes[0]), partes[2]
+        por_paquete[modulo.strip().split(".")[0]] += propio
+        total += propio
+    return {"total_us": total, "por_paquete": dict(por_paquete)}
+
+
+def medir_etapas(migraciones: bool, ventana: bool) -> dict:
+    args = ["-c", _ETAPAS]
+    if migraciones:
+        args.append("--migraciones")
+    if ventana:
+        args.append("--ventana")
+    proc = _ejecutar(args)
+    for linea in proc.stdout.splitlines():
+        if linea.startswith("@@ETAPAS "):
+            return json.loads(linea[len("@@ETAPAS "):])
+    raise RuntimeError(f"El proceso de arranque no reportó etapas:\n{proc.stderr[-2000:]}")
+
+
+def _mediana(valores: list) -> float:
+    return round(statistics.median(valores), 4) if valores else 0.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark de arranque (importaciones y primer frame).")
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15, help="paquetes a mostrar en el desglose")
+    parser.add_argument("--migraciones", action="store_true", help="incluir run_migrations() (requiere BD)")
+    parser.add_argument("--ventana", action="store_true", help="abrir window_main y medir el primer frame")
+    parser.add_argument("--json", help="guardar resultados en este archivo")
+    parser.add_argument("--max-import-ms", type=float, help="falla (código 1) si la importación supera este tiempo")
+    args = parser.parse_args()
+
+    importaciones = [medir_importaciones() for _ in range(args.repeticiones)]
+    etapas = [medir_etapas(args.migraciones, args.ventana) for _ in range(args.repeticiones)]
+
+    paquetes = defaultdict(list)
+    for medicion in importaciones:
+        for paquete, us in medicion["por_paquete"].items():
+            paquetes[paquete].append(us / 1000)
+    desglose = sorted(
+        ((p, _mediana(v)) for p, v in paquetes.items()), key=lambda x: x[1], reverse=True
+    )
+    total_import_ms = _mediana([m["total_us"] / 1000 for m in importaciones])
+
+    resumen_etapas = {
+        clave: _mediana([e[clave] * 1000 for e in etapas if clave in e])
+        for clave in ("import_flet", "import_main", "migraciones", "primer_frame")
+        if any(clave in e for e in etapas)
+    }
+    diferidos = etapas[-1].get("diferidos_cargados", [])
+
+    print(f"\n⏱️ Arranque (mediana de {args.repeticiones} ejecuciones)")
+    print(f"  Importación total (-X importtime): {total_import_ms:.1f} ms")
+    for clave, ms in resumen_etapas.items():
+        print(f"  {clave:<14} {ms:>9.1f} ms desde el inicio del proceso")
+    print(f"  Módulos diferidos cargados durante el arranque: {', '.join(diferidos) or 'ninguno'}")
+
+    print(f"\n📦 Paquetes más costosos de importar (top {args.top})")
+    for paquete, ms in desglose[:args.top]:
+        print(f"  {paquete:<30} {ms:>9.1f} ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "repeticiones": args.repeticiones,
+                "import_total_ms": total_import_ms,
+                "etapas_ms": resumen_etapas,
+                "diferidos_cargados": diferidos,
+                "importaciones_ms": dict(desglose),
+            }, f, indent=2, ensure_ascii=False)
+        print(f"\n✅ Resultados guardados en: {args.json}")
+
+    if args.max_import_ms is not None and total_import_ms > args.max_import_ms:
+        print(f"\n❌ Regresión: importación de {total_import_ms:.1f} ms > {args.max_import_ms:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""
+Paridad de triggers: compara el cálculo por columnas de retardo, tiempo trabajado y estado
+(`app/helpers/horas_asistencia.py`, usado por la importación masiva) con lo que calculan
+los triggers de `asistencias` en la base de datos configurada (.env).
+
+Uso (desde la raíz del repositorio):
+
+    python tools/trigger_parity.py
+    python tools/trigger_parity.py --aleatorias 20000
+
+Aplica antes las migraciones pendientes, como al iniciar la aplicación. Inserta casos límite
+(minutos 0/29/30/31/59, cruce de medianoche, horas iguales, NULL y '00:00:00') y combinaciones
+aleatorias en una transacción que se revierte al final, de modo que la base de datos no cambia.
+Sale con código 1 si algún resultado difiere o si la base de datos no se pudo usar.
+"""
+import argparse
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import pandas as pd  # noqa: E402
+from app.core.interfaces.database import get_database  # noqa: E402
+from app.core.migrations.runner import run_migrations  # noqa: E402
+from app.helpers.horas_asistencia import calcular_asistencias, horas_a_segundos, segundos_a_horas  # noqa: E402
+
+CASOS_LIMITE = [
+    None, "00:00:00", "00:00:01", "00:29:00", "00:30:00", "00:31:00",
+    "07:59:59", "08:00:00", "08:00:59", "08:29:59", "08:30:00", "08:30:59", "08:31:00", "08:59:00",
+    "12:00:00", "17:29:59", "17:30:00", "17:31:00", "23:00:00", "23:30:00", "23:31:00", "23:59:59",
+]
+
+
+class _Revertir(Exception):
+    """Sale de la transacción de prueba para deshacer las inserciones."""
+
+
+class ErrorBaseDatos(Exception):
+    """La base de datos no permitió calcular los casos con los triggers."""
+
+
+def generar_casos(aleatorias: int, semilla: int) -> "pd.DataFrame":
+    """Todas las combinaciones de casos límite más `aleatorias` pares de horas al azar."""
+    azar = random.Random(semilla)
+    pares = [(e, s) for e in CASOS_LIMITE for s in CASOS_LIMITE]
+    pares += [
+        tuple(f"{azar.randrange(24):02d}:{azar.randrange(60):02d}:{azar.randrange(60):02d}" for _ in range(2))
+        for _ in range(aleatorias)
+    ]
+    return pd.DataFrame(pares, columns=["hora_entrada", "hora_salida"])
+
+
+def calcular_en_base(db, casos: "pd.DataFrame") -> "pd.DataFrame":
+    """
+    Inserta los casos con los triggers activos y lee lo que calcularon.
+    Cada caso usa una fecha distinta para respetar la llave única (numero_nomina, fecha).
+    """
+    fechas = pd.date_range("1900-01-01", periods=len(casos), freq="D").strftime("%Y-%m-%d")
+    calculado = None
+    try:
+        with db.transaction():
+            numero_nomina = _empleado_de_prueba(db)
+            db.run_many(
+                "INSERT INTO asistencias (numero_nomina, fecha, hora_entrada, hora_salida) VALUES (%s, %s, %s, %s)",
+                zip([numero_nomina] * len(casos), fechas, casos["hora_entrada"], casos["hora_salida"]),
+                chunk_size=1000
+            )
+            filas = db.get_data_list(
+                "SELECT fecha, retardo, tiempo_trabajo, estado FROM asistencias "
+                "WHERE numero_nomina = %s AND fecha BETWEEN %s AND %s",
+                (numero_nomina, fechas[0], fechas[-1]),
+                dictionary=True
+            )
+            calculado = pd.DataFrame(filas, columns=["fecha", "retardo", "tiempo_trabajo", "estado"])
+            raise _Revertir()
+    except _Revertir:
+        pass
+
+    # get_data_list devuelve [] ante un error: sin este control, cada caso contaría como diferencia
+    if len(calculado) != len(casos):
+        raise ErrorBaseDatos(
+            f"se leyeron {len(calculado)} de {len(casos)} asistencias insertadas; revise los errores anteriores"
+        )
+
+    calculado["fecha"] = calculado["fecha"].astype(str).str[:10]
+    calculado = calculado.set_index("fecha").reindex(fechas)
+    for columna in ("retardo", "tiempo_trabajo"):
+        calculado[columna] = segundos_a_horas(horas_a_segundos(calculado[columna]))
+    return calculado.reset_index(drop=True)
+
+
+def _empleado_de_prueba(db) -> int:
+    """Número de nómina libre para las asistencias de prueba (se revierte con la transacción)."""
+    fila = db.get_data("SELECT COALESCE(MAX(numero_nomina), 0) + 1 AS n FROM empleados", dictionary=True)
+    if not fila:
+        raise ErrorBaseDatos("no se pudo leer la tabla empleados")
+    numero_nomina = int(fila["n"])
+    db.run_query(
+        "INSERT INTO empleados (numero_nomina, nombre_completo, estado, tipo_trabajador, sueldo_por_hora) "
+        "VALUES (%s, %s, %s, %s, %s)",
+        (numero_nomina, "Paridad de triggers", "inactivo", "no definido", 0)
+    )
+    return numero_nomina
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compara el cálculo por columnas con los triggers de asistencias.")
+    parser.add_argument("--aleatorias", type=int, default=5000, help="pares de horas aleatorias además de los casos límite")
+    parser.add_argument("--semilla", type=int, default=0)
+    args = parser.parse_args()
+
+    if not run_migrations():
+        print("❌ No se pudo preparar el esquema de la base de datos configurada.")
+        return 1
+
+    casos = generar_casos(args.aleatorias, args.semilla)
+    try:
+        esperado = calcular_en_base(get_database(), casos)
+    except ErrorBaseDatos as e:
+        print(f"❌ No se pudieron calcular los casos con los triggers: {e}")
+        return 1
+    obtenido = calcular_asistencias(casos["hora_entrada"], casos["hora_salida"])
+
+    columnas = ["retardo", "tiempo_trabajo", "estado"]
+    distinto = ~(
+        (obtenido[columnas] == esperado[columnas]) | (obtenido[columnas].isna() & esperado[columnas].isna())
+    ).all(axis=1)
+
+    print(f"🔎 {len(casos)} casos comparados contra los triggers de la base de datos")
+    if not distinto.any():
+        print("✅ El cálculo por columnas coincide con los triggers.")
+        return 0
+
+    diferencias = casos[distinto].join(obtenido[distinto].add_suffix("_python")).join(esperado[distinto].add_suffix("_trigger"))
+    print(f"❌ {int(distinto.sum())} diferencias:")
+    print(diferencias.head(50).to_string())
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())